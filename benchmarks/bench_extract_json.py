@@ -0,0 +1,93 @@
+"""
+Micro-benchmark for extract_json_from_text on large, noisy model responses.
+
+Compares the single-pass brace scanner against the previous regex-based
+extractor. Run from the repository root:
+
+    python benchmarks/bench_extract_json.py
+"""
+
+import json
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from owners_finder.parser import extract_json_from_text  # noqa: E402
+
+RECORD = {
+    "company_name": "Example Corp",
+    "description": "A technology company specializing in AI solutions",
+    "owners": [{"name": "John Doe", "title": "Founder", "ownership_percentage": "60%"}],
+    "management": {"ceo": {"name": "John Doe", "title": "Chief Executive Officer"}},
+    "industry": "Technology",
+    "founded_year": "2020",
+    "headquarters": "San Francisco, CA",
+}
+
+
+def legacy_extract_json_from_text(text):
+    """The regex-based extractor this benchmark compares against."""
+    try:
+        return json.loads(text.strip())
+    except json.JSONDecodeError:
+        pass
+
+    json_patterns = [
+        r"```json\s*(\{.*?\})\s*```",
+        r"```\s*(\{.*?\})\s*```",
+        r"(\{.*\})",
+    ]
+
+    for pattern in json_patterns:
+        matches = re.findall(pattern, text, re.DOTALL)
+        for match in matches:
+            try:
+                cleaned_match = match.strip()
+                last_brace = cleaned_match.rfind("}")
+                if last_brace != -1:
+                    cleaned_match = cleaned_match[: last_brace + 1]
+                return json.loads(cleaned_match)
+            except json.JSONDecodeError:
+                continue
+
+    return None
+
+
+def make_cases(scale):
+    """Build response shapes that stress the extractors."""
+    record = json.dumps(RECORD)
+    prose = "The company {see notes} was founded by a team of engineers. " * (20 * scale)
+    return {
+        "clean json": record,
+        "fenced json": f"Here is the data:\n```json\n{record}\n```\nLet me know if you need more.",
+        "long prose + json": f"{prose}\n{record}\n{prose}",
+        "stray open braces": "Options: { " * (100 * scale) + record,
+        "many fenced blocks": "```json\n{ draft } ```\n" * (20 * scale) + f"```json\n{record}\n```",
+        "unclosed fence": "```json\n" + '{ "a": 1, ' * (50 * scale) + "\n" + record,
+    }
+
+
+def run(scale, number):
+    print(f"\nscale={scale} (number={number})")
+    print(f"{'case':<22}{'chars':>9}{'legacy ms':>12}{'found':>7}{'scanner ms':>12}{'found':>7}{'speedup':>9}")
+    for name, text in make_cases(scale).items():
+        legacy = timeit.timeit(lambda: legacy_extract_json_from_text(text), number=number) / number * 1000
+        current = timeit.timeit(lambda: extract_json_from_text(text), number=number) / number * 1000
+        legacy_found = legacy_extract_json_from_text(text) == RECORD
+        current_found = extract_json_from_text(text) == RECORD
+        print(
+            f"{name:<22}{len(text):>9}{legacy:>12.3f}{str(legacy_found):>7}"
+            f"{current:>12.3f}{str(current_found):>7}{legacy / current:>8.1f}x"
+        )
+
+
+def main():
+    for scale, number in ((1, 200), (10, 20), (100, 3)):
+        run(scale, number)
+
+
+if __name__ == "__main__":
+    main()
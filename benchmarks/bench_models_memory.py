@@ -0,0 +1,87 @@
+"""
+Memory benchmark for holding many company results at once.
+
+Compares result dictionaries from create_company_info with the slotted
+Company records. Run from the repository root:
+
+    python benchmarks/bench_models_memory.py [count]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from owners_finder.models import (  # noqa: E402
+    Company,
+    create_company_info,
+    create_executive_info,
+    create_management_info,
+    create_owner,
+)
+
+
+def make_result(index):
+    """Build a typical result dictionary with two owners and a CEO."""
+    return create_company_info(
+        company_name=f"Company {index}",
+        website=f"https://company{index}.example",
+        description=f"Company {index} makes industrial equipment for the food industry.",
+        owners=[create_owner(f"Founder {index}", "Founder", "60%"), create_owner(f"Holding {index} GmbH")],
+        management=create_management_info(ceo=create_executive_info(f"Chief {index}", "CEO")),
+        industry="Manufacturing",
+        founded_year="1998",
+        headquarters="Stuttgart, Germany",
+    )
+
+
+def measure(build, count):
+    """Return the bytes allocated by build() for count results, kept alive together."""
+    tracemalloc.start()
+    results = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size
+
+
+def build_dicts(count):
+    return [make_result(index) for index in range(count)]
+
+
+def build_records(count):
+    return [Company.from_dict(make_result(index)) for index in range(count)]
+
+
+def build_strings(count):
+    """The field strings alone, which both representations must hold."""
+    strings = []
+    for index in range(count):
+        strings.extend(
+            (
+                f"Company {index}",
+                f"https://company{index}.example",
+                f"Company {index} makes industrial equipment for the food industry.",
+                f"Founder {index}",
+                f"Holding {index} GmbH",
+                f"Chief {index}",
+            )
+        )
+    return strings
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    strings = measure(build_strings, count)
+    dicts = measure(build_dicts, count)
+    records = measure(build_records, count)
+
+    print(f"{count} results")
+    print(f"  dicts:   {dicts / count:7.0f} bytes/result ({(dicts - strings) / count:.0f} excluding strings)")
+    print(f"  records: {records / count:7.0f} bytes/result ({(records - strings) / count:.0f} excluding strings)")
+    print(f"  records use {records / dicts:.0%} of the dict memory ({(records - strings) / (dicts - strings):.0%} excluding strings)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Compare the verbose and compact prompt styles against the local fake API server.
+
+For each style, runs lookups over a worker pool and reports latency per URL,
+prompt and completion tokens per lookup, answers cut off at max_tokens and
+how often the company name and owners were extracted. The fake server's
+latency grows with the token counts (--ms-per-token, --ms-per-prompt-token),
+so shorter prompts and answers show up as lower latency. Also prints the
+size and max_tokens of every prompt variant. With --fields, lookups ask for
+only some record fields. Run from the repository root:
+
+    python benchmarks/bench_prompts.py --urls 200 --workers 16 --ms-per-token 10
+    python benchmarks/bench_prompts.py --shapes json=0.7,fenced=0.2,prose=0.1
+    python benchmarks/bench_prompts.py --fields owners,management
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_throughput import get_client_environment, percentile  # noqa: E402
+from benchmarks.fake_server import CHARS_PER_TOKEN, FakePerplexityServer, add_behavior_arguments, get_behavior  # noqa: E402
+from owners_finder.api_client import (  # noqa: E402
+    COMPACT_SYSTEM_MESSAGE,
+    COMPANY_FIELDS,
+    DEFAULT_MAX_TOKENS,
+    OWNERS_FIELDS,
+    SYSTEM_MESSAGE,
+    create_combined_prompt,
+    create_compact_company_prompt,
+    create_compact_owners_prompt,
+    create_company_prompt,
+    create_owners_prompt,
+    get_max_tokens,
+    get_prompt_fields,
+)
+from owners_finder.config import PROMPT_STYLES  # noqa: E402
+
+EXAMPLE_URL = "https://www.example-company.com"
+
+
+def get_prompt_variants(fields=COMPANY_FIELDS):
+    """
+    Every prompt the lookups can send, with its system message and max_tokens.
+
+    Args:
+        fields (tuple): Record fields the prompts ask for
+
+    Returns:
+        list: (name, system message, prompt, max_tokens) tuples
+    """
+    owners_fields = tuple(field for field in OWNERS_FIELDS if field in fields) or OWNERS_FIELDS
+    return [
+        ("verbose company", SYSTEM_MESSAGE, create_company_prompt(EXAMPLE_URL, fields), DEFAULT_MAX_TOKENS),
+        ("verbose combined", SYSTEM_MESSAGE, create_combined_prompt(EXAMPLE_URL, fields), DEFAULT_MAX_TOKENS),
+        ("verbose owners", SYSTEM_MESSAGE, create_owners_prompt("Example GmbH", owners_fields), DEFAULT_MAX_TOKENS),
+        (
+            "compact company",
+            COMPACT_SYSTEM_MESSAGE,
+            create_compact_company_prompt(EXAMPLE_URL, fields),
+            get_max_tokens(fields),
+        ),
+        (
+            "compact combined",
+            COMPACT_SYSTEM_MESSAGE,
+            create_compact_company_prompt(EXAMPLE_URL, fields, thorough_owners=True),
+            get_max_tokens(fields),
+        ),
+        (
+            "compact owners",
+            COMPACT_SYSTEM_MESSAGE,
+            create_compact_owners_prompt("Example GmbH", owners_fields),
+            get_max_tokens(owners_fields),
+        ),
+    ]
+
+
+def format_prompt_table(fields=COMPANY_FIELDS):
+    """Format the estimated prompt tokens and max_tokens of every prompt variant."""
+    lines = [f"{'Prompt':<18} {'Prompt tokens':>14} {'max_tokens':>11}"]
+    for name, system_message, prompt, max_tokens in get_prompt_variants(fields):
+        prompt_tokens = (len(system_message) + len(prompt)) // CHARS_PER_TOKEN
+        lines.append(f"{name:<18} {prompt_tokens:>14} {max_tokens:>11}")
+    return "\n".join(lines)
+
+
+def bench_style(style, urls, workers, fields=None):
+    """
+    Run lookups with one prompt style.
+
+    Returns:
+        dict: Latency, token and extraction figures
+    """
+    from owners_finder.batch import iter_lookups
+    from owners_finder.parser import find_company_owners
+    from owners_finder.usage import usage_totals
+
+    os.environ["PROMPT_STYLE"] = style
+    usage_totals.reset()
+    latencies = []
+
+    def timed_lookup(url):
+        started = time.perf_counter()
+        try:
+            return find_company_owners(url, fields=fields)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    results = []
+    failures = 0
+    # Lookup messages are discarded
+    logging.getLogger("owners_finder").setLevel(logging.ERROR)
+    started = time.perf_counter()
+    for _, _, company_info, error in iter_lookups(enumerate(urls, 1), timed_lookup, workers=workers):
+        if error is not None:
+            failures += 1
+        else:
+            results.append(company_info)
+    elapsed = time.perf_counter() - started
+
+    usage = usage_totals.summary()
+    return {
+        "urls_per_sec": len(urls) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "requests_per_lookup": usage["requests"] / len(urls),
+        "prompt_tokens_per_lookup": usage["prompt_tokens"] / len(urls),
+        "completion_tokens_per_lookup": usage["completion_tokens"] / len(urls),
+        "truncated": usage["truncated"],
+        "failures": failures,
+        "named": sum(result.get("company_name") not in (None, "", "Unknown") for result in results) / len(urls),
+        "with_owners": sum(bool(result.get("owners")) for result in results) / len(urls),
+    }
+
+
+def format_results(results):
+    """Format the per-style figures as a table."""
+    lines = [
+        f"{'Style':<8} {'URLs/sec':>9} {'p50 ms':>8} {'p95 ms':>8} {'Req/URL':>8} {'Prompt tok':>11} "
+        f"{'Compl tok':>10} {'Truncated':>10} {'Failed':>7} {'Named':>7} {'Owners':>7}"
+    ]
+    for style, metrics in results.items():
+        lines.append(
+            f"{style:<8} {metrics['urls_per_sec']:>9.1f} {metrics['p50_ms']:>8.0f} {metrics['p95_ms']:>8.0f} "
+            f"{metrics['requests_per_lookup']:>8.2f} {metrics['prompt_tokens_per_lookup']:>11.0f} "
+            f"{metrics['completion_tokens_per_lookup']:>10.0f} {metrics['truncated']:>10} {metrics['failures']:>7} "
+            f"{metrics['named']:>7.0%} {metrics['with_owners']:>7.0%}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the verbose and compact prompt styles")
+    parser.add_argument("--urls", type=int, default=100, help="URLs per style (default: 100)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent lookups (default: 8)")
+    parser.add_argument("--fields", help='Comma-separated record fields to look up, e.g. "owners,management"')
+    add_behavior_arguments(parser)
+    parser.set_defaults(ms_per_token=10.0, ms_per_prompt_token=0.2, latency_ms=100.0)
+    args = parser.parse_args()
+    fields = get_prompt_fields(args.fields.split(",")) if args.fields else None
+
+    print(format_prompt_table(fields or COMPANY_FIELDS))
+    print()
+
+    with FakePerplexityServer(get_behavior(args)) as server:
+        os.environ.update(get_client_environment(server.base_url))
+        os.environ.setdefault("HTTP_POOL_SIZE", str(args.workers))
+        results = {
+            style: bench_style(
+                style, [f"https://company-{style}-{index}.example" for index in range(args.urls)], args.workers, fields
+            )
+            for style in PROMPT_STYLES
+        }
+
+    print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Micro-benchmark for the JSON backends used for payloads, responses and result files.
+
+Run from the repository root:
+
+    python benchmarks/bench_serialization.py
+"""
+
+import os
+import sys
+import timeit
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from owners_finder import serialization  # noqa: E402
+from owners_finder.api_client import build_payload, create_company_prompt  # noqa: E402
+from owners_finder.models import example_company_info  # noqa: E402
+
+PAYLOAD = build_payload(create_company_prompt("https://example.com"))
+RESULT = example_company_info()
+RESPONSE = serialization.dumps(
+    {
+        "id": "example",
+        "model": "sonar-pro",
+        "citations": [f"https://example.com/source/{index}" for index in range(10)],
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": serialization.dumps(RESULT).decode()}}],
+        "usage": {"prompt_tokens": 250, "completion_tokens": 300, "total_tokens": 550},
+    }
+)
+
+CASES = {
+    "encode request payload": lambda: serialization.dumps(PAYLOAD),
+    "decode API response": lambda: serialization.loads(RESPONSE),
+    "encode result (pretty)": lambda: serialization.dumps(RESULT, pretty=True),
+    "encode result (compact)": lambda: serialization.dumps(RESULT),
+}
+
+
+def main():
+    backends = ["json"] + [
+        name for name in ("orjson", "msgspec") if getattr(serialization, name) is not None
+    ]
+    timings = {}
+    for backend in backends:
+        with patch.dict(os.environ, {"JSON_BACKEND": backend}):
+            for case, function in CASES.items():
+                number = 20000
+                timings[backend, case] = min(timeit.repeat(function, number=number, repeat=5)) / number
+
+    for case in CASES:
+        baseline = timings["json", case]
+        results = ", ".join(
+            f"{backend} {timings[backend, case] * 1e6:.1f}us ({baseline / timings[backend, case]:.1f}x)"
+            for backend in backends
+        )
+        print(f"{case:<26} {results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Micro-benchmark for the plain-text fallback used when a response has no JSON.
+
+Compares the single-scan keyword table in parse_text_response against the
+previous per-keyword regex searches. Run from the repository root:
+
+    python benchmarks/bench_text_fallback.py
+"""
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from owners_finder.parser import parse_text_response  # noqa: E402
+
+RESPONSE = """
+Company Name: Example Corp
+Description: A technology company specializing in AI solutions for retailers.
+Industry: Technology
+Founded: 2020
+Headquarters: San Francisco, CA
+Founder: John Doe
+The company was founded by John Doe and Jane Smith.
+CEO: Robert Johnson
+Owners: Example Holdings LLC
+"""
+
+PROSE = (
+    "Public filings and press coverage describe a steady expansion into new markets "
+    "over the last few years, with several product launches and partnerships. "
+)
+
+
+def legacy_parse_text_response(text):
+    """The previous fallback: one regex search or findall per keyword."""
+
+    def field(keywords):
+        for keyword in keywords:
+            match = re.search(rf"{keyword}[:\s]+([^\n\r.]+)", text, re.IGNORECASE)
+            if match:
+                return match.group(1).strip()
+        return None
+
+    result = {
+        "company_name": field(["company name", "name"]),
+        "description": field(["description", "about", "what"]),
+        "industry": field(["industry", "sector"]),
+        "founded_year": field(["founded", "established", "year"]),
+        "headquarters": field(["headquarters", "location", "based"]),
+        "owners": [],
+    }
+    for pattern in [r"founder[s]?[:\s]+([^\n\r.]+)", r"owner[s]?[:\s]+([^\n\r.]+)",
+                    r"CEO[:\s]+([^\n\r.]+)", r"founded by[:\s]+([^\n\r.]+)"]:
+        result["owners"].extend(match.strip() for match in re.findall(pattern, text, re.IGNORECASE))
+    for pattern in [r"management[:\s]+([^\n\r.]+)", r"leadership[:\s]+([^\n\r.]+)",
+                    r"executive[:\s]+([^\n\r.]+)", r"board of directors[:\s]+([^\n\r.]+)"]:
+        re.findall(pattern, text, re.IGNORECASE)
+    return result
+
+
+def run(scale, number):
+    """Time both implementations on a response padded with prose."""
+    text = PROSE * scale + RESPONSE + PROSE * scale
+    legacy = timeit.timeit(lambda: legacy_parse_text_response(text), number=number) / number * 1000
+    current = timeit.timeit(lambda: parse_text_response(text, "https://example.com"), number=number) / number * 1000
+    print(f"{len(text):>8} chars  legacy {legacy:8.3f} ms  single scan {current:8.3f} ms  speedup {legacy / current:5.1f}x")
+
+
+if __name__ == "__main__":
+    for scale, number in ((0, 2000), (10, 200), (100, 20), (1000, 3)):
+        run(scale, number)
@@ -0,0 +1,254 @@
+"""
+End-to-end throughput benchmark against the local fake API server.
+
+Starts benchmarks/fake_server.py in a subprocess, so its CPU time is not
+counted, and measures:
+
+- lookup: find_company_owners over a worker pool in this process, with
+  URLs/sec, p50/p95/p99 latency per URL and CPU time per record
+- cli: main.py over a URL file, with URLs/sec and CPU time per record
+
+Caching and the lookup memo are off so every URL reaches the server. Run
+from the repository root:
+
+    python benchmarks/bench_throughput.py --urls 500 --workers 16 --latency-ms 100
+    python benchmarks/bench_throughput.py --shapes json=0.5,fenced=0.3,prose=0.2 --error-rate 0.02 --save base.json
+    python benchmarks/bench_throughput.py --baseline base.json --max-regression 0.1
+
+With --baseline the exit status is 1 when URLs/sec dropped, or CPU per
+record grew, by more than --max-regression compared with the saved run.
+Compare runs with the same server options on the same machine.
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.fake_server import add_behavior_arguments  # noqa: E402
+
+BEHAVIOR_OPTIONS = (
+    "latency_ms",
+    "latency_sigma",
+    "error_rate",
+    "rate_limit_rate",
+    "retry_after",
+    "owners_rate",
+    "seed",
+    "ms_per_token",
+    "ms_per_prompt_token",
+)
+
+
+def percentile(values, share):
+    """Get the nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, round(share * len(ordered)) - 1))]
+
+
+def start_server(args):
+    """
+    Start the fake server in a subprocess.
+
+    Returns:
+        tuple: (process, base URL)
+    """
+    command = [sys.executable, os.path.join(ROOT, "benchmarks", "fake_server.py"), "--port", "0"]
+    for option in BEHAVIOR_OPTIONS:
+        value = getattr(args, option)
+        if value is not None:
+            command += [f"--{option.replace('_', '-')}", str(value)]
+    command += ["--shapes", ",".join(f"{shape}={weight}" for shape, weight in args.shapes.items())]
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    return process, process.stdout.readline().strip()
+
+
+def get_server_stats(base_url):
+    """Read the fake server's request counters."""
+    import requests
+
+    return requests.get(f"{base_url}/stats", timeout=5).json()
+
+
+def get_client_environment(base_url):
+    """Environment pointing the client at the fake server with caching off."""
+    return {
+        "PERPLEXITY_API_BASE_URL": base_url,
+        "PERPLEXITY_API_KEY": "benchmark",
+        "RESPONSE_CACHE_MODE": "off",
+        "LOOKUP_MEMO_MAX_ENTRIES": "0",
+    }
+
+
+def get_urls(count, run):
+    """Distinct company URLs, different for every run so nothing is reused."""
+    return [f"https://company-{run}-{index}.example" for index in range(count)]
+
+
+def bench_lookup(args, base_url):
+    """Measure find_company_owners over a worker pool in this process."""
+    os.environ.update(get_client_environment(base_url))
+    os.environ.setdefault("HTTP_POOL_SIZE", str(args.workers))
+
+    from owners_finder.batch import iter_lookups
+    from owners_finder.parser import find_company_owners
+
+    latencies = []
+
+    def timed_lookup(url):
+        started = time.perf_counter()
+        try:
+            return find_company_owners(url)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    urls = get_urls(args.urls, "lookup")
+    failures = 0
+    # Lookup messages are discarded, as for the command line run
+    logging.getLogger("owners_finder").setLevel(logging.ERROR)
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    for _, _, _, error in iter_lookups(enumerate(urls, 1), timed_lookup, workers=args.workers):
+        failures += error is not None
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    return {
+        "urls": len(urls),
+        "failures": failures,
+        "seconds": elapsed,
+        "urls_per_sec": len(urls) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "cpu_ms_per_record": cpu / len(urls) * 1000,
+    }
+
+
+def bench_cli(args, base_url):
+    """Measure main.py over a URL file, writing JSON Lines output."""
+    with tempfile.TemporaryDirectory() as folder:
+        urls = get_urls(args.urls, "cli")
+        url_file = os.path.join(folder, "urls.txt")
+        with open(url_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(urls) + "\n")
+
+        command = [
+            sys.executable,
+            os.path.join(ROOT, "main.py"),
+            "--workers", str(args.workers),
+            "--no-cache",
+            "--output-format", "jsonl",
+            "--output", os.path.join(folder, "out.jsonl"),
+            "--file", url_file,
+        ]
+        environment = {**os.environ, **get_client_environment(base_url), "HTTP_POOL_SIZE": str(args.workers)}
+
+        before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        started = time.perf_counter()
+        subprocess.run(command, env=environment, cwd=folder, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        elapsed = time.perf_counter() - started
+        after = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+        with open(os.path.join(folder, "out.jsonl"), encoding="utf-8") as f:
+            written = sum(1 for _ in f)
+
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    return {
+        "urls": len(urls),
+        "failures": len(urls) - written,
+        "seconds": elapsed,
+        "urls_per_sec": len(urls) / elapsed,
+        "cpu_ms_per_record": cpu / len(urls) * 1000,
+    }
+
+
+def find_regressions(results, baseline, max_regression):
+    """
+    Compare results with a saved run.
+
+    Returns:
+        list: Descriptions of metrics that got worse by more than max_regression
+    """
+    regressions = []
+    for mode, metrics in results.items():
+        previous = baseline.get(mode)
+        if not previous:
+            continue
+        if metrics["urls_per_sec"] < previous["urls_per_sec"] * (1 - max_regression):
+            regressions.append(f"{mode}: {metrics['urls_per_sec']:.1f} URLs/sec vs {previous['urls_per_sec']:.1f}")
+        if metrics["cpu_ms_per_record"] > previous["cpu_ms_per_record"] * (1 + max_regression):
+            regressions.append(
+                f"{mode}: {metrics['cpu_ms_per_record']:.2f} ms CPU/record vs {previous['cpu_ms_per_record']:.2f}"
+            )
+    return regressions
+
+
+def format_results(results):
+    """Format benchmark results as text lines."""
+    lines = []
+    for mode, metrics in results.items():
+        line = (
+            f"{mode:<7} {metrics['urls']} URLs in {metrics['seconds']:.2f}s: {metrics['urls_per_sec']:.1f} URLs/sec, "
+            f"{metrics['cpu_ms_per_record']:.2f} ms CPU/record, {metrics['failures']} failed"
+        )
+        if "p50_ms" in metrics:
+            line += f", latency p50 {metrics['p50_ms']:.0f} ms p95 {metrics['p95_ms']:.0f} ms p99 {metrics['p99_ms']:.0f} ms"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end throughput benchmark against a local fake API server")
+    parser.add_argument("--mode", choices=["lookup", "cli", "both"], default="both", help="What to measure (default: both)")
+    parser.add_argument("--urls", type=int, default=200, help="URLs per run (default: 200)")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent lookups (default: 8)")
+    parser.add_argument("--save", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare with results saved by --save")
+    parser.add_argument(
+        "--max-regression", type=float, default=0.15, help="Allowed relative slowdown against --baseline (default: 0.15)"
+    )
+    add_behavior_arguments(parser)
+    args = parser.parse_args()
+
+    process, base_url = start_server(args)
+    try:
+        results = {}
+        if args.mode in ("lookup", "both"):
+            results["lookup"] = bench_lookup(args, base_url)
+        if args.mode in ("cli", "both"):
+            results["cli"] = bench_cli(args, base_url)
+        server_stats = get_server_stats(base_url)
+    finally:
+        process.terminate()
+        process.wait()
+
+    print(format_results(results))
+    print(f"server: {json.dumps(server_stats, sort_keys=True)}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = find_regressions(results, json.load(f), args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
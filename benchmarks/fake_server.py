@@ -0,0 +1,395 @@
+"""
+Local stand-in for the Perplexity chat completions API, for offline benchmarks.
+
+Answers POST /chat/completions with made-up company records after a
+simulated latency, and injects server errors and 429 responses at
+configurable rates. Latency can grow with the prompt and completion token
+counts, and answers longer than the request's max_tokens are cut off with
+finish_reason "length". GET /stats returns request counters. Point the
+client at it with PERPLEXITY_API_BASE_URL:
+
+    python benchmarks/fake_server.py --port 8765 --latency-ms 300 --error-rate 0.02
+    PERPLEXITY_API_BASE_URL=http://127.0.0.1:8765 python main.py urls.txt
+
+With --port 0 a free port is chosen; the server prints its base URL as the
+first line of output either way.
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SHAPES = ("json", "fenced", "prose")
+
+# Verbose and compact prompts; see owners_finder.api_client
+COMPANY_URL_PATTERN = re.compile(r"(?:website at |Company website: )(\S+?),?(?: then|$)", re.MULTILINE)
+OWNERS_NAME_PATTERN = re.compile(
+    r"(?:Find the owners (?:and management information for |of )|Owners (?:and management )?of )(.+?)\.?\n"
+)
+# Keys listed by compact prompts, or verbose ones ("exact keys:" followed by "- key" lines)
+JSON_KEYS_PATTERN = re.compile(r"^JSON keys: (.+)$|exact keys:\n((?:- .*\n)+)", re.MULTILINE)
+
+# Characters per token when estimating token counts
+CHARS_PER_TOKEN = 4
+
+FIRST_NAMES = ("Anna", "Ben", "Clara", "David", "Eva", "Felix", "Greta", "Hugo", "Ida", "Jonas")
+LAST_NAMES = ("Berger", "Fischer", "Hoffmann", "Keller", "Lang", "Meyer", "Schmidt", "Vogel", "Weber", "Wolf")
+INDUSTRIES = ("Manufacturing", "Software", "Retail", "Logistics", "Food Production", "Consulting")
+CITIES = ("Berlin, Germany", "Vienna, Austria", "Zurich, Switzerland", "Munich, Germany", "Lyon, France")
+
+
+def parse_shapes(value):
+    """
+    Parse response shape weights such as "json=0.6,fenced=0.3,prose=0.1".
+
+    Args:
+        value (str): Comma-separated shape=weight pairs
+
+    Returns:
+        dict: Weight per shape
+    """
+    weights = {}
+    for part in value.split(","):
+        shape, _, weight = part.partition("=")
+        shape = shape.strip()
+        if shape not in SHAPES:
+            raise argparse.ArgumentTypeError(f"Unknown response shape: {shape}. Expected one of: {', '.join(SHAPES)}")
+        weights[shape] = float(weight or 1)
+    return weights
+
+
+class FakeBehavior:
+    """Latency, failure and response shape settings of the fake server."""
+
+    def __init__(
+        self,
+        latency_ms=200.0,
+        latency_sigma=0.5,
+        error_rate=0.0,
+        rate_limit_rate=0.0,
+        retry_after=0.1,
+        owners_rate=0.6,
+        shapes=None,
+        seed=None,
+        ms_per_token=0.0,
+        ms_per_prompt_token=0.0,
+    ):
+        """
+        Args:
+            latency_ms (float): Median response latency in milliseconds
+            latency_sigma (float): Spread of the log-normal latency distribution (0 for constant latency)
+            error_rate (float): Share of requests answered with 500
+            rate_limit_rate (float): Share of requests answered with 429
+            retry_after (float): Retry-After seconds sent with 429 responses
+            owners_rate (float): Share of answers that name owners
+            shapes (dict, optional): Weight per response shape, see SHAPES
+            seed (int, optional): Seed for reproducible runs
+            ms_per_token (float): Latency added per completion token
+            ms_per_prompt_token (float): Latency added per prompt token
+        """
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.owners_rate = owners_rate
+        self.shapes = shapes or {"json": 1.0}
+        self.ms_per_token = ms_per_token
+        self.ms_per_prompt_token = ms_per_prompt_token
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self):
+        """Draw the latency, status and response shape of one request."""
+        with self._lock:
+            latency = self.latency_ms / 1000 * math.exp(self._random.gauss(0, self.latency_sigma))
+            outcome = self._random.random()
+            shape = self._random.choices(list(self.shapes), weights=list(self.shapes.values()))[0]
+            has_owners = self._random.random() < self.owners_rate
+            people = [self._random.randrange(len(FIRST_NAMES) * len(LAST_NAMES)) for _ in range(3)]
+            details = (self._random.choice(INDUSTRIES), self._random.randrange(1950, 2021), self._random.choice(CITIES))
+
+        if outcome < self.error_rate:
+            status = 500
+        elif outcome < self.error_rate + self.rate_limit_rate:
+            status = 429
+        else:
+            status = 200
+        return latency, status, shape, has_owners, people, details
+
+    def get_token_latency(self, prompt_tokens, completion_tokens):
+        """Latency in seconds added for reading the prompt and generating the completion."""
+        return (prompt_tokens * self.ms_per_prompt_token + completion_tokens * self.ms_per_token) / 1000
+
+
+def _person(number):
+    """Name a person from a drawn number."""
+    return f"{FIRST_NAMES[number % len(FIRST_NAMES)]} {LAST_NAMES[number // len(FIRST_NAMES) % len(LAST_NAMES)]}"
+
+
+def build_record(prompt, has_owners, people, details):
+    """
+    Build the record answering a company or owners prompt.
+
+    Only the keys the prompt lists are returned.
+
+    Args:
+        prompt (str): The user message
+        has_owners (bool): Include owners
+        people (list): Drawn numbers naming the founder, CEO and CFO
+        details (tuple): Drawn industry, founding year and headquarters
+
+    Returns:
+        dict: Company record, or owners record for owners prompts
+    """
+    founder, ceo, cfo = (_person(number) for number in people)
+    owners = [{"name": founder, "title": "Founder", "ownership_percentage": "60%"}] if has_owners else []
+    management = {"ceo": {"name": ceo, "title": "Chief Executive Officer"}, "cfo": {"name": cfo, "title": "CFO"}}
+
+    owners_match = OWNERS_NAME_PATTERN.search(prompt)
+    if owners_match:
+        record = {"owners": owners, "management": management}
+    else:
+        url_match = COMPANY_URL_PATTERN.search(prompt)
+        domain = re.sub(r"^https?://(www\.)?", "", url_match.group(1)).split("/")[0] if url_match else "example.com"
+        industry, founded_year, headquarters = details
+        record = {
+            "company_name": f"{domain.split('.')[0].replace('-', ' ').title()} GmbH",
+            "description": f"A {industry.lower()} company operating from {headquarters}.",
+            "owners": owners,
+            "management": management,
+            "industry": industry,
+            "founded_year": str(founded_year),
+            "headquarters": headquarters,
+        }
+
+    keys_match = JSON_KEYS_PATTERN.search(prompt)
+    if keys_match:
+        listed = keys_match.group(1) or keys_match.group(2)
+        record = {key: value for key, value in record.items() if re.search(rf"\b{key}\b", listed)}
+    return record
+
+
+def render_content(record, shape):
+    """
+    Render a record as message content of the given shape.
+
+    Args:
+        record (dict): Record from build_record
+        shape (str): "json", "fenced" or "prose"
+
+    Returns:
+        str: Message content
+    """
+    if shape == "json":
+        return json.dumps(record)
+    if shape == "fenced":
+        return f"Here is what I found:\n\n```json\n{json.dumps(record, indent=2)}\n```\n\nSources: [1] [2]"
+
+    labels = (
+        ("company_name", "Company Name"),
+        ("description", "Description"),
+        ("industry", "Industry"),
+        ("founded_year", "Founded"),
+        ("headquarters", "Headquarters"),
+    )
+    lines = [f"{label}: {record[key]}" for key, label in labels if key in record]
+    for owner in record.get("owners", []):
+        lines.append(f"Founder: {owner['name']}")
+    if "management" in record:
+        lines.append(f"CEO: {record['management']['ceo']['name']}")
+    return "\n".join(lines)
+
+
+class FakePerplexityHandler(BaseHTTPRequestHandler):
+    """Request handler; the server carries the behavior and counters."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.rstrip("/") != "/stats":
+            self._send(404, {"error": "not found"})
+            return
+        with self.server.stats_lock:
+            stats = dict(self.server.stats)
+        self._send(200, stats)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path.rstrip("/") != "/chat/completions":
+            self._send(404, {"error": "not found"})
+            return
+
+        try:
+            payload = json.loads(body)
+            prompt = payload["messages"][-1]["content"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            self._count("bad_requests")
+            self._send(400, {"error": "invalid request"})
+            return
+
+        behavior = self.server.behavior
+        latency, status, shape, has_owners, people, details = behavior.draw()
+
+        if status == 500:
+            time.sleep(latency)
+            self._count("errors")
+            self._send(500, {"error": "internal server error"})
+            return
+        if status == 429:
+            time.sleep(latency)
+            self._count("rate_limited")
+            self._send(429, {"error": "rate limited"}, {"Retry-After": str(behavior.retry_after)})
+            return
+
+        if payload.get("response_format"):
+            shape = "json"
+        content = render_content(build_record(prompt, has_owners, people, details), shape)
+        prompt_tokens = sum(len(message.get("content", "")) for message in payload["messages"]) // CHARS_PER_TOKEN
+        completion_tokens = len(content) // CHARS_PER_TOKEN
+
+        finish_reason = "stop"
+        max_tokens = payload.get("max_tokens")
+        if isinstance(max_tokens, int) and completion_tokens > max_tokens:
+            content = content[: max_tokens * CHARS_PER_TOKEN]
+            completion_tokens = max_tokens
+            finish_reason = "length"
+            self._count("truncated")
+
+        time.sleep(latency + behavior.get_token_latency(prompt_tokens, completion_tokens))
+        self._count(shape)
+        self._send(
+            200,
+            {
+                "id": f"fake-{time.monotonic_ns()}",
+                "model": payload.get("model"),
+                "object": "chat.completion",
+                "choices": [
+                    {"index": 0, "finish_reason": finish_reason, "message": {"role": "assistant", "content": content}}
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            },
+        )
+
+    def _count(self, name):
+        with self.server.stats_lock:
+            self.server.stats["requests"] += 1
+            self.server.stats[name] = self.server.stats.get(name, 0) + 1
+
+    def _send(self, status, data, headers=None):
+        encoded = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+class FakePerplexityServer(ThreadingHTTPServer):
+    """
+    Threaded fake API server, one thread per connection.
+
+    Use as a context manager to serve from a background thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, behavior=None, host="127.0.0.1", port=0):
+        super().__init__((host, port), FakePerplexityHandler)
+        self.behavior = behavior or FakeBehavior()
+        self.stats = {"requests": 0}
+        self.stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """Base URL to use as PERPLEXITY_API_BASE_URL."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        self.server_close()
+
+
+def add_behavior_arguments(parser):
+    """Add the fake server behavior options to an argument parser."""
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Median latency in ms (default: 200)")
+    parser.add_argument(
+        "--latency-sigma", type=float, default=0.5, help="Log-normal latency spread, 0 for constant (default: 0.5)"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 500 responses (default: 0)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of 429 responses (default: 0)")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="Retry-After seconds for 429s (default: 0.1)")
+    parser.add_argument("--owners-rate", type=float, default=0.6, help="Share of answers naming owners (default: 0.6)")
+    parser.add_argument(
+        "--shapes",
+        type=parse_shapes,
+        default={"json": 1.0},
+        help='Response shape weights, e.g. "json=0.6,fenced=0.3,prose=0.1" (default: json)',
+    )
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+    parser.add_argument(
+        "--ms-per-token", type=float, default=0.0, help="Latency added per completion token in ms (default: 0)"
+    )
+    parser.add_argument(
+        "--ms-per-prompt-token", type=float, default=0.0, help="Latency added per prompt token in ms (default: 0)"
+    )
+
+
+def get_behavior(args):
+    """Create the fake server behavior from parsed arguments."""
+    return FakeBehavior(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        owners_rate=args.owners_rate,
+        shapes=args.shapes,
+        seed=args.seed,
+        ms_per_token=args.ms_per_token,
+        ms_per_prompt_token=args.ms_per_prompt_token,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Perplexity chat completions API")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on, 0 for any free port (default: 8765)")
+    add_behavior_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakePerplexityServer(get_behavior(args), host=args.host, port=args.port)
+    print(server.base_url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
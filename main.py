@@ -2,26 +2,105 @@ import json
 import sys
 import os
 import argparse
+import functools
+import logging
+import time
+from contextlib import nullcontext
 
 from owners_finder import find_company_owners, save_to_json
-from owners_finder.config import set_api_key_from_command_line
-
-
-def process_single_url(website_url, custom_filename=None, company_info=None):
-    """Process a single website URL and display results."""
+from owners_finder.api_client import COMPANY_FIELDS, get_prompt_fields
+from owners_finder.inputs import STDIN, is_supported_input, iter_urls
+from owners_finder.utils import (
+    COMPRESSIONS,
+    JsonlSink,
+    get_default_jsonl_path,
+    get_result_name,
+    get_resume_output_path,
+)
+from owners_finder.batch import iter_lookups
+from owners_finder.canonical import canonicalize_url
+from owners_finder.strategy import format_strategy_report, get_strategy_stats
+from owners_finder.metrics import configure_metrics, format_metrics_summary, registry as metrics_registry
+from owners_finder.progress import ProgressLine, format_log_record, format_log_summary
+from owners_finder.usage import format_usage_report, usage_totals
+from owners_finder.checkpoint import (
+    STATUS_FAILED,
+    STATUS_SUCCESS,
+    CheckpointJournal,
+    get_completed_indexes,
+    get_default_checkpoint_path,
+    load_checkpoint,
+)
+from owners_finder.config import (
+    DEFAULT_CACHE_PATH,
+    PROMPT_STYLES,
+    get_batch_workers,
+    set_api_key_from_command_line,
+    set_cache_options_from_command_line,
+    set_include_usage_from_command_line,
+    set_json_pretty_from_command_line,
+    set_lookup_fields_from_command_line,
+    set_metrics_paths_from_command_line,
+    set_prompt_style_from_command_line,
+    set_rate_limits_from_command_line,
+    set_speculative_owners_from_command_line,
+    set_strategy_stats_path_from_command_line,
+    set_structured_output_from_command_line,
+)
+
+# Number of processed URLs between progress summaries in batch runs
+PROGRESS_INTERVAL = 100
+
+
+def configure_logging(show_lookup_messages=True):
+    """
+    Send the messages logged during lookups to standard error.
+
+    Lookups in worker threads log rather than print, so their messages do not
+    break up the per-URL reports on standard output. The compact output modes
+    only show errors.
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger("owners_finder")
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO if show_lookup_messages else logging.ERROR)
+
+
+def process_single_url(website_url, custom_filename=None, company_info=None, sink=None, index=None, report="text"):
+    """
+    Process a single website URL and display results.
+
+    Results are saved to their own JSON file, or appended to sink (a JsonlSink)
+    when one is given. Returns the saved file path, or False on failure.
+
+    report selects what is printed: "text" for the full human-readable report,
+    "json" for one compact JSON line, or None for nothing.
+    """
     try:
-        print(f"Analyzing company website: {website_url}")
+        if report == "text":
+            print(f"Analyzing company website: {website_url}")
 
         # Find company owners (only if not already provided)
         if company_info is None:
             company_info = find_company_owners(website_url)
 
-        # Save to JSON file
-        filename = save_to_json(company_info, filename=custom_filename)
+        # Save to JSON file, or stream to the batch output
+        if sink is not None:
+            sink.write({"index": index, **company_info} if index is not None else company_info)
+            filename = sink.path
+        else:
+            filename = save_to_json(company_info, filename=custom_filename)
+
+        if report != "text":
+            if report == "json":
+                print(format_log_record(index, website_url, company_info, output=filename))
+            return filename
 
-        # Print results
+        # Print results; lookups limited with --fields only have the requested fields
         print(f"\nCompany Information:")
-        print(f"Name: {company_info['company_name']}")
+        if "company_name" in company_info:
+            print(f"Name: {company_info['company_name']}")
         
         # Display Owners/Founders as second row
         if company_info.get("owners") and len(company_info["owners"]) > 0:
@@ -33,12 +112,15 @@ def process_single_url(website_url, custom_filename=None, company_info=None):
                 if owner.get("ownership_percentage"):
                     owner_info += f" ({owner['ownership_percentage']})"
                 print(f"  • {owner_info}")
-        else:
+        elif "owners" in company_info:
             print("Owners/Founders: Not found")
         
-        print(f"Description: {company_info['description']}")
-        print(f"Industry: {company_info.get('industry', 'Not specified')}")
-        print(f"Headquarters: {company_info.get('headquarters', 'Not specified')}")
+        if "description" in company_info:
+            print(f"Description: {company_info['description']}")
+        if "industry" in company_info:
+            print(f"Industry: {company_info.get('industry', 'Not specified')}")
+        if "headquarters" in company_info:
+            print(f"Headquarters: {company_info.get('headquarters', 'Not specified')}")
         
         # Display Management information
         if company_info.get('management'):
@@ -65,7 +147,7 @@ def process_single_url(website_url, custom_filename=None, company_info=None):
                 if coo.get('title'):
                     coo_info += f" - {coo['title']}"
                 print(f"  • COO: {coo_info}")
-        else:
+        elif "management" in company_info:
             print("Management: Not found")
 
         print(f"\nResults saved to: {filename}")
@@ -74,76 +156,231 @@ def process_single_url(website_url, custom_filename=None, company_info=None):
         print(f"\nJSON Output:")
         print(json.dumps(company_info, indent=2))
 
-        return True
+        return filename
 
     except ValueError as e:
-        print(f"Error: {e}")
+        if report == "json":
+            print(format_log_record(index, website_url, error=e))
+        else:
+            print(f"Error: {e}")
         return False
     except Exception as e:
-        print(f"Failed to analyze company: {e}")
+        if report == "json":
+            print(format_log_record(index, website_url, error=e))
+        else:
+            print(f"Failed to analyze company: {e}")
         return False
 
 
-def process_urls_from_file(file_path):
-    """Process multiple URLs from a text file."""
+def process_urls_from_file(
+    file_path, workers=1, checkpoint_path=None, resume=False, output_format="json", output_path=None,
+    compression=None, fsync=False, flush_every=100, column=None, dedupe=True, quiet=False, progress=False,
+    log_format="text"
+):
+    """
+    Process multiple URLs from a file or stdin, optionally with concurrent lookups.
+
+    URLs are streamed from text, CSV (column selects the URL column) or gzip
+    files, or from standard input when file_path is "-", so memory use does not
+    grow with the input size.
+
+    Every result is appended to a checkpoint journal as it lands. With resume,
+    entries the journal records as successful are skipped and only failed or
+    pending URLs are looked up again.
+
+    With dedupe, URLs are canonicalized to their registrable domain and each
+    domain is looked up once; the result is reused for every row that maps to it.
+
+    With output_format "jsonl" all results are streamed as compact records to a
+    single (optionally compressed) JSON Lines file instead of one file per company.
+    A success is only journaled once its record has been flushed to that file, and
+    a resumed run writes a new part instead of appending to the old file.
+
+    Console output: by default every URL gets a full report. With quiet only
+    failures and the final summary are printed. With progress a single line on
+    standard error, updated in place, shows the rate and estimated time left. With
+    log_format "json" every URL and the summary are printed as compact JSON lines
+    (successes are left out when quiet).
+    """
     try:
         # Check if file exists
-        if not os.path.exists(file_path):
+        if file_path != STDIN and not os.path.exists(file_path):
             print(f"Error: File '{file_path}' not found.")
             return False
 
-        # Read URLs from file
-        with open(file_path, 'r') as file:
-            urls = [line.strip() for line in file if line.strip()]
-
-        if not urls:
-            print(f"Error: No URLs found in file '{file_path}'.")
-            return False
-
-        print(f"Found {len(urls)} URLs to process from '{file_path}'")
-        print("=" * 60)
+        # Full per-URL reports only in the default mode
+        report_each_url = log_format == "text" and not quiet and not progress
+        text_log = log_format == "text"
+
+        source = "standard input" if file_path == STDIN else f"'{file_path}'"
+        if text_log:
+            print(f"Processing URLs from {source}")
+            if workers > 1:
+                print(f"Using {workers} concurrent workers")
+
+        # Skip entries completed by a previous run
+        checkpoint_path = checkpoint_path or get_default_checkpoint_path(file_path)
+        records = load_checkpoint(checkpoint_path) if resume else {}
+        completed = get_completed_indexes(records)
+        if resume and text_log:
+            print(f"Resuming from '{checkpoint_path}': {len(completed)} URLs completed previously")
+        if text_log:
+            print("=" * 60)
+
+        # Counting the input first gives the progress line a percentage and ETA; stdin can only be read once
+        progress_line = None
+        if progress:
+            total_urls = sum(1 for _ in iter_urls(file_path, column=column)) if file_path != STDIN else None
+            progress_line = ProgressLine(total=total_urls)
 
         # Process each URL with indexed filenames
         successful = 0
         failed = 0
-
-        for i, url in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] Processing: {url}")
-            print("-" * 40)
-            
-            try:
-                # Find company owners first to get company name
-                company_info = find_company_owners(url)
-                
-                # Create indexed filename with company name
-                company_name = company_info.get("company_name") or "unknown_company"
-                clean_name = "".join(c for c in str(company_name) if c.isalnum() or c in (" ", "-", "_")).rstrip()
-                clean_name = clean_name.replace(" ", "_").lower()
-                if not clean_name:
-                    clean_name = "unknown_company"
-                
-                indexed_filename = f"{str(i).zfill(5)}_{clean_name}_info"
+        skipped = 0
+        lookup_stats = {}
+        usage_totals.reset()
+        started_at = time.monotonic()
+
+        def iter_pending_entries():
+            """Stream (index, url) pairs from the input, skipping completed entries."""
+            nonlocal skipped
+            for i, url in enumerate(iter_urls(file_path, column=column), 1):
+                if i in completed and records[i].get("url") == url:
+                    skipped += 1
+                    continue
+                yield i, url
+
+        if output_format == "jsonl":
+            output_path = output_path or get_default_jsonl_path(file_path, compression=compression or "none")
+            if resume:
+                # The earlier run may have stopped mid-block; appending after that would be unreadable
+                output_path = get_resume_output_path(output_path)
+            output_sink = JsonlSink(output_path, compression=compression, flush_every=flush_every, fsync=fsync)
+            if text_log:
+                print(f"Streaming results to '{output_sink.path}'")
+        else:
+            output_sink = nullcontext()
+
+        # Lines printed per URL in the compact modes, clearing the progress line first
+        def emit(line):
+            if progress_line is not None:
+                progress_line.clear()
+            print(line)
+
+        # The sink closes first, so successes still waiting for a flush are journaled on the way out
+        with CheckpointJournal(checkpoint_path, resume=resume) as journal, output_sink as sink:
+            # Lookups run concurrently, results arrive here in input order
+            # URLs are read lazily; at most workers * 2 lookups are queued ahead of the output
+            lookups = iter_lookups(
+                iter_pending_entries(), find_company_owners, workers=workers,
+                key=canonicalize_url if dedupe else None, stats=lookup_stats
+            )
+            for i, url, company_info, error in lookups:
+                if report_each_url:
+                    print(f"\n[{i}] Processing: {url}")
+                    print("-" * 40)
                 
-                if process_single_url(url, custom_filename=indexed_filename, company_info=company_info):
-                    successful += 1
-                else:
-                    failed += 1
+                output = None
+                try:
+                    if error is not None:
+                        raise error
                     
-            except Exception as e:
-                print(f"Failed to process {url}: {e}")
-                failed += 1
-            
-            print("-" * 40)
+                    # Deduplicated results are shared between rows, give each row its own copy
+                    if dedupe:
+                        company_info = {**company_info, "website": url}
+                    
+                    # Create indexed filename with company name, or the domain without one
+                    indexed_filename = f"{str(i).zfill(5)}_{get_result_name(company_info)}_info"
+                    
+                    output = process_single_url(
+                        url, custom_filename=indexed_filename, company_info=company_info, sink=sink, index=i,
+                        report="text" if report_each_url else None
+                    )
+                    if output:
+                        successful += 1
+                        if sink is not None:
+                            # Journal the row once its record is on disk, so a crash cannot mark it done
+                            sink.after_flush(functools.partial(journal.record, i, url, STATUS_SUCCESS, output=output))
+                        else:
+                            journal.record(i, url, STATUS_SUCCESS, output=output)
+                    else:
+                        error = "Failed to save or display results"
+                        failed += 1
+                        journal.record(i, url, STATUS_FAILED, error=error)
+                        
+                except Exception as e:
+                    error = e
+                    if report_each_url:
+                        print(f"Failed to process {url}: {e}")
+                    failed += 1
+                    journal.record(i, url, STATUS_FAILED, error=str(e))
+                
+                if report_each_url:
+                    print("-" * 40)
+                elif log_format == "json":
+                    if error is not None or not quiet:
+                        emit(format_log_record(i, url, company_info, output=output or None, error=error))
+                elif error is not None:
+                    emit(f"[{i}] Failed to process {url}: {error}")
+
+                processed = successful + failed
+                if progress_line is not None:
+                    progress_line.update(processed, failed, skipped)
+                elif report_each_url and processed % PROGRESS_INTERVAL == 0:
+                    rate = processed / max(time.monotonic() - started_at, 1e-9)
+                    print(f"Progress: {processed} processed ({successful} successful, {failed} failed), {rate:.2f} URLs/sec")
+
+        if progress_line is not None:
+            progress_line.close()
+
+        total = successful + failed + skipped
+        if total == 0:
+            print(f"Error: No URLs found in {source}.")
+            return False
+
+        if not text_log:
+            print(format_log_summary(
+                successful, failed, skipped, time.monotonic() - started_at, usage=usage_totals.summary()
+            ))
+            if metrics_registry.enabled:
+                metrics_registry.export()
+            return successful > 0 or (failed == 0 and skipped > 0)
 
         # Summary
         print(f"\n" + "=" * 60)
         print(f"BATCH PROCESSING COMPLETE")
         print(f"Successful: {successful}")
         print(f"Failed: {failed}")
-        print(f"Total: {len(urls)}")
+        if skipped:
+            print(f"Skipped (already completed): {skipped}")
+        if lookup_stats.get("reused"):
+            print(f"Unique lookups: {lookup_stats['lookups']} ({lookup_stats['reused']} duplicate URLs reused)")
+        print(f"Total: {total}")
         print("=" * 60)
 
-        return successful > 0
+        # Report token usage and estimated cost of this batch
+        usage_summary = usage_totals.summary()
+        if usage_summary["requests"]:
+            print("\nAPI usage:")
+            print(format_usage_report(
+                usage_summary, elapsed_seconds=time.monotonic() - started_at, lookups=usage_summary["lookups"]
+            ))
+
+        # Report what the adaptive prompt strategy has learned so far
+        strategy_stats = get_strategy_stats()
+        if strategy_stats is not None:
+            rows = strategy_stats.report()
+            if rows:
+                print("\nPrompt strategy by bucket (RT/ok = API calls per record with owners):")
+                print(format_strategy_report(rows))
+
+        # Report where the time went and write the configured metrics files
+        if metrics_registry.enabled:
+            print("\nTime per stage:")
+            print(format_metrics_summary(metrics_registry.summary()))
+            metrics_registry.export()
+
+        return successful > 0 or (failed == 0 and skipped > 0)
 
     except Exception as e:
         print(f"Error reading file '{file_path}': {e}")
@@ -155,11 +392,21 @@ def validate_url(url):
     return url.startswith(('http://', 'https://'))
 
 
+def parse_fields(value):
+    """Parse a comma-separated --fields value into record field names."""
+    try:
+        return get_prompt_fields(field.strip() for field in value.split(",") if field.strip())
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def validate_file(file_path):
-    """Validate if the input is a valid text file."""
+    """Validate if the input is standard input or a supported URL list file (.txt, .csv, optionally gzipped)."""
+    if file_path == STDIN:
+        return True
     if not os.path.isfile(file_path):
         return False
-    return file_path.endswith('.txt')
+    return is_supported_input(file_path)
 
 
 def main():
@@ -175,6 +422,14 @@ Examples:
   python main.py --url https://example.com
   python main.py --api-key YOUR_API_KEY https://example.com
   python main.py --api-key YOUR_API_KEY --file urls.txt
+  python main.py --workers 8 urls.txt
+  python main.py --refresh-cache urls.txt
+  python main.py --resume urls.txt
+  python main.py --output-format jsonl --compression gzip urls.txt
+  python main.py --column website companies.csv.gz
+  cat urls.txt | python main.py -
+  python main.py --workers 8 --requests-per-minute 50 urls.txt
+  python main.py --strategy-stats results/.cache/strategy.json urls.txt
         """
     )
     
@@ -184,6 +439,171 @@ Examples:
         help='Perplexity API key (overrides PERPLEXITY_API_KEY environment variable)'
     )
     
+    # Add concurrency argument for batch processing
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=get_batch_workers(),
+        help='Number of concurrent lookups for batch processing (default: BATCH_WORKERS or 1)'
+    )
+    
+    # Add checkpoint arguments for resumable batch runs
+    parser.add_argument(
+        '--checkpoint',
+        help='Checkpoint journal path for batch processing (default: <file>.checkpoint.jsonl)'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip URLs the checkpoint journal records as completed and retry only failed or pending ones'
+    )
+    
+    # Add deduplication argument
+    parser.add_argument(
+        '--no-dedupe',
+        action='store_true',
+        help='Look up every URL separately instead of once per canonical domain'
+    )
+    
+    # Add CSV column argument
+    parser.add_argument(
+        '--column',
+        help='CSV column holding the URLs, by name or zero-based index (default: url/website header or first column)'
+    )
+    
+    # Add batch output arguments
+    parser.add_argument(
+        '--output-format',
+        choices=['json', 'jsonl'],
+        default='json',
+        help='Batch output: one JSON file per company, or a single JSON Lines stream (default: json)'
+    )
+    parser.add_argument(
+        '--output',
+        help='JSON Lines output path (default: results/YYYY-MM-DD/<file>.jsonl)'
+    )
+    parser.add_argument(
+        '--compression',
+        choices=COMPRESSIONS,
+        help='Compression for JSON Lines output (default: inferred from --output extension)'
+    )
+    parser.add_argument(
+        '--flush-every',
+        type=int,
+        default=100,
+        help='Flush JSON Lines output every N records (default: 100)'
+    )
+    parser.add_argument(
+        '--fsync',
+        action='store_true',
+        help='fsync JSON Lines output on every flush'
+    )
+    parser.add_argument(
+        '--compact-json',
+        action='store_true',
+        help='Write JSON result files without indentation (default: JSON_PRETTY)'
+    )
+    
+    # Add response cache arguments
+    parser.add_argument(
+        '--cache-path',
+        default=os.getenv("RESPONSE_CACHE_PATH") or DEFAULT_CACHE_PATH,
+        help=f'SQLite file used to cache API responses (default: RESPONSE_CACHE_PATH or {DEFAULT_CACHE_PATH})'
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the response cache entirely'
+    )
+    cache_group.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help='Ignore cached responses but store fresh ones'
+    )
+    
+    # Add client-side rate limit arguments
+    parser.add_argument(
+        '--requests-per-minute',
+        type=float,
+        help='Maximum API requests per minute across all workers (default: RATE_LIMIT_REQUESTS_PER_MINUTE or unlimited)'
+    )
+    parser.add_argument(
+        '--tokens-per-minute',
+        type=float,
+        help='Maximum API tokens per minute across all workers (default: RATE_LIMIT_TOKENS_PER_MINUTE or unlimited)'
+    )
+    
+    # Add structured output argument
+    parser.add_argument(
+        '--structured',
+        action='store_true',
+        help='Ask the API for JSON matching the company record schema (default: STRUCTURED_OUTPUT)'
+    )
+    
+    # Add speculative owners argument
+    parser.add_argument(
+        '--speculative',
+        action='store_true',
+        help='Send the owners prompt together with the company prompt to cut latency (default: SPECULATIVE_OWNERS)'
+    )
+    
+    # Add prompt style argument
+    parser.add_argument(
+        '--prompt-style',
+        choices=PROMPT_STYLES,
+        help='"compact" sends short JSON-only prompts with max_tokens sized to the record fields (default: PROMPT_STYLE or verbose)'
+    )
+    
+    # Add field selection argument
+    parser.add_argument(
+        '--fields',
+        type=parse_fields,
+        help=f'Comma-separated record fields to look up, e.g. "owners,management"; fewer fields mean '
+             f'shorter prompts and answers (default: LOOKUP_FIELDS or all of {",".join(COMPANY_FIELDS)})'
+    )
+    
+    # Add adaptive prompt strategy argument
+    parser.add_argument(
+        '--strategy-stats',
+        help='JSON file of per-bucket prompt statistics; enables the adaptive prompt strategy (default: STRATEGY_STATS_PATH)'
+    )
+    
+    # Add usage argument
+    parser.add_argument(
+        '--include-usage',
+        action='store_true',
+        help='Add each lookup\'s API requests, tokens and estimated cost to its result (default: INCLUDE_USAGE)'
+    )
+    
+    # Add metrics output arguments
+    parser.add_argument(
+        '--metrics-json',
+        help='Write per-stage timings and counters as a JSON summary to this file (default: METRICS_JSON_PATH)'
+    )
+    parser.add_argument(
+        '--metrics-prometheus',
+        help='Write per-stage timings and counters in the Prometheus text format to this file (default: METRICS_PROMETHEUS_PATH)'
+    )
+    
+    # Add console output arguments
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Print only failures and the final summary instead of a report per URL'
+    )
+    parser.add_argument(
+        '--progress',
+        action='store_true',
+        help='Show a single progress line with rate and ETA on stderr instead of a report per URL'
+    )
+    parser.add_argument(
+        '--log-format',
+        choices=['text', 'json'],
+        default='text',
+        help='"json" prints one compact JSON line per URL and a JSON summary (default: text)'
+    )
+    
     # Create a mutually exclusive group for input types
     input_group = parser.add_mutually_exclusive_group(required=True)
     input_group.add_argument(
@@ -197,7 +617,7 @@ Examples:
     )
     input_group.add_argument(
         '--file',
-        help='Text file containing URLs (one per line)'
+        help='File containing URLs: .txt (one per line) or .csv, optionally gzipped; "-" reads stdin'
     )
 
     args = parser.parse_args()
@@ -206,6 +626,55 @@ Examples:
     if args.api_key:
         set_api_key_from_command_line(args.api_key)
 
+    # Configure the response cache
+    if args.no_cache:
+        cache_mode = "off"
+    elif args.refresh_cache:
+        cache_mode = "refresh"
+    else:
+        cache_mode = None
+    set_cache_options_from_command_line(path=args.cache_path, mode=cache_mode)
+
+    # Configure client-side rate limits
+    set_rate_limits_from_command_line(
+        requests_per_minute=args.requests_per_minute, tokens_per_minute=args.tokens_per_minute
+    )
+
+    # Write compact JSON result files if requested
+    if args.compact_json:
+        set_json_pretty_from_command_line(False)
+
+    # Enable structured output if requested
+    if args.structured:
+        set_structured_output_from_command_line(True)
+
+    # Enable speculative owners queries if requested
+    if args.speculative:
+        set_speculative_owners_from_command_line(True)
+
+    # Select the prompt style if requested
+    if args.prompt_style:
+        set_prompt_style_from_command_line(args.prompt_style)
+
+    # Limit lookups to the requested fields
+    if args.fields:
+        set_lookup_fields_from_command_line(args.fields)
+
+    # Enable the adaptive prompt strategy if requested
+    if args.strategy_stats:
+        set_strategy_stats_path_from_command_line(args.strategy_stats)
+
+    # Attach token usage to results if requested
+    if args.include_usage:
+        set_include_usage_from_command_line(True)
+
+    # Enable instrumentation if a metrics file is requested
+    set_metrics_paths_from_command_line(json_path=args.metrics_json, prometheus_path=args.metrics_prometheus)
+    configure_metrics()
+
+    # Show lookup messages unless a compact output mode was requested
+    configure_logging(show_lookup_messages=not (args.quiet or args.progress or args.log_format == "json"))
+
     # Determine the input to process
     if args.url:
         input_path = args.url
@@ -214,22 +683,36 @@ Examples:
     else:
         input_path = args.input
 
-    # Validate and process the input
-    if validate_url(input_path):
-        # Process single URL
-        success = process_single_url(input_path)
-        if not success:
-            sys.exit(1)
-    elif validate_file(input_path):
-        # Process URLs from file
-        success = process_urls_from_file(input_path)
-        if not success:
+    try:
+        # Validate and process the input
+        if validate_url(input_path):
+            # Process single URL
+            report = None if args.quiet else "json" if args.log_format == "json" else "text"
+            success = process_single_url(input_path, report=report)
+            metrics_registry.export()
+            if not success:
+                sys.exit(1)
+        elif validate_file(input_path):
+            # Process URLs from file
+            success = process_urls_from_file(
+                input_path, workers=args.workers, checkpoint_path=args.checkpoint, resume=args.resume,
+                output_format=args.output_format, output_path=args.output, compression=args.compression,
+                fsync=args.fsync, flush_every=args.flush_every, column=args.column, dedupe=not args.no_dedupe,
+                quiet=args.quiet, progress=args.progress, log_format=args.log_format
+            )
+            if not success:
+                sys.exit(1)
+        else:
+            print("Error: Input must be either:")
+            print("  - A valid URL starting with http:// or https://")
+            print("  - A .txt file containing URLs (one per line), or a .csv file, optionally gzipped")
+            print("  - '-' to read URLs from standard input")
             sys.exit(1)
-    else:
-        print("Error: Input must be either:")
-        print("  - A valid URL starting with http:// or https://")
-        print("  - A .txt file containing URLs (one per line)")
-        sys.exit(1)
+    finally:
+        # Persist what the adaptive prompt strategy learned in this run
+        strategy_stats = get_strategy_stats()
+        if strategy_stats is not None:
+            strategy_stats.save()
 
 
 if __name__ == "__main__":
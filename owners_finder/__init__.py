@@ -7,8 +7,31 @@ A modular Python application that uses the Perplexity AI API to find company own
 __version__ = "1.0.0"
 __author__ = "Company Owners Finder"
 
-from .parser import find_company_owners
-from .models import create_company_info, create_owner, create_management_info, create_executive_info
+from .parser import find_company_owners, find_company_owners_async
+from .models import (
+    Company,
+    Executive,
+    Management,
+    Owner,
+    create_company_info,
+    create_owner,
+    create_management_info,
+    create_executive_info,
+)
 from .utils import save_to_json
+from .memo import invalidate_lookup_memo
 
-__all__ = ["find_company_owners", "create_company_info", "create_owner", "create_management_info", "create_executive_info", "save_to_json"]
+__all__ = [
+    "find_company_owners",
+    "find_company_owners_async",
+    "Company",
+    "Owner",
+    "Executive",
+    "Management",
+    "create_company_info",
+    "create_owner",
+    "create_management_info",
+    "create_executive_info",
+    "save_to_json",
+    "invalidate_lookup_memo",
+]
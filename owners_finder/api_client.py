@@ -2,55 +2,330 @@
 Perplexity AI API client for the Company Owners Finder application.
 """
 
+import asyncio
 import json
+import threading
+import time
+import weakref
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+
+from owners_finder.cache import get_response_cache, make_cache_key
+from owners_finder.config import (
+    get_api_base_url,
+    get_api_headers,
+    get_cache_mode,
+    get_http2_enabled,
+    get_http_keepalive_expiry,
+    get_http_pool_size,
+    get_request_timeout,
+    get_single_flight_enabled,
+)
+from owners_finder.metrics import increment, timed
+from owners_finder.rate_limit import estimate_request_tokens, get_rate_limiter
+from owners_finder.retry import RetryState, get_retry_policy
+from owners_finder.serialization import dumps, loads
+from owners_finder.usage import record_api_usage
+from owners_finder.singleflight import AsyncSingleFlight, SingleFlight
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Shared connection pools, created lazily and reused by every call in the process
+_session = None
+_session_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+# Concurrent identical requests share one API call
+api_flight = SingleFlight()
+async_api_flight = AsyncSingleFlight()
+
+
+def get_session():
+    """
+    Get the process-wide requests session used for API calls.
+
+    The session keeps connections to the API host alive so the TCP and TLS
+    handshake is paid once per connection rather than once per request.
+    It is safe to share between threads.
 
-from owners_finder.config import get_api_base_url, get_api_headers, get_request_timeout
+    Returns:
+        requests.Session: The shared session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = get_http_pool_size()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=False)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def get_async_client():
+    """
+    Get the shared httpx client for the running event loop.
 
+    httpx clients are bound to the loop they were first used on, so one
+    client is kept per loop. HTTP/2 is enabled when the h2 package is
+    installed and HTTP2_ENABLED is not turned off.
 
-def call_perplexity_api(prompt, model="sonar-pro"):
+    Returns:
+        httpx.AsyncClient: The shared async client
     """
-    Call the Perplexity AI API with a given prompt.
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        pool_size = get_http_pool_size()
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=get_http_keepalive_expiry(),
+        )
+        client = httpx.AsyncClient(
+            timeout=get_request_timeout(), limits=limits, http2=HTTP2_AVAILABLE and get_http2_enabled()
+        )
+        _async_clients[loop] = client
+    return client
+
+
+def close_session():
+    """Close the shared requests session so the next call opens a fresh pool."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+async def close_async_client():
+    """Close the shared httpx client of the running event loop, if any."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+SYSTEM_MESSAGE = "You are a helpful AI assistant that provides accurate information about companies. Always provide information in a structured format."
+COMPACT_SYSTEM_MESSAGE = "Answer with one JSON object only, no other text."
+
+DEFAULT_MAX_TOKENS = 1000
+
+# Fields of a company record that prompts can ask for
+COMPANY_FIELDS = ("company_name", "description", "owners", "management", "industry", "founded_year", "headquarters")
+OWNERS_FIELDS = ("owners", "management")
+
+# How verbose prompts ask for each field, and how they describe its JSON key
+VERBOSE_FIELD_QUESTIONS = {
+    "company_name": "Company name",
+    "description": "Brief description of what the company does (1-2 sentences)",
+    "owners": "List of owners/founders with their names and titles",
+    "management": "Management information (CEO, CFO, COO with names and titles)",
+    "industry": "Industry/sector",
+    "founded_year": "Year founded (if available)",
+    "headquarters": "Headquarters location (if available)",
+}
+VERBOSE_FIELD_KEYS = {
+    "owners": "owners (array of objects with name, title, ownership_percentage)",
+    "management": "management (object with ceo, cfo, coo - each containing name and title)",
+}
+
+MANAGEMENT_INSTRUCTIONS = """- ceo: CEO information (name and title)
+- cfo: CFO information (name and title) if available
+- coo: COO information (name and title) if available
+"""
+OWNER_INSTRUCTIONS = """- title: Their role/title (Founder, Owner, Major Shareholder, etc.)
+- ownership_percentage: Their ownership stake if publicly known (or null if unknown)
+"""
+
+# How compact prompts describe each field
+COMPACT_FIELD_DESCRIPTIONS = {
+    "company_name": "company_name",
+    "description": "description (1-2 sentences)",
+    "owners": "owners (array of {name, title, ownership_percentage or null})",
+    "management": "management ({ceo, cfo, coo}, each {name, title}; omit unknown roles)",
+    "industry": "industry",
+    "founded_year": "founded_year",
+    "headquarters": "headquarters (city, country)",
+}
+
+# Completion tokens allowed per field of a JSON answer; generous, since a cut-off answer is lost
+FIELD_TOKEN_BUDGETS = {
+    "company_name": 25,
+    "description": 100,
+    "owners": 300,
+    "management": 150,
+    "industry": 20,
+    "founded_year": 10,
+    "headquarters": 25,
+}
+JSON_TOKEN_OVERHEAD = 50
+
+
+def build_response_format(schema):
+    """
+    Build the response_format request field asking for JSON matching a schema.
 
     Args:
-        prompt (str): The prompt to send to the API
-        model (str): The model to use for the request
+        schema (dict): JSON schema of the expected response
 
     Returns:
-        dict: The API response
+        dict: The response_format value
+    """
+    return {"type": "json_schema", "json_schema": {"schema": schema}}
 
-    Raises:
-        requests.RequestException: If the API call fails
-        ValueError: If the response is invalid
+
+def build_payload(
+    prompt, model="sonar-pro", response_format=None, max_tokens=DEFAULT_MAX_TOKENS, system_message=SYSTEM_MESSAGE
+):
     """
-    url = f"{get_api_base_url()}/chat/completions"
+    Build the chat completions request body for a prompt.
 
+    Args:
+        prompt (str): The prompt to send to the API
+        model (str): The model to use for the request
+        response_format (dict, optional): Structured output format, see build_response_format
+        max_tokens (int): Maximum completion tokens, see get_max_tokens
+        system_message (str): The system message
+
+    Returns:
+        dict: The request payload
+    """
     payload = {
         "model": model,
         "messages": [
             {
                 "role": "system",
-                "content": "You are a helpful AI assistant that provides accurate information about companies. Always provide information in a structured format.",
+                "content": system_message,
             },
             {"role": "user", "content": prompt},
         ],
-        "max_tokens": 1000,
+        "max_tokens": max_tokens,
         "temperature": 0.2,
         "top_p": 0.9,
         "stream": False,
     }
+    if response_format is not None:
+        payload["response_format"] = response_format
+    return payload
+
+
+@timed("api_call")
+def call_perplexity_api(
+    prompt, model="sonar-pro", response_format=None, max_tokens=DEFAULT_MAX_TOKENS, system_message=SYSTEM_MESSAGE
+):
+    """
+    Call the Perplexity AI API with a given prompt.
+
+    Responses are served from and stored in the response cache when one is configured.
+    Live calls are paced by the shared rate limiter. Timeouts, connection errors and
+    retryable statuses are retried with exponential backoff and full jitter; 429
+    responses are retried after the server's Retry-After delay. Per-attempt timings
+    are available from owners_finder.retry.get_last_attempts.
+
+    Args:
+        prompt (str): The prompt to send to the API
+        model (str): The model to use for the request
+        response_format (dict, optional): Structured output format, see build_response_format
+        max_tokens (int): Maximum completion tokens, see get_max_tokens
+        system_message (str): The system message
+
+    Returns:
+        dict: The API response
+
+    Raises:
+        requests.RequestException: If the API call fails
+        ValueError: If the response is invalid
+    """
+    payload = build_payload(prompt, model, response_format, max_tokens, system_message)
+
+    if get_single_flight_enabled():
+        # Callers sending the same request while it is in flight receive a copy of its response
+        return api_flight.do(make_cache_key(payload), request_chat_completion, payload)
+    return request_chat_completion(payload)
+
+
+def request_chat_completion(payload):
+    """
+    Send a chat completions request through the response cache, rate limiter and retry policy.
+
+    Args:
+        payload (dict): The request body, see build_payload
+
+    Returns:
+        dict: The API response
+
+    Raises:
+        requests.RequestException: If the API call fails
+        ValueError: If the response is invalid
+    """
+    url = f"{get_api_base_url()}/chat/completions"
+
+    cache = get_response_cache()
+    cache_key = make_cache_key(payload) if cache is not None else None
+    if cache is not None and get_cache_mode() == "use":
+        cached_response = cache.get(cache_key)
+        if cached_response:
+            increment("api_cache_hits")
+            record_api_usage(payload.get("model"), cached_response, cached=True)
+            return cached_response
+
+    limiter = get_rate_limiter()
+    estimated_tokens = estimate_request_tokens(payload)
+    retry_state = RetryState(get_retry_policy())
+    body = dumps(payload)
 
     try:
-        response = requests.post(url, headers=get_api_headers(), json=payload, timeout=get_request_timeout())
+        while True:
+            limiter.acquire(estimated_tokens)
+            attempt_started = retry_state.start_attempt()
+            try:
+                response = get_session().post(
+                    url, headers=get_api_headers(), data=body, timeout=get_request_timeout()
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                retry_state.record(attempt_started, error=e)
+                delay = retry_state.next_delay()
+                if delay is None:
+                    raise
+                increment("api_retries")
+                time.sleep(delay)
+                continue
+
+            retry_state.record(attempt_started, status=response.status_code)
+            if not retry_state.is_retryable_status(response.status_code):
+                break
+
+            retry_after = limiter.on_rate_limited(response.headers) if response.status_code == 429 else None
+            delay = retry_state.next_delay(status=response.status_code, retry_after=retry_after)
+            if delay is None:
+                break
+            increment("api_retries")
+            time.sleep(delay)
+
         response.raise_for_status()
+        limiter.on_response(response.headers)
 
-        response_data = response.json()
+        response_data = loads(response.content)
 
         # Debug: Check if we got a valid response
         if not response_data:
             raise ValueError("Empty response from API")
 
+        limiter.record_usage(estimated_tokens, get_total_tokens(response_data))
+        record_api_usage(payload.get("model"), response_data)
+
+        if cache is not None:
+            cache.set(cache_key, response_data)
+
         return response_data
 
     except requests.RequestException as e:
@@ -59,55 +334,281 @@ def call_perplexity_api(prompt, model="sonar-pro"):
         raise ValueError(f"Invalid JSON response: {str(e)}")
 
 
-def create_company_prompt(website_url):
+@timed("api_call")
+async def call_perplexity_api_async(
+    prompt, model="sonar-pro", response_format=None, max_tokens=DEFAULT_MAX_TOKENS, system_message=SYSTEM_MESSAGE
+):
+    """
+    Call the Perplexity AI API with a given prompt without blocking the event loop.
+
+    Args:
+        prompt (str): The prompt to send to the API
+        model (str): The model to use for the request
+        response_format (dict, optional): Structured output format, see build_response_format
+        max_tokens (int): Maximum completion tokens, see get_max_tokens
+        system_message (str): The system message
+
+    Returns:
+        dict: The API response
+
+    Raises:
+        requests.RequestException: If the API call fails
+        ValueError: If the response is invalid
+    """
+    payload = build_payload(prompt, model, response_format, max_tokens, system_message)
+
+    if get_single_flight_enabled():
+        return await async_api_flight.do(make_cache_key(payload), request_chat_completion_async, payload)
+    return await request_chat_completion_async(payload)
+
+
+async def request_chat_completion_async(payload):
+    """
+    Send a chat completions request without blocking the event loop.
+
+    Args:
+        payload (dict): The request body, see build_payload
+
+    Returns:
+        dict: The API response
+
+    Raises:
+        requests.RequestException: If the API call fails
+        ValueError: If the response is invalid
+    """
+    url = f"{get_api_base_url()}/chat/completions"
+
+    # SQLite access runs in a worker thread so it never stalls the event loop
+    cache = get_response_cache()
+    cache_key = make_cache_key(payload) if cache is not None else None
+    if cache is not None and get_cache_mode() == "use":
+        cached_response = await asyncio.to_thread(cache.get, cache_key)
+        if cached_response:
+            increment("api_cache_hits")
+            record_api_usage(payload.get("model"), cached_response, cached=True)
+            return cached_response
+
+    limiter = get_rate_limiter()
+    estimated_tokens = estimate_request_tokens(payload)
+    retry_state = RetryState(get_retry_policy())
+    body = dumps(payload)
+
+    try:
+        while True:
+            delay = limiter.reserve(estimated_tokens)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            attempt_started = retry_state.start_attempt()
+            try:
+                response = await get_async_client().post(url, headers=get_api_headers(), content=body)
+            except httpx.TransportError as e:
+                retry_state.record(attempt_started, error=e)
+                delay = retry_state.next_delay()
+                if delay is None:
+                    raise
+                increment("api_retries")
+                await asyncio.sleep(delay)
+                continue
+
+            retry_state.record(attempt_started, status=response.status_code)
+            if not retry_state.is_retryable_status(response.status_code):
+                break
+
+            retry_after = limiter.on_rate_limited(response.headers) if response.status_code == 429 else None
+            delay = retry_state.next_delay(status=response.status_code, retry_after=retry_after)
+            if delay is None:
+                break
+            increment("api_retries")
+            await asyncio.sleep(delay)
+
+        response.raise_for_status()
+        limiter.on_response(response.headers)
+
+        response_data = loads(response.content)
+
+        if not response_data:
+            raise ValueError("Empty response from API")
+
+        limiter.record_usage(estimated_tokens, get_total_tokens(response_data))
+        record_api_usage(payload.get("model"), response_data)
+
+        if cache is not None:
+            await asyncio.to_thread(cache.set, cache_key, response_data)
+
+        return response_data
+
+    except httpx.HTTPError as e:
+        # Surface the same exception type as the synchronous client
+        raise requests.RequestException(f"API call failed: {str(e)}")
+    except (json.JSONDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid JSON response: {str(e)}")
+
+
+def get_total_tokens(api_response):
+    """
+    Read the total token count reported in an API response.
+
+    Args:
+        api_response (dict): The raw API response
+
+    Returns:
+        int or None: Total tokens, or None if the response has no usage block
+    """
+    usage = api_response.get("usage") if isinstance(api_response, dict) else None
+    if isinstance(usage, dict) and isinstance(usage.get("total_tokens"), int):
+        return usage["total_tokens"]
+    return None
+
+
+def create_company_prompt(website_url, fields=COMPANY_FIELDS):
     """
     Create a prompt for finding company owners and information.
 
     Args:
         website_url (str): The company website URL
+        fields (tuple): Record fields to ask for, see get_prompt_fields
 
     Returns:
         str: The formatted prompt
     """
-    return f"""
+    questions = "\n".join(f"{number}. {VERBOSE_FIELD_QUESTIONS[field]}" for number, field in enumerate(fields, 1))
+    keys = "\n".join(f"- {VERBOSE_FIELD_KEYS.get(field, field)}" for field in fields)
+    prompt = f"""
 Please analyze the company website at {website_url}, then find and provide the following information in JSON format:
 
-1. Company name
-2. Brief description of what the company does (1-2 sentences)
-3. List of owners/founders with their names and titles
-4. Management information (CEO, CFO, COO with names and titles)
-5. Industry/sector
-6. Year founded (if available)
-7. Headquarters location (if available)
+{questions}
 
 Please format the response as a JSON object with these exact keys:
-- company_name
-- description
-- owners (array of objects with name, title, ownership_percentage)
-- management (object with ceo, cfo, coo - each containing name and title)
-- industry
-- founded_year
-- headquarters
+{keys}
+
+"""
+    if "management" in fields:
+        prompt += f"""For the management section, please include:
+{MANAGEMENT_INSTRUCTIONS}
+If any management position is not available, omit that key from the management object. """
+    return prompt + "Focus on publicly available information about ownership, leadership, and company details.\n"
 
-For the management section, please include:
-- ceo: CEO information (name and title)
-- cfo: CFO information (name and title) if available
-- coo: COO information (name and title) if available
 
-If any management position is not available, omit that key from the management object. Focus on publicly available information about ownership, leadership, and company details.
+def create_combined_prompt(website_url, fields=COMPANY_FIELDS):
+    """
+    Create a single prompt asking for company information and a thorough ownership search.
+
+    Used instead of the company prompt for companies whose first answer rarely
+    names owners, so the owners-specific follow-up call is not needed.
+
+    Args:
+        website_url (str): The company website URL
+        fields (tuple): Record fields to ask for; must include "owners"
+
+    Returns:
+        str: The formatted prompt
+    """
+    return create_company_prompt(website_url, fields) + """
+Ownership often is not stated on the company website itself. Before answering, search specifically for the
+owners, founders, major shareholders and any parent company, for example in news coverage, company registries
+and funding announcements. Each owner object should include:
+- name: Full name of the owner/founder (or the parent company)
+- title: Their role/title (Founder, Owner, Major Shareholder, Parent Company, etc.)
+- ownership_percentage: Their ownership stake if publicly known (or null if unknown)
 """
 
 
-def create_owners_prompt(company_name):
+def get_prompt_fields(fields=None, default=COMPANY_FIELDS):
+    """
+    Normalize a selection of record fields.
+
+    Args:
+        fields (iterable, optional): Field names; default when omitted
+        default (tuple): Fields used when none are given
+
+    Returns:
+        tuple: The fields in record order
+
+    Raises:
+        ValueError: If a field is unknown or no field is selected
+    """
+    if fields is None:
+        return default
+    fields = set(fields)
+    if not fields:
+        raise ValueError(f"No fields selected. Expected some of: {', '.join(COMPANY_FIELDS)}")
+    unknown = fields - set(COMPANY_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}. Expected: {', '.join(COMPANY_FIELDS)}")
+    return tuple(field for field in COMPANY_FIELDS if field in fields)
+
+
+def get_max_tokens(fields):
+    """
+    Get the completion token limit for a JSON answer with the given fields.
+
+    Args:
+        fields (iterable): Requested record fields
+
+    Returns:
+        int: max_tokens for the request
+    """
+    return JSON_TOKEN_OVERHEAD + sum(FIELD_TOKEN_BUDGETS[field] for field in fields)
+
+
+def create_compact_company_prompt(website_url, fields=COMPANY_FIELDS, thorough_owners=False):
+    """
+    Create a short prompt asking only for the given company fields as JSON.
+
+    Args:
+        website_url (str): The company website URL
+        fields (tuple): Record fields to ask for, see get_prompt_fields
+        thorough_owners (bool): Ask for an ownership search beyond the website, as create_combined_prompt does
+
+    Returns:
+        str: The formatted prompt
+    """
+    keys = "; ".join(COMPACT_FIELD_DESCRIPTIONS[field] for field in fields)
+    prompt = f"Company website: {website_url}\nJSON keys: {keys}. Use null if unknown."
+    if thorough_owners and "owners" in fields:
+        prompt += " For owners, also check registries and news for founders, major shareholders and any parent company."
+    return prompt
+
+
+def create_compact_owners_prompt(company_name, fields=OWNERS_FIELDS):
+    """
+    Create a short prompt asking only for the given owners and management fields as JSON.
+
+    Args:
+        company_name (str): The company name
+        fields (tuple): Record fields to ask for, normally a subset of OWNERS_FIELDS
+
+    Returns:
+        str: The formatted prompt
+    """
+    keys = "; ".join(COMPACT_FIELD_DESCRIPTIONS[field] for field in fields)
+    subject = "Owners and management" if "management" in fields else "Owners"
+    return f"{subject} of {company_name}\nJSON keys: {keys}. Use null if unknown."
+
+
+def create_owners_prompt(company_name, fields=OWNERS_FIELDS):
     """
     Create a prompt specifically for finding company owners/founders and management.
 
     Args:
         company_name (str): The company name
+        fields (tuple): "owners", optionally with "management"
 
     Returns:
         str: The formatted prompt
     """
+    if "management" not in fields:
+        return f"""
+Find the owners of {company_name}.
+
+Please provide the response in JSON format with these exact keys:
+- owners (array of objects with name, title, ownership_percentage if known)
+
+Each owner object should include:
+- name: Full name of the owner/founder
+{OWNER_INSTRUCTIONS}
+Focus on ownership information that is publicly available.
+"""
     return f"""
 Find the owners and management information for {company_name}.
 
@@ -117,14 +618,9 @@ Please provide the response in JSON format with these exact keys:
 
 Each owner object should include:
 - name: Full name of the owner/founder
-- title: Their role/title (Founder, Owner, Major Shareholder, etc.)
-- ownership_percentage: Their ownership stake if publicly known (or null if unknown)
-
+{OWNER_INSTRUCTIONS}
 The management object should include:
-- ceo: CEO information (name and title)
-- cfo: CFO information (name and title) if available
-- coo: COO information (name and title) if available
-
+{MANAGEMENT_INSTRUCTIONS}
 If any management position is not available, omit that key from the management object. Focus on both ownership and leadership information that is publicly available.
 """
 
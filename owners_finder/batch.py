@@ -0,0 +1,90 @@
+"""
+Concurrent batch execution for the Company Owners Finder application.
+"""
+
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Number of recent lookup keys whose results are kept for reuse in one batch. Kept
+# small so long batches hold little in memory; a duplicate seen after its key was
+# dropped is looked up again, which the response cache usually answers.
+MAX_REMEMBERED_KEYS = 1000
+
+
+def iter_lookups(entries, lookup, workers=1, key=None, stats=None):
+    """
+    Run a lookup function over indexed URLs with a bounded worker pool.
+
+    Results are yielded in input order regardless of which lookup finishes
+    first, so indexed output files keep their numbering. At most
+    ``workers * 2`` lookups are queued at any time.
+
+    When key is given, URLs with the same key share a single lookup: the
+    lookup is called with the key instead of the URL and its result is fanned
+    out to every row with that key. Only the MAX_REMEMBERED_KEYS most recently
+    used keys are remembered.
+
+    Args:
+        entries (iterable): (index, url) pairs to process
+        lookup (callable): Function called with a single URL
+        workers (int): Number of concurrent lookups
+        key (callable, optional): Maps a URL to its deduplication key, e.g. canonicalize_url
+        stats (dict, optional): Updated with "lookups" and "reused" counts
+
+    Yields:
+        tuple: (index, url, result, error) where exactly one of result/error is set
+    """
+    if stats is not None:
+        stats.setdefault("lookups", 0)
+        stats.setdefault("reused", 0)
+
+    remembered = OrderedDict()
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    try:
+        for index, url in entries:
+            lookup_key = key(url) if key is not None else None
+            future = remembered.get(lookup_key) if key is not None else None
+
+            if future is not None:
+                remembered.move_to_end(lookup_key)
+                if stats is not None:
+                    stats["reused"] += 1
+            else:
+                target = lookup_key if key is not None else url
+                future = executor.submit(lookup, target) if executor else _run_now(lookup, target)
+                if stats is not None:
+                    stats["lookups"] += 1
+                if key is not None:
+                    remembered[lookup_key] = future
+                    if len(remembered) > MAX_REMEMBERED_KEYS:
+                        remembered.popitem(last=False)
+
+            pending.append((index, url, future))
+            if len(pending) >= max(1, workers * 2) or executor is None:
+                yield _collect(*pending.popleft())
+
+        while pending:
+            yield _collect(*pending.popleft())
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_now(lookup, url):
+    """Run a lookup in the calling thread and wrap the outcome in a completed future."""
+    future = Future()
+    try:
+        future.set_result(lookup(url))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _collect(index, url, future):
+    """Wait for a submitted lookup and return its result tuple."""
+    try:
+        return index, url, future.result(), None
+    except Exception as e:
+        return index, url, None, e
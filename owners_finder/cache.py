@@ -0,0 +1,167 @@
+"""
+Persistent response cache for the Company Owners Finder application.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from owners_finder.config import get_cache_max_entries, get_cache_path, get_cache_ttl
+from owners_finder.serialization import dumps, loads
+
+# Number of writes between eviction sweeps
+EVICT_INTERVAL = 100
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def make_cache_key(payload):
+    """
+    Create a content-addressed cache key for an API request payload.
+
+    The key covers everything that changes the answer: model, system message,
+    prompt, temperature, max_tokens and any other sampling options.
+
+    Args:
+        payload (dict): The request payload sent to the API
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    # Always the standard library, so keys stay the same whichever JSON backend is installed
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed store of API responses with TTL and size-based eviction.
+
+    A single connection is shared between threads and guarded by a lock.
+    """
+
+    def __init__(self, path, ttl=None, max_entries=None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path (str or Path): Database file location
+            ttl (float, optional): Seconds an entry stays valid, None for no expiry
+            max_entries (int, optional): Maximum number of stored entries, None for unlimited
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self.evict()
+
+    def get(self, key):
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): Cache key from make_cache_key
+
+        Returns:
+            dict or None: The cached response, or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            response, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+
+        return loads(response)
+
+    def set(self, key, response):
+        """
+        Store a response, evicting old entries periodically.
+
+        Args:
+            key (str): Cache key from make_cache_key
+            response (dict): The API response to store
+        """
+        now = time.time()
+        encoded = dumps(response).decode("utf-8")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, encoded, now, now),
+            )
+            self._writes += 1
+            should_evict = self._writes % EVICT_INTERVAL == 0
+
+        if should_evict:
+            self.evict()
+
+    def evict(self):
+        """Remove expired entries and trim the store to max_entries, least recently used first."""
+        with self._lock:
+            if self.ttl is not None:
+                self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,))
+
+            if self.max_entries is not None:
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+                excess = count - self.max_entries
+                if excess > 0:
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE key IN "
+                        "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                        (excess,),
+                    )
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return count
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def get_response_cache():
+    """
+    Get the shared response cache for the configured path.
+
+    Returns:
+        ResponseCache or None: The cache, or None if caching is disabled
+    """
+    global _cache
+    path = get_cache_path()
+    if not path:
+        return None
+
+    with _cache_lock:
+        if _cache is None or _cache.path != Path(path):
+            if _cache is not None:
+                _cache.close()
+            _cache = ResponseCache(path, ttl=get_cache_ttl(), max_entries=get_cache_max_entries())
+        return _cache
@@ -0,0 +1,117 @@
+"""
+URL canonicalization for the Company Owners Finder application.
+"""
+
+import ipaddress
+from urllib.parse import urlsplit
+
+# Public suffixes with more than one label. Covers the common second-level
+# registries; anything else is treated as a single-label TLD.
+MULTI_PART_SUFFIXES = frozenset(
+    {
+        "ac.uk", "co.uk", "gov.uk", "ltd.uk", "me.uk", "net.uk", "org.uk", "plc.uk",
+        "com.au", "net.au", "org.au", "edu.au", "gov.au", "asn.au", "id.au",
+        "co.nz", "net.nz", "org.nz", "govt.nz", "ac.nz",
+        "co.jp", "ne.jp", "or.jp", "ac.jp", "go.jp",
+        "co.kr", "or.kr", "ne.kr",
+        "com.br", "net.br", "org.br", "gov.br",
+        "com.cn", "net.cn", "org.cn", "gov.cn",
+        "com.hk", "org.hk", "net.hk",
+        "com.sg", "org.sg", "net.sg", "edu.sg",
+        "com.tw", "org.tw", "net.tw",
+        "co.in", "net.in", "org.in", "firm.in", "gen.in", "ind.in",
+        "co.za", "org.za", "net.za",
+        "com.mx", "org.mx", "net.mx",
+        "com.ar", "com.co", "com.pe", "com.ve", "com.ec", "com.uy", "com.py", "com.bo",
+        "com.tr", "org.tr", "net.tr",
+        "com.my", "net.my", "org.my",
+        "co.id", "or.id", "web.id",
+        "com.ph", "net.ph", "org.ph",
+        "com.vn", "net.vn",
+        "co.il", "org.il", "net.il",
+        "com.sa", "com.eg", "com.pk", "com.ng", "com.ua", "co.th", "in.th",
+        "co.at", "or.at", "com.pl", "net.pl", "org.pl", "com.es", "com.pt", "com.gr", "com.cy",
+    }
+)
+
+# Shared hosting domains where every subdomain belongs to a different customer
+# (the private part of the public suffix list). The label in front is kept,
+# so "foo.github.io" and "bar.github.io" stay distinct.
+SHARED_HOSTING_SUFFIXES = frozenset(
+    {
+        "github.io", "gitlab.io", "netlify.app", "vercel.app", "pages.dev", "workers.dev", "web.app",
+        "firebaseapp.com", "herokuapp.com", "appspot.com", "azurewebsites.net", "cloudfront.net",
+        "myshopify.com", "wordpress.com", "blogspot.com", "wixsite.com", "squarespace.com", "webflow.io",
+        "weebly.com", "tumblr.com", "substack.com", "carrd.co", "framer.website", "wpengine.com",
+    }
+)
+
+
+def get_registrable_domain(host):
+    """
+    Reduce a host name to its registrable domain.
+
+    Strips a port, a leading "www." and any subdomains, keeping one label in
+    front of the public suffix (e.g. "shop.example.co.uk" -> "example.co.uk").
+    Shared hosting domains count as suffixes, so "www.acme.github.io" becomes
+    "acme.github.io". IP addresses are returned unchanged.
+
+    Args:
+        host (str): Host name, optionally with a port
+
+    Returns:
+        str: Lower-cased registrable domain
+    """
+    host = host.strip().lower().rstrip(".")
+    if host.startswith("[") and "]" in host:
+        return host[: host.index("]") + 1]
+    host = host.split(":", 1)[0]
+
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        pass
+
+    labels = [label for label in host.split(".") if label]
+    if len(labels) <= 2:
+        return ".".join(labels)
+    suffix = ".".join(labels[-2:])
+    if suffix in MULTI_PART_SUFFIXES or suffix in SHARED_HOSTING_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def canonicalize_url(url):
+    """
+    Map a company URL to a canonical form shared by all its variants.
+
+    http/https, "www.", subdomains, trailing slashes, paths, queries and
+    fragments are all dropped, so "http://x.com", "https://www.x.com/" and
+    "https://x.com/about" all become "https://x.com". Sites on shared hosting
+    keep their own subdomain ("https://acme.myshopify.com").
+
+    Args:
+        url (str): The company website URL
+
+    Returns:
+        str: Canonical URL, or the input unchanged if it is not an http(s) URL
+    """
+    if not isinstance(url, str):
+        return url
+
+    stripped = url.strip()
+    if not stripped.lower().startswith(("http://", "https://")):
+        return url
+
+    try:
+        host = urlsplit(stripped).netloc
+    except ValueError:
+        return url
+
+    # Drop credentials if present
+    host = host.rsplit("@", 1)[-1]
+    if not host:
+        return url
+
+    return f"https://{get_registrable_domain(host)}"
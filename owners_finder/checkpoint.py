@@ -0,0 +1,134 @@
+"""
+Checkpoint journal for resumable batch runs in the Company Owners Finder application.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+from owners_finder.inputs import STDIN
+
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+
+
+def get_default_checkpoint_path(file_path):
+    """
+    Get the journal path used for a batch input file.
+
+    Args:
+        file_path (str): The batch input file
+
+    Returns:
+        str: Journal path next to the input file, or in the working directory for stdin
+    """
+    if file_path == STDIN:
+        return "stdin.checkpoint.jsonl"
+    return f"{file_path}.checkpoint.jsonl"
+
+
+def load_checkpoint(path):
+    """
+    Load the latest journal record for every batch index.
+
+    A truncated last line, as left behind by a crash mid-write, is ignored.
+
+    Args:
+        path (str): Journal path
+
+    Returns:
+        dict: Mapping of index to its most recent record
+    """
+    records = {}
+    if not os.path.exists(path):
+        return records
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and "index" in record:
+                records[record["index"]] = record
+
+    return records
+
+
+def get_completed_indexes(records, urls_by_index=None):
+    """
+    Get the batch indexes that finished successfully.
+
+    Args:
+        records (dict): Records from load_checkpoint
+        urls_by_index (dict, optional): Current index to URL mapping; entries whose
+            URL changed since the journal was written are not treated as completed
+
+    Returns:
+        set: Completed indexes
+    """
+    completed = set()
+    for index, record in records.items():
+        if record.get("status") != STATUS_SUCCESS:
+            continue
+        if urls_by_index is not None and urls_by_index.get(index) != record.get("url"):
+            continue
+        completed.add(index)
+    return completed
+
+
+class CheckpointJournal:
+    """
+    Append-only JSON Lines journal of batch results.
+
+    Every record is flushed as soon as it is written so an interrupted run
+    loses at most the entry that was being written.
+    """
+
+    def __init__(self, path, resume=False):
+        """
+        Open the journal.
+
+        Args:
+            path (str): Journal path
+            resume (bool): Append to an existing journal instead of starting a new one
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def record(self, index, url, status, output=None, error=None):
+        """
+        Append a result record.
+
+        Args:
+            index (int): Batch index of the URL
+            url (str): The processed URL
+            status (str): STATUS_SUCCESS or STATUS_FAILED
+            output (str, optional): Path of the written result
+            error (str, optional): Error message for failures
+        """
+        record = {
+            "index": index,
+            "url": url,
+            "status": status,
+            "output": str(output) if output is not None else None,
+            "error": error,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        """Close the journal file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -2,6 +2,7 @@
 Configuration management for the Company Owners Finder application.
 """
 
+import json
 import os
 
 from dotenv import load_dotenv
@@ -12,6 +13,54 @@ load_dotenv()
 # Global variable to store API key from command line
 _command_line_api_key = None
 
+# Global variables to store response cache options from command line
+_command_line_cache_path = None
+_command_line_cache_mode = None
+
+# Global variables to store rate limits from command line
+_command_line_requests_per_minute = None
+_command_line_tokens_per_minute = None
+
+# Global variable to store the structured output switch from command line
+_command_line_structured_output = None
+
+# Global variable to store the strategy statistics path from command line
+_command_line_strategy_stats_path = None
+
+# Global variable to store the speculative owners switch from command line
+_command_line_speculative_owners = None
+
+# Global variable to store the JSON output layout from command line
+_command_line_json_pretty = None
+
+# Global variables to store metrics output paths from command line
+_command_line_metrics_json_path = None
+_command_line_metrics_prometheus_path = None
+
+# Global variable to store the usage attachment switch from command line
+_command_line_include_usage = None
+
+# Global variable to store the prompt style from command line
+_command_line_prompt_style = None
+
+# Global variable to store the lookup fields from command line
+_command_line_lookup_fields = None
+
+CACHE_MODES = ("use", "refresh", "off")
+
+JSON_BACKENDS = ("auto", "orjson", "msgspec", "json")
+
+PROMPT_STYLES = ("verbose", "compact")
+
+# List prices in USD: "input"/"output" per million tokens, "request" per request (low search context)
+DEFAULT_USAGE_PRICES = {
+    "sonar": {"input": 1.0, "output": 1.0, "request": 0.005},
+    "sonar-pro": {"input": 3.0, "output": 15.0, "request": 0.006},
+}
+
+# Cache location used by the command line tool when none is configured
+DEFAULT_CACHE_PATH = os.path.join("results", ".cache", "responses.sqlite")
+
 
 def set_api_key_from_command_line(api_key):
     """Set the API key from command line argument."""
@@ -19,6 +68,71 @@ def set_api_key_from_command_line(api_key):
     _command_line_api_key = api_key
 
 
+def set_cache_options_from_command_line(path=None, mode=None):
+    """Set the response cache path and mode from command line arguments."""
+    global _command_line_cache_path, _command_line_cache_mode
+    if mode is not None and mode not in CACHE_MODES:
+        raise ValueError(f"Invalid cache mode: {mode}. Expected one of: {', '.join(CACHE_MODES)}")
+    _command_line_cache_path = path
+    _command_line_cache_mode = mode
+
+
+def set_rate_limits_from_command_line(requests_per_minute=None, tokens_per_minute=None):
+    """Set the client-side rate limits from command line arguments."""
+    global _command_line_requests_per_minute, _command_line_tokens_per_minute
+    _command_line_requests_per_minute = requests_per_minute
+    _command_line_tokens_per_minute = tokens_per_minute
+
+
+def set_structured_output_from_command_line(enabled):
+    """Enable or disable structured (JSON schema) output from command line argument."""
+    global _command_line_structured_output
+    _command_line_structured_output = enabled
+
+
+def set_strategy_stats_path_from_command_line(path):
+    """Set the prompt strategy statistics file from command line argument."""
+    global _command_line_strategy_stats_path
+    _command_line_strategy_stats_path = path
+
+
+def set_speculative_owners_from_command_line(enabled):
+    """Enable or disable the speculative owners query from command line argument."""
+    global _command_line_speculative_owners
+    _command_line_speculative_owners = enabled
+
+
+def set_json_pretty_from_command_line(pretty):
+    """Choose indented or compact JSON result files from command line argument."""
+    global _command_line_json_pretty
+    _command_line_json_pretty = pretty
+
+
+def set_metrics_paths_from_command_line(json_path=None, prometheus_path=None):
+    """Set the metrics summary and Prometheus output files from command line arguments."""
+    global _command_line_metrics_json_path, _command_line_metrics_prometheus_path
+    _command_line_metrics_json_path = json_path
+    _command_line_metrics_prometheus_path = prometheus_path
+
+
+def set_include_usage_from_command_line(enabled):
+    """Enable or disable attaching token usage to results from command line argument."""
+    global _command_line_include_usage
+    _command_line_include_usage = enabled
+
+
+def set_prompt_style_from_command_line(style):
+    """Set the prompt style from command line argument."""
+    global _command_line_prompt_style
+    _command_line_prompt_style = style
+
+
+def set_lookup_fields_from_command_line(fields):
+    """Set the record fields to look up from command line argument."""
+    global _command_line_lookup_fields
+    _command_line_lookup_fields = fields
+
+
 def get_perplexity_api_key():
     """Get the Perplexity API key from command line argument or environment variables."""
     # First check if API key was provided via command line
@@ -42,6 +156,245 @@ def get_request_timeout():
     return int(os.getenv("REQUEST_TIMEOUT", "30"))
 
 
+def get_batch_workers():
+    """Get the number of concurrent lookups used for batch processing."""
+    return max(1, int(os.getenv("BATCH_WORKERS", "1")))
+
+
+def get_http_pool_size():
+    """Get the maximum number of pooled connections kept to the API host."""
+    return max(1, int(os.getenv("HTTP_POOL_SIZE", "10")))
+
+
+def get_http_keepalive_expiry():
+    """Get how long idle pooled connections are kept alive, in seconds."""
+    return float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+
+
+def get_http2_enabled():
+    """Check whether HTTP/2 should be used where the transport supports it."""
+    return os.getenv("HTTP2_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+def get_cache_mode():
+    """
+    Get the response cache mode.
+
+    "use" reads and writes the cache, "refresh" skips reads but stores fresh
+    responses, and "off" bypasses the cache entirely.
+    """
+    mode = _command_line_cache_mode or os.getenv("RESPONSE_CACHE_MODE", "use")
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Invalid cache mode: {mode}. Expected one of: {', '.join(CACHE_MODES)}")
+    return mode
+
+
+def get_cache_path():
+    """Get the response cache database path, or None if caching is disabled."""
+    if get_cache_mode() == "off":
+        return None
+    return _command_line_cache_path or os.getenv("RESPONSE_CACHE_PATH") or None
+
+
+def get_cache_ttl():
+    """Get the response cache entry lifetime in seconds, or None for no expiry."""
+    ttl = float(os.getenv("RESPONSE_CACHE_TTL", str(7 * 24 * 3600)))
+    return ttl if ttl > 0 else None
+
+
+def get_cache_max_entries():
+    """Get the maximum number of cached responses, or None for no limit."""
+    max_entries = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "100000"))
+    return max_entries if max_entries > 0 else None
+
+
+def get_requests_per_minute():
+    """Get the client-side request rate limit, or None for no limit."""
+    if _command_line_requests_per_minute is not None:
+        limit = _command_line_requests_per_minute
+    else:
+        limit = float(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "0"))
+    return limit if limit > 0 else None
+
+
+def get_tokens_per_minute():
+    """Get the client-side token rate limit, or None for no limit."""
+    if _command_line_tokens_per_minute is not None:
+        limit = _command_line_tokens_per_minute
+    else:
+        limit = float(os.getenv("RATE_LIMIT_TOKENS_PER_MINUTE", "0"))
+    return limit if limit > 0 else None
+
+
+def get_rate_limit_retries():
+    """Get how many times a rate limited (429) request is retried after waiting, separate from other retries."""
+    return max(0, int(os.getenv("RATE_LIMIT_RETRIES", "5")))
+
+
+def get_retry_max_attempts():
+    """Get the maximum number of attempts for a failing API call (1 disables retries)."""
+    return max(1, int(os.getenv("RETRY_MAX_ATTEMPTS", "3")))
+
+
+def get_retry_backoff_base():
+    """Get the base backoff delay in seconds; it doubles after every failure."""
+    return float(os.getenv("RETRY_BACKOFF_BASE", "0.5"))
+
+
+def get_retry_backoff_cap():
+    """Get the maximum backoff delay in seconds."""
+    return float(os.getenv("RETRY_BACKOFF_CAP", "30"))
+
+
+def get_retry_deadline():
+    """Get the total time budget in seconds for an API call and its retries, or None for no limit."""
+    deadline = float(os.getenv("RETRY_DEADLINE", "120"))
+    return deadline if deadline > 0 else None
+
+
+def get_retry_statuses():
+    """Get the HTTP status codes that are retried."""
+    statuses = os.getenv("RETRY_STATUSES", "408,425,429,500,502,503,504")
+    return frozenset(int(status) for status in statuses.split(",") if status.strip())
+
+
+def get_structured_output_enabled():
+    """Check whether the API is asked for JSON matching the company record schema."""
+    if _command_line_structured_output is not None:
+        return _command_line_structured_output
+    return os.getenv("STRUCTURED_OUTPUT", "false").lower() in ("1", "true", "yes")
+
+
+def get_strategy_stats_path():
+    """Get the prompt strategy statistics file, or None if the adaptive strategy is disabled."""
+    return _command_line_strategy_stats_path or os.getenv("STRATEGY_STATS_PATH") or None
+
+
+def get_strategy_min_samples():
+    """Get how many lookups a bucket needs before its statistics change the prompt strategy."""
+    return max(1, int(os.getenv("STRATEGY_MIN_SAMPLES", "20")))
+
+
+def get_strategy_min_success_rate():
+    """Get the first-call owners rate below which a bucket switches to the combined prompt."""
+    return float(os.getenv("STRATEGY_MIN_SUCCESS_RATE", "0.3"))
+
+
+def get_strategy_explore_rate():
+    """Get the share of lookups in switched buckets that still try the standard prompt."""
+    return min(1.0, max(0.0, float(os.getenv("STRATEGY_EXPLORE_RATE", "0.1"))))
+
+
+def get_speculative_owners_enabled():
+    """Check whether the owners prompt is sent alongside the company prompt instead of after it."""
+    if _command_line_speculative_owners is not None:
+        return _command_line_speculative_owners
+    return os.getenv("SPECULATIVE_OWNERS", "false").lower() in ("1", "true", "yes")
+
+
+def get_single_flight_enabled():
+    """Check whether concurrent identical lookups and API requests share one in-flight call."""
+    return os.getenv("SINGLE_FLIGHT", "true").lower() in ("1", "true", "yes")
+
+
+def get_json_backend():
+    """
+    Get the JSON library used for API payloads, cached responses and result files.
+
+    "auto" picks orjson, then msgspec, whichever is installed, else the standard library.
+    """
+    backend = os.getenv("JSON_BACKEND", "auto").lower()
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Invalid JSON backend: {backend}. Expected one of: {', '.join(JSON_BACKENDS)}")
+    return backend
+
+
+def get_json_pretty():
+    """Check whether JSON result files are indented (the default) rather than compact."""
+    if _command_line_json_pretty is not None:
+        return _command_line_json_pretty
+    return os.getenv("JSON_PRETTY", "true").lower() in ("1", "true", "yes")
+
+
+def get_metrics_enabled():
+    """Check whether per-stage timings and counters are collected."""
+    return os.getenv("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+def get_metrics_json_path():
+    """Get the file the JSON metrics summary is written to, or None."""
+    return _command_line_metrics_json_path or os.getenv("METRICS_JSON_PATH") or None
+
+
+def get_metrics_prometheus_path():
+    """Get the file metrics are written to in the Prometheus text format, or None."""
+    return _command_line_metrics_prometheus_path or os.getenv("METRICS_PROMETHEUS_PATH") or None
+
+
+def get_prompt_style():
+    """
+    Get the prompt style.
+
+    "verbose" sends the detailed instructions with the default max_tokens.
+    "compact" sends short prompts that ask only for JSON, and max_tokens is
+    derived from the requested fields.
+    """
+    style = _command_line_prompt_style or os.getenv("PROMPT_STYLE", "verbose")
+    if style not in PROMPT_STYLES:
+        raise ValueError(f"Invalid prompt style: {style}. Expected one of: {', '.join(PROMPT_STYLES)}")
+    return style
+
+
+def get_lookup_fields():
+    """
+    Get the record fields lookups ask for.
+
+    Returns:
+        tuple or None: Field names from the command line or LOOKUP_FIELDS (comma-separated),
+            or None for the full record
+    """
+    if _command_line_lookup_fields is not None:
+        return tuple(_command_line_lookup_fields)
+    fields = [field.strip() for field in os.getenv("LOOKUP_FIELDS", "").split(",") if field.strip()]
+    return tuple(fields) or None
+
+
+def get_include_usage_enabled():
+    """Check whether each result gets a "usage" entry with its requests, tokens and estimated cost."""
+    if _command_line_include_usage is not None:
+        return _command_line_include_usage
+    return os.getenv("INCLUDE_USAGE", "false").lower() in ("1", "true", "yes")
+
+
+def get_usage_prices():
+    """
+    Get the prices used for cost estimates.
+
+    USAGE_PRICES holds a JSON object of per-model prices that replace or add
+    to DEFAULT_USAGE_PRICES, e.g. {"sonar-pro": {"input": 3, "output": 15, "request": 0.01}}.
+    """
+    prices = dict(DEFAULT_USAGE_PRICES)
+    overrides = os.getenv("USAGE_PRICES")
+    if overrides:
+        try:
+            prices.update(json.loads(overrides))
+        except (json.JSONDecodeError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid USAGE_PRICES: {e}")
+    return prices
+
+
+def get_lookup_memo_max_entries():
+    """Get the number of lookup results kept in memory, or None to disable the in-process memo."""
+    max_entries = int(os.getenv("LOOKUP_MEMO_MAX_ENTRIES", "0"))
+    return max_entries if max_entries > 0 else None
+
+
+def get_lookup_memo_ttl():
+    """Get how long an in-memory lookup result stays valid in seconds, or None for no expiry."""
+    ttl = float(os.getenv("LOOKUP_MEMO_TTL", "3600"))
+    return ttl if ttl > 0 else None
+
+
 def get_api_headers():
     """Get headers for API requests."""
     return {"Authorization": f"Bearer {get_perplexity_api_key()}", "Content-Type": "application/json"}
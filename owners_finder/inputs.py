@@ -0,0 +1,140 @@
+"""
+Streaming URL input readers for the Company Owners Finder application.
+"""
+
+import csv
+import gzip
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+STDIN = "-"
+
+# Header names recognized as the URL column of a CSV file
+URL_COLUMN_NAMES = ("url", "website", "domain", "homepage")
+
+SUPPORTED_EXTENSIONS = (".txt", ".csv", ".txt.gz", ".csv.gz")
+
+
+def is_supported_input(file_path):
+    """
+    Check whether a path names a readable URL list.
+
+    Args:
+        file_path (str): Path, or "-" for standard input
+
+    Returns:
+        bool: True for stdin and for .txt/.csv files, optionally gzipped
+    """
+    if file_path == STDIN:
+        return True
+    return file_path.lower().endswith(SUPPORTED_EXTENSIONS)
+
+
+def get_input_name(file_path):
+    """
+    Get a short name for an input, used to derive output and checkpoint paths.
+
+    Args:
+        file_path (str): Path, or "-" for standard input
+
+    Returns:
+        str: The file name without .gz/.txt/.csv extensions, or "stdin"
+    """
+    if file_path == STDIN:
+        return "stdin"
+    name = Path(file_path).name
+    if name.lower().endswith(".gz"):
+        name = name[:-3]
+    return Path(name).stem
+
+
+def is_csv_input(file_path):
+    """Check whether an input path names a (possibly gzipped) CSV file."""
+    name = file_path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return name.endswith(".csv")
+
+
+def open_input(file_path):
+    """
+    Open an input as a text stream.
+
+    Args:
+        file_path (str): Path, or "-" for standard input; .gz files are decompressed
+
+    Returns:
+        context manager: Yields a text stream of lines
+    """
+    if file_path == STDIN:
+        # Closing the reader must not close the process's stdin
+        return nullcontext(sys.stdin)
+    if file_path.lower().endswith(".gz"):
+        return gzip.open(file_path, "rt", encoding="utf-8", newline="")
+    return open(file_path, "r", encoding="utf-8", newline="")
+
+
+def iter_urls(file_path, column=None):
+    """
+    Lazily yield URLs from a text file, CSV file, gzip file or standard input.
+
+    Lines are read one at a time so memory use stays flat regardless of input
+    size. Text inputs yield one URL per non-empty line. CSV inputs (a .csv name
+    or an explicit column) yield one URL per row from the selected column.
+
+    Args:
+        file_path (str): Path, or "-" for standard input
+        column (str or int, optional): CSV column name or zero-based index. By
+            default a url/website/domain/homepage header is used, otherwise the
+            first column.
+
+    Yields:
+        str: Stripped URLs
+    """
+    with open_input(file_path) as stream:
+        if column is not None or is_csv_input(file_path):
+            yield from _iter_csv_urls(stream, column)
+        else:
+            for line in stream:
+                url = line.strip()
+                if url:
+                    yield url
+
+
+def _iter_csv_urls(stream, column):
+    """Yield URLs from one column of a CSV stream, handling an optional header row."""
+    reader = csv.reader(stream)
+    first_row = next(reader, None)
+    if first_row is None:
+        return
+
+    header = [value.strip().lower() for value in first_row]
+    if isinstance(column, str) and not column.isdigit():
+        if column.lower() not in header:
+            raise ValueError(f"Column '{column}' not found in CSV header")
+        index = header.index(column.lower())
+        rows = reader
+    else:
+        if column is not None:
+            index = int(column)
+        else:
+            index = next((header.index(name) for name in URL_COLUMN_NAMES if name in header), 0)
+        # Treat the first row as a header unless it already holds a URL
+        first_value = first_row[index].strip() if index < len(first_row) else ""
+        has_header = (index < len(header) and header[index] in URL_COLUMN_NAMES) or not first_value.startswith(
+            ("http://", "https://")
+        )
+        rows = reader if has_header else _chain_row(first_row, reader)
+
+    for row in rows:
+        if index < len(row):
+            url = row[index].strip()
+            if url:
+                yield url
+
+
+def _chain_row(first_row, reader):
+    """Yield first_row followed by the remaining rows of reader."""
+    yield first_row
+    yield from reader
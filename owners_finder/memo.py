@@ -0,0 +1,140 @@
+"""
+In-process memo of company lookups for the Company Owners Finder application.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from owners_finder.canonical import canonicalize_url
+from owners_finder.config import get_lookup_memo_max_entries, get_lookup_memo_ttl
+
+_memo = None
+_memo_lock = threading.Lock()
+
+
+class LookupMemo:
+    """
+    Bounded least-recently-used store of lookup results with a per-entry lifetime.
+
+    Values are deep-copied on the way in and out, so callers can modify the
+    dictionaries they receive without affecting cached entries. Safe to share
+    between threads.
+    """
+
+    def __init__(self, max_entries, ttl=None):
+        """
+        Create an empty memo.
+
+        Args:
+            max_entries (int): Maximum number of entries; the least recently used is evicted beyond it
+            ttl (float, optional): Seconds an entry stays valid, None for no expiry
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def get(self, key):
+        """
+        Get a copy of a stored value.
+
+        Args:
+            key: Entry key; the first element of tuple keys is the canonical URL
+
+        Returns:
+            The stored value, or None if it is missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+        return copy.deepcopy(value)
+
+    def set(self, key, value):
+        """Store a copy of a value, evicting the least recently used entries beyond max_entries."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, website_url=None):
+        """
+        Drop stored lookups.
+
+        Args:
+            website_url (str, optional): Drop only entries for this company (any URL form);
+                all entries are dropped when omitted
+
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            if website_url is None:
+                keys = list(self._entries)
+            else:
+                canonical_url = canonicalize_url(website_url)
+                keys = [key for key in self._entries if _get_key_url(key) == canonical_url]
+            for key in keys:
+                del self._entries[key]
+            self.stats["invalidations"] += len(keys)
+        return len(keys)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+def _get_key_url(key):
+    """Get the canonical URL a memo key belongs to."""
+    return key[0] if isinstance(key, tuple) else key
+
+
+def get_lookup_memo():
+    """
+    Get the shared lookup memo.
+
+    Returns:
+        LookupMemo or None: The memo, or None if LOOKUP_MEMO_MAX_ENTRIES is not set
+    """
+    global _memo
+    max_entries = get_lookup_memo_max_entries()
+    if not max_entries:
+        return None
+
+    ttl = get_lookup_memo_ttl()
+    with _memo_lock:
+        if _memo is None or _memo.max_entries != max_entries or _memo.ttl != ttl:
+            _memo = LookupMemo(max_entries, ttl=ttl)
+        return _memo
+
+
+def invalidate_lookup_memo(website_url=None):
+    """
+    Drop memoized lookups, e.g. after a company's ownership is known to have changed.
+
+    Args:
+        website_url (str, optional): Drop only this company's entries; all entries when omitted
+
+    Returns:
+        int: Number of entries dropped
+    """
+    memo = get_lookup_memo()
+    return memo.invalidate(website_url) if memo is not None else 0
@@ -0,0 +1,338 @@
+"""
+Timing instrumentation for the Company Owners Finder application.
+
+Stages such as API calls and response parsing are timed into histograms,
+and notable events are counted. Results go to sinks, such as a Prometheus
+text file or a JSON summary. Instrumentation is off unless METRICS_ENABLED
+is set or a metrics file is configured; a disabled timer costs one flag check.
+"""
+
+import bisect
+import functools
+import inspect
+import json
+import threading
+import time
+from pathlib import Path
+
+from owners_finder.config import get_metrics_enabled, get_metrics_json_path, get_metrics_prometheus_path
+
+# Upper bounds of the histogram buckets in seconds, doubling from 10 microseconds to about three minutes
+BUCKETS = tuple(0.00001 * 2**exponent for exponent in range(25))
+
+METRIC_PREFIX = "owners_finder"
+
+
+class Histogram:
+    """Distribution of durations over the fixed BUCKETS."""
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds, error=False):
+        """Add one duration."""
+        self.bucket_counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.errors += int(error)
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, share):
+        """
+        Estimate a quantile by interpolating within its bucket.
+
+        Args:
+            share (float): Quantile between 0 and 1
+
+        Returns:
+            float or None: Estimated seconds, or None without observations
+        """
+        if not self.count:
+            return None
+        rank = share * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = BUCKETS[index - 1] if index else 0.0
+                upper = BUCKETS[index] if index < len(BUCKETS) else self.max
+                return min(self.max, lower + (upper - lower) * (rank - seen) / bucket_count)
+            seen += bucket_count
+        return self.max
+
+
+class MetricsRegistry:
+    """
+    Per-stage timings and event counters, shared between threads.
+
+    Sinks are callables receiving the registry; export calls each of them.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.histograms = {}
+        self.counters = {}
+        self.sinks = []
+
+    def observe(self, stage, seconds, error=False):
+        """Record the duration of one run of a stage."""
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.observe(seconds, error)
+
+    def increment(self, name, value=1):
+        """Add to an event counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def reset(self):
+        """Forget all timings and counts."""
+        with self._lock:
+            self.histograms = {}
+            self.counters = {}
+
+    def summary(self):
+        """
+        Summarize timings and counters.
+
+        Returns:
+            dict: "stages" maps each stage to its count, errors, total seconds and
+                mean/p50/p95/p99/max milliseconds; "counters" holds the event counters
+        """
+
+        def milliseconds(seconds):
+            return round(seconds * 1000, 3) if seconds is not None else None
+
+        with self._lock:
+            stages = {
+                stage: {
+                    "count": histogram.count,
+                    "errors": histogram.errors,
+                    "total_seconds": round(histogram.sum, 6),
+                    "mean_ms": milliseconds(histogram.sum / histogram.count),
+                    "p50_ms": milliseconds(histogram.quantile(0.50)),
+                    "p95_ms": milliseconds(histogram.quantile(0.95)),
+                    "p99_ms": milliseconds(histogram.quantile(0.99)),
+                    "max_ms": milliseconds(histogram.max),
+                }
+                for stage, histogram in sorted(self.histograms.items())
+            }
+            return {"stages": stages, "counters": dict(sorted(self.counters.items()))}
+
+    def add_sink(self, sink):
+        """Register a callable that receives the registry on export."""
+        self.sinks.append(sink)
+
+    def export(self):
+        """Pass the registry to every sink."""
+        for sink in self.sinks:
+            sink(self)
+
+
+registry = MetricsRegistry()
+
+
+class _Timer:
+    """Context manager timing one run of a stage."""
+
+    __slots__ = ("stage", "started")
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        registry.observe(self.stage, time.perf_counter() - self.started, error=exc_type is not None)
+
+
+class _NullTimer:
+    """Context manager used while instrumentation is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_null_timer = _NullTimer()
+
+
+def timer(stage):
+    """
+    Time a block of code as a stage.
+
+    Args:
+        stage (str): Stage name
+
+    Returns:
+        Context manager recording the duration, and an error if the block raises
+    """
+    return _Timer(stage) if registry.enabled else _null_timer
+
+
+def timed(stage):
+    """
+    Decorator timing every call of a function or coroutine function as a stage.
+
+    Args:
+        stage (str): Stage name
+    """
+
+    def decorator(function):
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                if not registry.enabled:
+                    return await function(*args, **kwargs)
+                with _Timer(stage):
+                    return await function(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return function(*args, **kwargs)
+            with _Timer(stage):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def increment(name, value=1):
+    """
+    Add to an event counter, if instrumentation is on.
+
+    Args:
+        name (str): Counter name, e.g. "api_retries"
+        value (int): Amount to add
+    """
+    if registry.enabled:
+        registry.increment(name, value)
+
+
+def format_prometheus(metrics_registry):
+    """
+    Render a registry in the Prometheus text exposition format.
+
+    Args:
+        metrics_registry (MetricsRegistry): The registry
+
+    Returns:
+        str: Histogram, error and counter series
+    """
+    with metrics_registry._lock:
+        histograms = sorted(metrics_registry.histograms.items())
+        counters = sorted(metrics_registry.counters.items())
+        lines = [
+            f"# HELP {METRIC_PREFIX}_stage_seconds Time spent per stage",
+            f"# TYPE {METRIC_PREFIX}_stage_seconds histogram",
+        ]
+        for stage, histogram in histograms:
+            cumulative = 0
+            for bound, bucket_count in zip(BUCKETS + (float("inf"),), histogram.bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(round(bound, 5))
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+            lines.append(f'{METRIC_PREFIX}_stage_seconds_sum{{stage="{stage}"}} {histogram.sum}')
+            lines.append(f'{METRIC_PREFIX}_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_stage_errors_total Stage runs that raised an exception",
+            f"# TYPE {METRIC_PREFIX}_stage_errors_total counter",
+        ]
+        lines += [f'{METRIC_PREFIX}_stage_errors_total{{stage="{stage}"}} {h.errors}' for stage, h in histograms]
+
+        for name, value in counters:
+            lines += [f"# TYPE {METRIC_PREFIX}_{name}_total counter", f"{METRIC_PREFIX}_{name}_total {value}"]
+    return "\n".join(lines) + "\n"
+
+
+def format_metrics_summary(summary):
+    """
+    Format a registry summary as a text table.
+
+    Args:
+        summary (dict): Result of MetricsRegistry.summary
+
+    Returns:
+        str: The table
+    """
+
+    def number(value):
+        return f"{value:.2f}" if value is not None else "-"
+
+    lines = [f"{'Stage':<22} {'Count':>7} {'Errors':>7} {'Total s':>9} {'Mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    for stage, row in summary["stages"].items():
+        lines.append(
+            f"{stage:<22} {row['count']:>7} {row['errors']:>7} {row['total_seconds']:>9.2f} {number(row['mean_ms']):>9} "
+            f"{number(row['p50_ms']):>9} {number(row['p95_ms']):>9} {number(row['p99_ms']):>9}"
+        )
+    for name, value in summary["counters"].items():
+        lines.append(f"{name}: {value}")
+    return "\n".join(lines)
+
+
+class PrometheusFileSink:
+    """Writes the registry to a file in the Prometheus text format, e.g. for the node exporter textfile collector."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def __call__(self, metrics_registry):
+        _write_atomically(self.path, format_prometheus(metrics_registry))
+
+
+class JsonFileSink:
+    """Writes the registry summary to a JSON file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def __call__(self, metrics_registry):
+        _write_atomically(self.path, json.dumps(metrics_registry.summary(), indent=2) + "\n")
+
+
+def _write_atomically(path, text):
+    """Replace a file's contents so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.tmp")
+    temporary_path.write_text(text, encoding="utf-8")
+    temporary_path.replace(path)
+
+
+def configure_metrics():
+    """
+    Apply the metrics configuration to the shared registry.
+
+    Turns instrumentation on when METRICS_ENABLED is set or a metrics file is
+    configured, and registers the file sinks.
+
+    Returns:
+        MetricsRegistry: The shared registry
+    """
+    json_path = get_metrics_json_path()
+    prometheus_path = get_metrics_prometheus_path()
+    registry.enabled = get_metrics_enabled() or bool(json_path or prometheus_path)
+    registry.sinks = []
+    if prometheus_path:
+        registry.add_sink(PrometheusFileSink(prometheus_path))
+    if json_path:
+        registry.add_sink(JsonFileSink(json_path))
+    return registry
+
+
+configure_metrics()
@@ -2,6 +2,134 @@
 Data structures for the Company Owners Finder application.
 """
 
+import inspect
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Owner:
+    """An owner or founder of a company."""
+
+    name: str
+    title: Optional[str] = None
+    ownership_percentage: Optional[str] = None
+
+    def to_dict(self):
+        """Convert to the owner dictionary used in results."""
+        return {"name": self.name, "title": self.title, "ownership_percentage": self.ownership_percentage}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create from an owner dictionary; unknown keys are ignored."""
+        return cls(data.get("name"), data.get("title"), data.get("ownership_percentage"))
+
+
+@dataclass(frozen=True, slots=True)
+class Executive:
+    """A member of a company's management."""
+
+    name: str
+    title: Optional[str] = None
+
+    def to_dict(self):
+        """Convert to the executive dictionary used in results."""
+        return {"name": self.name, "title": self.title}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create from an executive dictionary; unknown keys are ignored."""
+        return cls(data.get("name"), data.get("title"))
+
+
+@dataclass(frozen=True, slots=True)
+class Management:
+    """A company's CEO, CFO and COO, each optional."""
+
+    ceo: Optional[Executive] = None
+    cfo: Optional[Executive] = None
+    coo: Optional[Executive] = None
+
+    def to_dict(self):
+        """
+        Convert to the management dictionary used in results.
+
+        Returns:
+            dict or None: Only the known roles, or None if no role is known
+        """
+        management = {}
+        if self.ceo:
+            management["ceo"] = self.ceo.to_dict()
+        if self.cfo:
+            management["cfo"] = self.cfo.to_dict()
+        if self.coo:
+            management["coo"] = self.coo.to_dict()
+        return management or None
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create from a management dictionary; missing or empty roles are None."""
+        return cls(
+            _to_record(Executive, data.get("ceo")),
+            _to_record(Executive, data.get("cfo")),
+            _to_record(Executive, data.get("coo")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Company:
+    """
+    A company lookup result.
+
+    Uses far less memory than the equivalent result dictionary, for holding
+    many results at once. Convert with from_dict and to_dict.
+    """
+
+    company_name: str
+    website: str
+    description: str
+    owners: Tuple[Owner, ...] = ()
+    management: Optional[Management] = None
+    industry: Optional[str] = None
+    founded_year: Optional[str] = None
+    headquarters: Optional[str] = None
+
+    def to_dict(self):
+        """Convert to the company info dictionary used in results."""
+        return {
+            "company_name": self.company_name,
+            "website": self.website,
+            "description": self.description,
+            "owners": [owner.to_dict() for owner in self.owners],
+            "management": self.management.to_dict() if self.management else None,
+            "industry": self.industry,
+            "founded_year": self.founded_year,
+            "headquarters": self.headquarters,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create from a company info dictionary; unknown keys are ignored."""
+        return cls(
+            data.get("company_name"),
+            data.get("website"),
+            data.get("description"),
+            tuple(Owner.from_dict(owner) for owner in data.get("owners") or () if owner),
+            _to_record(Management, data.get("management")),
+            data.get("industry"),
+            data.get("founded_year"),
+            data.get("headquarters"),
+        )
+
+
+def _to_record(record_class, value):
+    """Convert a dictionary to a record, passing through records and empty values."""
+    if not value:
+        return None
+    if isinstance(value, dict):
+        return record_class.from_dict(value)
+    return value
+
 
 def create_owner(name, title=None, ownership_percentage=None):
     """Create an owner dictionary."""
@@ -46,6 +174,148 @@ def create_company_info(
     }
 
 
+def _get_fields(factory):
+    """Get the field names a create_* factory accepts and which of them are required."""
+    parameters = inspect.signature(factory).parameters.values()
+    return [p.name for p in parameters], [p.name for p in parameters if p.default is inspect.Parameter.empty]
+
+
+def _record_schema(factory, overrides=None, exclude=()):
+    """Build an object schema from a factory's fields; fields default to nullable strings."""
+    names, required = _get_fields(factory)
+    overrides = overrides or {}
+    properties = {
+        name: overrides.get(name, {"type": ["string", "null"]}) for name in names if name not in exclude
+    }
+    for name in required:
+        if name in properties and name not in overrides:
+            properties[name] = {"type": "string"}
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": [name for name in required if name in properties],
+        "additionalProperties": False,
+    }
+
+
+def _select_schema_fields(schema, fields):
+    """Restrict an object schema to the given properties."""
+    if fields is None:
+        return schema
+    return {
+        **schema,
+        "properties": {name: value for name, value in schema["properties"].items() if name in fields},
+        "required": [name for name in schema["required"] if name in fields],
+    }
+
+
+def get_owners_schema(fields=None):
+    """
+    Get the JSON schema of the owners and management part of a company record.
+
+    Args:
+        fields (iterable, optional): Restrict the schema to these fields, e.g. ("owners",)
+    """
+    executive = _record_schema(create_executive_info)
+    management_roles, _ = _get_fields(create_management_info)
+    management = {
+        "type": ["object", "null"],
+        # Missing roles may be omitted or null
+        "properties": {role: {**executive, "type": ["object", "null"]} for role in management_roles},
+        "additionalProperties": False,
+    }
+    schema = {
+        "type": "object",
+        "properties": {"owners": {"type": "array", "items": _record_schema(create_owner)}, "management": management},
+        "required": ["owners"],
+        "additionalProperties": False,
+    }
+    return _select_schema_fields(schema, fields)
+
+
+def get_company_info_schema(fields=None):
+    """
+    Get the JSON schema of a company record as returned by the API.
+
+    The schema is derived from create_company_info, so it follows the record
+    fields. The website is filled in locally and is not requested.
+
+    Args:
+        fields (iterable, optional): Restrict the schema to these record fields
+    """
+    owners_schema = get_owners_schema()
+    schema = _record_schema(create_company_info, overrides=owners_schema["properties"], exclude=("website",))
+    return _select_schema_fields(schema, fields)
+
+
+def select_company_fields(company_info, fields):
+    """
+    Keep only the requested record fields of a company info dictionary.
+
+    The website and any entries that are not record fields, such as "usage",
+    are always kept.
+
+    Args:
+        company_info (dict): Company information
+        fields (iterable): Record fields to keep
+
+    Returns:
+        dict: A new dictionary
+    """
+    record_fields, _ = _get_fields(create_company_info)
+    dropped = set(record_fields) - set(fields) - {"website"}
+    return {key: value for key, value in company_info.items() if key not in dropped}
+
+
+JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "null": type(None),
+}
+
+
+def validate_record(data, schema):
+    """
+    Check a parsed JSON value against the subset of JSON schema used by the record schemas.
+
+    Supports type (single or list), properties, required, additionalProperties
+    and items.
+
+    Args:
+        data: Parsed JSON value
+        schema (dict): Schema from get_company_info_schema or get_owners_schema
+
+    Returns:
+        bool: True if data matches the schema
+    """
+    types = schema.get("type")
+    if types is not None:
+        types = [types] if isinstance(types, str) else types
+        if not any(isinstance(data, JSON_TYPES[name]) for name in types):
+            return False
+        if isinstance(data, bool) and "boolean" not in types:
+            return False
+
+    if isinstance(data, dict):
+        properties = schema.get("properties", {})
+        if any(name not in data for name in schema.get("required", ())):
+            return False
+        for name, value in data.items():
+            if name in properties:
+                if not validate_record(value, properties[name]):
+                    return False
+            elif schema.get("additionalProperties", True) is False:
+                return False
+    elif isinstance(data, list) and "items" in schema:
+        return all(validate_record(item, schema["items"]) for item in data)
+
+    return True
+
+
 def validate_url(url):
     """Simple URL validation."""
     if not url or not isinstance(url, str):
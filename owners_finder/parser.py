@@ -2,99 +2,226 @@
 Parser module for extracting company information from Perplexity API responses.
 """
 
+import asyncio
+import contextvars
+import functools
 import json
+import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 import requests
 
-from owners_finder.api_client import call_perplexity_api, create_company_prompt, create_owners_prompt, extract_content_from_response
+from owners_finder.api_client import (
+    COMPACT_SYSTEM_MESSAGE,
+    COMPANY_FIELDS,
+    OWNERS_FIELDS,
+    build_response_format,
+    call_perplexity_api,
+    call_perplexity_api_async,
+    create_combined_prompt,
+    create_compact_company_prompt,
+    create_compact_owners_prompt,
+    create_company_prompt,
+    create_owners_prompt,
+    extract_content_from_response,
+    get_max_tokens,
+    get_prompt_fields,
+)
+from owners_finder.canonical import canonicalize_url
+from owners_finder.config import (
+    get_http_pool_size,
+    get_lookup_fields,
+    get_prompt_style,
+    get_single_flight_enabled,
+    get_speculative_owners_enabled,
+    get_structured_output_enabled,
+)
 from owners_finder.models import create_company_info, create_owner, validate_url, create_management_info, create_executive_info
+from owners_finder.models import get_company_info_schema, get_owners_schema, select_company_fields, validate_record
+from owners_finder.memo import get_lookup_memo
+from owners_finder.metrics import timed, timer
+from owners_finder.singleflight import AsyncSingleFlight, SingleFlight
+from owners_finder.strategy import STRATEGY_COMBINED, STRATEGY_STANDARD, get_strategy_stats
+from owners_finder.usage import attach_usage, record_lookup
 
+# Progress messages of lookups; worker threads log instead of printing so batch output stays readable
+logger = logging.getLogger(__name__)
 
-def find_company_owners(website_url):
+# Record schemas and request formats for structured output, built once
+COMPANY_INFO_SCHEMA = get_company_info_schema()
+OWNERS_SCHEMA = get_owners_schema()
+COMPANY_RESPONSE_FORMAT = build_response_format(COMPANY_INFO_SCHEMA)
+OWNERS_RESPONSE_FORMAT = build_response_format(OWNERS_SCHEMA)
+
+# Concurrent lookups of the same company share one lookup
+lookup_flight = SingleFlight()
+async_lookup_flight = AsyncSingleFlight()
+
+# Worker threads for speculative owners calls, created on first use
+_speculative_executor = None
+_speculative_executor_lock = threading.Lock()
+
+
+@attach_usage
+def find_company_owners(website_url, structured=None, speculative=None, fields=None):
     """
     Find company owners and information for a given website URL.
 
+    Concurrent calls for the same company (same canonical URL and options)
+    share one lookup; each caller receives its own copy of the result. When
+    LOOKUP_MEMO_MAX_ENTRIES is set, results are also remembered in memory.
+    With INCLUDE_USAGE, the usage entry covers only this call's API requests,
+    so a shared or remembered result reports none.
+
     Args:
         website_url (str): The company website URL
+        structured (bool, optional): Ask the API for JSON matching the company record
+            schema; defaults to the STRUCTURED_OUTPUT setting
+        speculative (bool, optional): Send the owners prompt together with the company
+            prompt instead of after it; defaults to the SPECULATIVE_OWNERS setting
+        fields (iterable, optional): Record fields to look up, e.g. ("owners",); the
+            result holds only these and the website. Defaults to the LOOKUP_FIELDS
+            setting, or the full record
 
     Returns:
         dict: Company information including owners
 
     Raises:
-        ValueError: If the URL is invalid
+        ValueError: If the URL or a field is invalid
         Exception: If the API call or parsing fails
     """
     # Validate the URL
     if not validate_url(website_url):
         raise ValueError(f"Invalid URL: {website_url}")
 
+    if structured is None:
+        structured = get_structured_output_enabled()
+    if speculative is None:
+        speculative = get_speculative_owners_enabled()
+    fields = get_prompt_fields(fields if fields is not None else get_lookup_fields())
+
+    key = (canonicalize_url(website_url), structured, speculative, fields)
+    memo = get_lookup_memo()
+    company_info = memo.get(key) if memo is not None else None
+
+    if company_info is None:
+        if get_single_flight_enabled():
+            company_info = lookup_flight.do(key, lookup_company_owners, website_url, structured, speculative, fields)
+        else:
+            company_info = lookup_company_owners(website_url, structured, speculative, fields)
+        if memo is not None:
+            memo.set(key, company_info)
+
+    # A remembered or shared lookup may have been made for another form of the same URL
+    company_info["website"] = website_url
+    return company_info
+
+
+@timed("lookup")
+def lookup_company_owners(website_url, structured, speculative, fields=COMPANY_FIELDS):
+    """
+    Run one company lookup; see find_company_owners.
+
+    Args:
+        website_url (str): The company website URL
+        structured (bool): Ask the API for JSON matching the company record schema
+        speculative (bool): Send the owners prompt together with the company prompt
+        fields (tuple): Record fields to look up, see get_prompt_fields
+
+    Returns:
+        dict: Company information including owners
+
+    Raises:
+        Exception: If the API call or parsing fails
+    """
+    record_lookup()
+    prompt_fields, owners_fields = get_lookup_prompt_fields(fields)
+    strategy_stats, strategy = choose_lookup_strategy(website_url) if owners_fields else (None, STRATEGY_STANDARD)
+
+    # Start the owners call right away; the combined prompt does not need one
+    owners_future = None
+    if speculative and owners_fields and strategy == STRATEGY_STANDARD:
+        # A copy of the context keeps the call's usage with this lookup
+        owners_prompt, owners_options = build_owners_request(
+            get_owners_query_from_url(website_url), structured, owners_fields
+        )
+        owners_future = get_speculative_executor().submit(
+            contextvars.copy_context().run, call_perplexity_api, owners_prompt, **owners_options
+        )
+
     try:
         # Create the prompt for the API
-        prompt = create_company_prompt(website_url)
+        prompt, options = build_company_request(website_url, strategy, structured, prompt_fields)
 
         # Call the Perplexity API
-        api_response = call_perplexity_api(prompt)
+        api_response = call_perplexity_api(prompt, **options)
 
         # Check if we got a valid response
         if not api_response:
             raise Exception("Received empty response from API")
 
-                # Extract content from the response
-        content = extract_content_from_response(api_response)
+        # Structured responses are used as-is when they match the schema
+        company_info = parse_structured_company_info(api_response, website_url, prompt_fields) if structured else None
+
+        if company_info is None:
+            # Extract content from the response
+            content = extract_content_from_response(api_response)
 
-        # Clean the content
-        cleaned_content = clean_response_content(content)
+            # Clean the content
+            cleaned_content = clean_response_content(content)
 
+            # Parse the company information
+            company_info = parse_company_info(cleaned_content, website_url, prompt_fields)
 
+        first_call_owners = bool(company_info.get("owners"))
+        round_trips = 1
 
-        # Parse the company information
-        company_info = parse_company_info(cleaned_content, website_url)
+        if owners_future is not None:
+            company_name = None
+            if first_call_owners:
+                # A request that already started cannot be stopped; its result is discarded
+                if not owners_future.cancel():
+                    round_trips += 1
+            else:
+                round_trips += 1
+                try:
+                    owners_response = owners_future.result()
+                    if owners_response:
+                        merge_owners_response(company_info, owners_response, structured, owners_fields)
+                except Exception as e:
+                    logger.warning("Warning: Failed to find additional owners: %s", e)
+        else:
+            # If no owners were found, make a second API call specifically for owners.
+            # The combined prompt already asked for a thorough ownership search.
+            search_owners = owners_fields and strategy == STRATEGY_STANDARD
+            company_name = get_owners_search_name(company_info) if search_owners else None
 
-        # If no owners were found, make a second API call specifically for owners
-        if not company_info.get("owners") or len(company_info["owners"]) == 0:
+        if company_name:
             try:
-                company_name = company_info.get("company_name", "Unknown")
-                if company_name and company_name != "Unknown":
-                    print(f"No owners found in initial search. Searching specifically for {company_name} owners...")
-                    
-                    # Create owners-specific prompt
-                    owners_prompt = create_owners_prompt(company_name)
-                    
-                    # Make second API call
-                    owners_response = call_perplexity_api(owners_prompt)
-                    
+                logger.info("No owners found in initial search. Searching specifically for %s owners...", company_name)
+
+                # Create owners-specific prompt
+                owners_prompt, owners_options = build_owners_request(company_name, structured, owners_fields)
+
+                # Make second API call
+                round_trips += 1
+                with timer("owners_search"):
+                    owners_response = call_perplexity_api(owners_prompt, **owners_options)
+
                     if owners_response:
-                        # Extract and parse owners content
-                        owners_content = extract_content_from_response(owners_response)
-                        cleaned_owners_content = clean_response_content(owners_content)
-                        
-                        # Try to extract owners and management from the response
-                        additional_owners, additional_management = parse_owners_response(cleaned_owners_content)
-                        
-                        if additional_owners:
-                            company_info["owners"] = additional_owners
-                            print(f"Found {len(additional_owners)} owner(s) in detailed search.")
-                        else:
-                            print("No additional owners found in detailed search.")
-                        
-                        # Merge management information if found
-                        if additional_management:
-                            if not company_info.get("management"):
-                                company_info["management"] = additional_management
-                            else:
-                                # Merge with existing management info
-                                existing_management = company_info["management"]
-                                for role in ["ceo", "cfo", "coo"]:
-                                    if role in additional_management and additional_management[role]:
-                                        if not existing_management.get(role):
-                                            existing_management[role] = additional_management[role]
-                    
+                        merge_owners_response(company_info, owners_response, structured, owners_fields)
+
             except Exception as e:
-                print(f"Warning: Failed to find additional owners: {str(e)}")
+                logger.warning("Warning: Failed to find additional owners: %s", e)
                 # Continue with original results even if second call fails
 
-        return company_info
+        record_lookup_strategy(strategy_stats, website_url, strategy, first_call_owners, company_info, round_trips)
+
+        # The company name may only have been asked for to run the owners search
+        return select_company_fields(company_info, fields) if prompt_fields != fields else company_info
 
     except ValueError as e:
         # Re-raise ValueError as is (these are usually API key or validation issues)
@@ -103,15 +230,433 @@ def find_company_owners(website_url):
         raise Exception(f"API request failed: {str(e)}")
     except Exception as e:
         raise Exception(f"Failed to find company owners: {str(e)}")
+    finally:
+        if owners_future is not None:
+            owners_future.cancel()
+
+
+@attach_usage
+async def find_company_owners_async(website_url, structured=None, speculative=None, fields=None):
+    """
+    Find company owners and information for a given website URL without blocking the event loop.
+
+    Runs the same two-stage flow as find_company_owners: the company prompt first,
+    then an owners-specific prompt when the first response has no owners.
+    Concurrent calls for the same company on one event loop share one lookup.
+    As in find_company_owners, the usage entry covers only this call's API requests.
+
+    Args:
+        website_url (str): The company website URL
+        structured (bool, optional): Ask the API for JSON matching the company record
+            schema; defaults to the STRUCTURED_OUTPUT setting
+        speculative (bool, optional): Send the owners prompt together with the company
+            prompt instead of after it; defaults to the SPECULATIVE_OWNERS setting
+        fields (iterable, optional): Record fields to look up; defaults to the
+            LOOKUP_FIELDS setting, or the full record
+
+    Returns:
+        dict: Company information including owners
+
+    Raises:
+        ValueError: If the URL or a field is invalid
+        Exception: If the API call or parsing fails
+    """
+    if not validate_url(website_url):
+        raise ValueError(f"Invalid URL: {website_url}")
+
+    if structured is None:
+        structured = get_structured_output_enabled()
+    if speculative is None:
+        speculative = get_speculative_owners_enabled()
+    fields = get_prompt_fields(fields if fields is not None else get_lookup_fields())
+
+    key = (canonicalize_url(website_url), structured, speculative, fields)
+    memo = get_lookup_memo()
+    company_info = memo.get(key) if memo is not None else None
+
+    if company_info is None:
+        if get_single_flight_enabled():
+            company_info = await async_lookup_flight.do(
+                key, lookup_company_owners_async, website_url, structured, speculative, fields
+            )
+        else:
+            company_info = await lookup_company_owners_async(website_url, structured, speculative, fields)
+        if memo is not None:
+            memo.set(key, company_info)
+
+    company_info["website"] = website_url
+    return company_info
+
+
+@timed("lookup")
+async def lookup_company_owners_async(website_url, structured, speculative, fields=COMPANY_FIELDS):
+    """
+    Run one company lookup without blocking the event loop; see find_company_owners_async.
+
+    Args:
+        website_url (str): The company website URL
+        structured (bool): Ask the API for JSON matching the company record schema
+        speculative (bool): Send the owners prompt together with the company prompt
+        fields (tuple): Record fields to look up, see get_prompt_fields
+
+    Returns:
+        dict: Company information including owners
+
+    Raises:
+        Exception: If the API call or parsing fails
+    """
+    record_lookup()
+    prompt_fields, owners_fields = get_lookup_prompt_fields(fields)
+    strategy_stats, strategy = choose_lookup_strategy(website_url) if owners_fields else (None, STRATEGY_STANDARD)
+
+    owners_task = None
+    if speculative and owners_fields and strategy == STRATEGY_STANDARD:
+        owners_prompt, owners_options = build_owners_request(
+            get_owners_query_from_url(website_url), structured, owners_fields
+        )
+        owners_task = asyncio.create_task(call_perplexity_api_async(owners_prompt, **owners_options))
+
+    try:
+        prompt, options = build_company_request(website_url, strategy, structured, prompt_fields)
+        api_response = await call_perplexity_api_async(prompt, **options)
+
+        if not api_response:
+            raise Exception("Received empty response from API")
+
+        company_info = parse_structured_company_info(api_response, website_url, prompt_fields) if structured else None
+        if company_info is None:
+            content = extract_content_from_response(api_response)
+            cleaned_content = clean_response_content(content)
+            company_info = parse_company_info(cleaned_content, website_url, prompt_fields)
+
+        first_call_owners = bool(company_info.get("owners"))
+        round_trips = 1
+
+        if owners_task is not None:
+            company_name = None
+            round_trips += 1
+            if not first_call_owners:
+                try:
+                    owners_response = await owners_task
+                    if owners_response:
+                        merge_owners_response(company_info, owners_response, structured, owners_fields)
+                except Exception as e:
+                    logger.warning("Warning: Failed to find additional owners: %s", e)
+        else:
+            search_owners = owners_fields and strategy == STRATEGY_STANDARD
+            company_name = get_owners_search_name(company_info) if search_owners else None
+
+        if company_name:
+            try:
+                logger.info("No owners found in initial search. Searching specifically for %s owners...", company_name)
+
+                owners_prompt, owners_options = build_owners_request(company_name, structured, owners_fields)
+                round_trips += 1
+                with timer("owners_search"):
+                    owners_response = await call_perplexity_api_async(owners_prompt, **owners_options)
+
+                    if owners_response:
+                        merge_owners_response(company_info, owners_response, structured, owners_fields)
+
+            except Exception as e:
+                logger.warning("Warning: Failed to find additional owners: %s", e)
+
+        record_lookup_strategy(strategy_stats, website_url, strategy, first_call_owners, company_info, round_trips)
+
+        return select_company_fields(company_info, fields) if prompt_fields != fields else company_info
+
+    except ValueError as e:
+        raise e
+    except requests.RequestException as e:
+        raise Exception(f"API request failed: {str(e)}")
+    except Exception as e:
+        raise Exception(f"Failed to find company owners: {str(e)}")
+    finally:
+        if owners_task is not None:
+            discard_task(owners_task)
+
+
+def get_lookup_prompt_fields(fields):
+    """
+    Decide which fields a lookup asks the API for.
+
+    Args:
+        fields (tuple): Record fields requested by the caller
+
+    Returns:
+        tuple: (fields for the company prompt, fields for the owners prompt); the company
+            name is added when owners are requested, since the owners search needs it,
+            and the owners fields are empty when owners are not requested
+    """
+    if "owners" not in fields:
+        return fields, ()
+    owners_fields = tuple(field for field in OWNERS_FIELDS if field in fields)
+    return get_prompt_fields(fields + ("company_name",)), owners_fields
+
+
+@functools.lru_cache(maxsize=None)
+def get_company_request_schema(fields):
+    """
+    Get the company record schema and response format for a field selection, built once per selection.
+
+    Returns:
+        tuple: (schema, response format)
+    """
+    if fields == COMPANY_FIELDS:
+        return COMPANY_INFO_SCHEMA, COMPANY_RESPONSE_FORMAT
+    schema = get_company_info_schema(fields)
+    return schema, build_response_format(schema)
+
+
+@functools.lru_cache(maxsize=None)
+def get_owners_request_schema(fields):
+    """
+    Get the owners record schema and response format for a field selection, built once per selection.
+
+    Returns:
+        tuple: (schema, response format)
+    """
+    if fields == OWNERS_FIELDS:
+        return OWNERS_SCHEMA, OWNERS_RESPONSE_FORMAT
+    schema = get_owners_schema(fields)
+    return schema, build_response_format(schema)
+
+
+def build_company_request(website_url, strategy, structured, fields=COMPANY_FIELDS):
+    """
+    Build the company prompt of a lookup and its API call options.
+
+    With the compact prompt style, the prompt asks only for the JSON record and
+    max_tokens is sized to the record fields.
+
+    Args:
+        website_url (str): The company website URL
+        strategy (str): Lookup strategy, see choose_lookup_strategy
+        structured (bool): Ask the API for JSON matching the company record schema
+        fields (tuple): Record fields to ask for
+
+    Returns:
+        tuple: (prompt, keyword arguments for call_perplexity_api)
+    """
+    options = {"response_format": get_company_request_schema(fields)[1] if structured else None}
+    if get_prompt_style() == "compact":
+        prompt = create_compact_company_prompt(website_url, fields, thorough_owners=strategy == STRATEGY_COMBINED)
+        options.update(max_tokens=get_max_tokens(fields), system_message=COMPACT_SYSTEM_MESSAGE)
+    elif strategy == STRATEGY_COMBINED:
+        prompt = create_combined_prompt(website_url, fields)
+    else:
+        prompt = create_company_prompt(website_url, fields)
+    return prompt, options
+
+
+def build_owners_request(company_name, structured, fields=OWNERS_FIELDS):
+    """
+    Build an owners prompt and its API call options.
+
+    Args:
+        company_name (str): The company name, or a description such as "the company behind example.com"
+        structured (bool): Ask the API for JSON matching the owners record schema
+        fields (tuple): "owners", optionally with "management"
+
+    Returns:
+        tuple: (prompt, keyword arguments for call_perplexity_api)
+    """
+    options = {"response_format": get_owners_request_schema(fields)[1] if structured else None}
+    if get_prompt_style() == "compact":
+        prompt = create_compact_owners_prompt(company_name, fields)
+        options.update(max_tokens=get_max_tokens(fields), system_message=COMPACT_SYSTEM_MESSAGE)
+    else:
+        prompt = create_owners_prompt(company_name, fields)
+    return prompt, options
+
+
+def get_speculative_executor():
+    """
+    Get the thread pool that runs speculative owners calls.
+
+    Returns:
+        ThreadPoolExecutor: The shared executor, sized like the HTTP connection pool
+    """
+    global _speculative_executor
+    if _speculative_executor is None:
+        with _speculative_executor_lock:
+            if _speculative_executor is None:
+                _speculative_executor = ThreadPoolExecutor(
+                    max_workers=get_http_pool_size(), thread_name_prefix="speculative-owners"
+                )
+    return _speculative_executor
+
+
+def get_owners_query_from_url(website_url):
+    """
+    Describe a company by its domain for an owners prompt sent before its name is known.
+
+    Args:
+        website_url (str): The company website URL
+
+    Returns:
+        str: E.g. "the company behind example.com"
+    """
+    domain = urlsplit(canonicalize_url(website_url)).netloc or website_url
+    return f"the company behind {domain}"
 
 
-def parse_company_info(api_content, website_url):
+def discard_task(task):
+    """Cancel an unfinished task, or consume the outcome of a finished one so it is not reported as lost."""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+def choose_lookup_strategy(website_url):
+    """
+    Pick the prompt strategy for a lookup from the learned statistics.
+
+    Args:
+        website_url (str): The company website URL
+
+    Returns:
+        tuple: (StrategyStats or None, STRATEGY_STANDARD or STRATEGY_COMBINED)
+    """
+    strategy_stats = get_strategy_stats()
+    if strategy_stats is None:
+        return None, STRATEGY_STANDARD
+    return strategy_stats, strategy_stats.choose(website_url)
+
+
+def record_lookup_strategy(strategy_stats, website_url, strategy, first_call_owners, company_info, round_trips):
+    """
+    Record how a lookup went in the strategy statistics, if they are enabled.
+
+    Args:
+        strategy_stats (StrategyStats or None): Statistics from choose_lookup_strategy
+        website_url (str): The company website URL
+        strategy (str): The strategy used
+        first_call_owners (bool): The first response already had owners
+        company_info (dict): The final company information
+        round_trips (int): Number of API calls made
+    """
+    if strategy_stats is None:
+        return
+    industry = company_info.get("industry")
+    strategy_stats.record(
+        website_url,
+        strategy,
+        first_call_owners=first_call_owners,
+        found_owners=bool(company_info.get("owners")),
+        round_trips=round_trips,
+        industry=industry if isinstance(industry, str) else None,
+    )
+
+
+def get_owners_search_name(company_info):
+    """
+    Decide whether an owners-specific search is needed.
+
+    Args:
+        company_info (dict): Company information from the first API call
+
+    Returns:
+        str or None: Company name to search owners for, or None if no search is needed
+    """
+    if company_info.get("owners") and len(company_info["owners"]) > 0:
+        return None
+
+    company_name = company_info.get("company_name", "Unknown")
+    if company_name and company_name != "Unknown":
+        return company_name
+
+    return None
+
+
+def merge_owners_response(company_info, owners_response, structured=False, fields=OWNERS_FIELDS):
+    """
+    Merge owners and management from an owners-specific API response into company info.
+
+    Args:
+        company_info (dict): Company information to update in place
+        owners_response (dict): The raw API response for the owners prompt
+        structured (bool): The response was requested with the owners response format
+        fields (tuple): Fields the owners prompt asked for; management is only merged if requested
+    """
+    record = parse_structured_record(owners_response, get_owners_request_schema(fields)[0]) if structured else None
+    if record is not None:
+        additional_owners, additional_management = structure_owners_data(record)
+    else:
+        # Extract and parse owners content
+        owners_content = extract_content_from_response(owners_response)
+        cleaned_owners_content = clean_response_content(owners_content)
+
+        # Try to extract owners and management from the response
+        additional_owners, additional_management = parse_owners_response(cleaned_owners_content)
+
+    if additional_owners:
+        company_info["owners"] = additional_owners
+        logger.info("Found %d owner(s) in detailed search.", len(additional_owners))
+    else:
+        logger.info("No additional owners found in detailed search.")
+
+    # Merge management information if found
+    if additional_management and "management" in fields:
+        if not company_info.get("management"):
+            company_info["management"] = additional_management
+        else:
+            # Merge with existing management info
+            existing_management = company_info["management"]
+            for role in ["ceo", "cfo", "coo"]:
+                if role in additional_management and additional_management[role]:
+                    if not existing_management.get(role):
+                        existing_management[role] = additional_management[role]
+
+
+def parse_structured_record(api_response, schema):
+    """
+    Read the record from a structured-output API response.
+
+    Args:
+        api_response (dict): The raw API response
+        schema (dict): JSON schema the response was requested with
+
+    Returns:
+        dict or None: The record, or None if the content is not JSON matching schema
+    """
+    try:
+        record = json.loads(extract_content_from_response(api_response))
+    except ValueError:
+        return None
+
+    return record if validate_record(record, schema) else None
+
+
+def parse_structured_company_info(api_response, website_url, fields=COMPANY_FIELDS):
+    """
+    Build company information from a structured-output API response.
+
+    Args:
+        api_response (dict): The raw API response, requested with the company response format
+        website_url (str): The original website URL
+        fields (tuple): Record fields the request asked for
+
+    Returns:
+        dict or None: Company information, or None if the response has to go through
+            the text parser instead
+    """
+    record = parse_structured_record(api_response, get_company_request_schema(fields)[0])
+    if record is None:
+        return None
+    return structure_company_data(record, website_url, fields)
+
+
+@timed("parse_company_info")
+def parse_company_info(api_content, website_url, fields=COMPANY_FIELDS):
     """
     Parse company information from API response content.
 
     Args:
         api_content (str): The content from the API response
         website_url (str): The original website URL
+        fields (tuple): Record fields to return; the others are not parsed
 
     Returns:
         dict: Parsed company information
@@ -125,22 +670,142 @@ def parse_company_info(api_content, website_url):
         json_data = extract_json_from_text(api_content)
 
         if json_data:
-            return structure_company_data(json_data, website_url)
+            return structure_company_data(json_data, website_url, fields)
         else:
             # Fallback to text parsing if no JSON found
-            return parse_text_response(api_content, website_url)
+            return parse_text_response(api_content, website_url, fields)
 
     except Exception as e:
         # If all parsing fails, return basic structure with error info
-        return create_company_info(
+        company_info = create_company_info(
             company_name="Unknown", website=website_url, description=f"Error parsing response: {str(e)}", owners=[]
         )
+        return select_company_fields(company_info, fields) if fields != COMPANY_FIELDS else company_info
+
+
+# Characters that matter when matching braces; everything else is skipped in bulk
+JSON_TOKEN_PATTERN = re.compile(r'[{}"\\]')
+# An opening brace that can start a JSON object: followed by a key or an immediate close
+JSON_OBJECT_START_PATTERN = re.compile(r'\{\s*["}]')
+
+# Keys that identify a company or owners record among several JSON candidates
+EXPECTED_JSON_KEYS = frozenset(
+    {"company_name", "description", "owners", "management", "industry", "founded_year", "headquarters"}
+)
+
+# Failed raw_decode attempts before switching to the brace scanner. Each failure
+# costs time proportional to its offset, so this keeps the sweep linear.
+MAX_DECODE_FAILURES = 20
+
+_json_decoder = json.JSONDecoder()
+
+
+def find_json_object_spans(text, start=0):
+    """
+    Locate every outermost balanced {...} span in one linear pass.
 
+    Braces inside JSON strings (including escaped quotes) are ignored, and
+    only the characters {, }, " and backslash are visited. Complete objects
+    are still found when an earlier opening brace in the prose is never
+    closed, and braces that cannot start a JSON object (such as "{see notes}")
+    do not hide objects nested inside them.
+
+    Args:
+        text (str): Text that may contain JSON objects
+        start (int): Offset to start scanning from
+
+    Returns:
+        list: (start, end) slices of candidate objects, in order
+    """
+    spans = []
+    # Stack of (position, could_start_object) for every unclosed opening brace
+    open_braces = []
+    in_string = False
+    skip_until = -1
+
+    for match in JSON_TOKEN_PATTERN.finditer(text, start):
+        position = match.start()
+        if position < skip_until:
+            # Character escaped by a preceding backslash
+            continue
+
+        char = text[position]
+        if in_string:
+            if char == "\\":
+                skip_until = position + 2
+            elif char == '"':
+                in_string = False
+        elif char == "{":
+            open_braces.append((position, JSON_OBJECT_START_PATTERN.match(text, position) is not None))
+        elif not open_braces:
+            continue
+        elif char == '"':
+            # Quotes only open strings inside something that looks like JSON
+            in_string = open_braces[-1][1]
+        elif char == "}":
+            span_start, could_start_object = open_braces.pop()
+            if could_start_object:
+                # Drop spans nested inside the one that just closed
+                while spans and spans[-1][0] > span_start:
+                    spans.pop()
+                spans.append((span_start, position + 1))
+
+    return spans
+
+
+def iter_json_objects(text):
+    """
+    Yield every top-level JSON object embedded in text, in order.
+
+    Candidate starts are located with a regex and decoded in place with
+    json.JSONDecoder.raw_decode, jumping past each decoded object, so well
+    formed responses never leave C code. After MAX_DECODE_FAILURES failed
+    candidates the rest of the text is handled by find_json_object_spans,
+    which keeps the total work linear in the text length.
+
+    Args:
+        text (str): Text that may contain JSON objects
 
+    Yields:
+        dict: Parsed objects
+    """
+    position = 0
+    failures = 0
+
+    while failures < MAX_DECODE_FAILURES:
+        match = JSON_OBJECT_START_PATTERN.search(text, position)
+        if match is None:
+            return
+        try:
+            candidate, position = _json_decoder.raw_decode(text, match.start())
+            yield candidate
+        except json.JSONDecodeError:
+            failures += 1
+            position = match.start() + 1
+
+    for span_start, span_end in find_json_object_spans(text, position):
+        try:
+            yield json.loads(text[span_start:span_end])
+        except json.JSONDecodeError:
+            continue
+
+
+def score_json_candidate(candidate):
+    """Rank a parsed JSON object by how many expected record keys it has."""
+    return len(EXPECTED_JSON_KEYS.intersection(candidate))
+
+
+@timed("extract_json")
 def extract_json_from_text(text):
     """
     Extract JSON object from text that might contain additional content.
 
+    Embedded objects are found in a single forward sweep (see iter_json_objects),
+    so long or malformed responses are not re-scanned per pattern. When several
+    objects are found, the one with the most expected record keys wins. Embedded
+    objects without any expected key, such as an owner object left over from a
+    reply cut off at max_tokens, are not taken for the record.
+
     Args:
         text (str): Text that may contain JSON
 
@@ -148,54 +813,47 @@ def extract_json_from_text(text):
         dict or None: Parsed JSON data or None if not found
     """
     # Try parsing the entire text as JSON first
-    try:
-        return json.loads(text.strip())
-    except json.JSONDecodeError:
-        pass
-
-    # Try to find JSON block in the text
-    json_patterns = [
-        r"```json\s*(\{.*?\})\s*```",  # JSON in code blocks
-        r"```\s*(\{.*?\})\s*```",  # JSON in code blocks without language
-        r"(\{.*\})",  # Any JSON-like structure - simplified pattern
-    ]
-
-    for pattern in json_patterns:
-        matches = re.findall(pattern, text, re.DOTALL)
-        for match in matches:
-            try:
-                # Clean up the match by removing any trailing text after the closing brace
-                cleaned_match = match.strip()
-                # Find the last closing brace to ensure we have a complete JSON
-                last_brace = cleaned_match.rfind('}')
-                if last_brace != -1:
-                    cleaned_match = cleaned_match[:last_brace + 1]
-                return json.loads(cleaned_match)
-            except json.JSONDecodeError:
-                continue
-
-    return None
-
-
-def structure_company_data(json_data, website_url):
+    stripped = text.strip()
+    if stripped.startswith("{"):
+        try:
+            data = json.loads(stripped)
+            if isinstance(data, dict):
+                return data
+        except json.JSONDecodeError:
+            pass
+
+    best = None
+    best_score = 0
+    for candidate in iter_json_objects(text):
+        score = score_json_candidate(candidate)
+        if score > best_score:
+            best, best_score = candidate, score
+
+    return best
+
+
+def structure_company_data(json_data, website_url, fields=COMPANY_FIELDS):
     """
     Structure the parsed JSON data into our standard format.
 
     Args:
         json_data (dict): Parsed JSON data
         website_url (str): The original website URL
+        fields (tuple): Record fields to return; owners and management are only
+            structured when requested
 
     Returns:
         dict: Structured company information
     """
     if not json_data:
-        return create_company_info(
+        company_info = create_company_info(
             company_name="Unknown", website=website_url, description="No data available", owners=[]
         )
+        return select_company_fields(company_info, fields) if fields != COMPANY_FIELDS else company_info
 
     # Extract owners
     owners = []
-    raw_owners = json_data.get("owners", [])
+    raw_owners = json_data.get("owners", []) if "owners" in fields else None
 
     if raw_owners and isinstance(raw_owners, list):
         for owner_data in raw_owners:
@@ -216,7 +874,7 @@ def structure_company_data(json_data, website_url):
 
     # Extract management information
     management = None
-    raw_management = json_data.get("management")
+    raw_management = json_data.get("management") if "management" in fields else None
     if raw_management and isinstance(raw_management, dict):
         ceo_info = None
         cfo_info = None
@@ -248,7 +906,7 @@ def structure_company_data(json_data, website_url):
         
         management = create_management_info(ceo=ceo_info, cfo=cfo_info, coo=coo_info)
 
-    return create_company_info(
+    company_info = create_company_info(
         company_name=json_data.get("company_name", "Unknown"),
         website=website_url,
         description=json_data.get("description", "No description available"),
@@ -258,42 +916,167 @@ def structure_company_data(json_data, website_url):
         founded_year=json_data.get("founded_year"),
         headquarters=json_data.get("headquarters"),
     )
+    return select_company_fields(company_info, fields) if fields != COMPANY_FIELDS else company_info
+
+
+# Keywords searched by the plain-text fallback, in priority order per field
+TEXT_FIELD_KEYWORDS = {
+    "company_name": ("company name", "name"),
+    "description": ("description", "about", "what"),
+    "industry": ("industry", "sector"),
+    "founded_year": ("founded", "established", "year"),
+    "headquarters": ("headquarters", "location", "based"),
+}
+OWNER_PATTERNS = (r"founder[s]?", r"owner[s]?", r"CEO", r"founded by")
+
+# Text following a keyword, e.g. ": Example Corp" up to the end of the sentence
+TEXT_VALUE_PATTERN = re.compile(r"[:\s]+([^\n\r.]+)")
+
+
+def _build_text_keyword_table():
+    """
+    Compile every fallback keyword into a single alternation.
+
+    Returns:
+        tuple: (keywords, pattern for lower-cased text, case-insensitive pattern,
+            keyword -> list of (keyword, offset) for keywords found inside it)
+    """
+    keywords = list(OWNER_PATTERNS)
+    for field_keywords in TEXT_FIELD_KEYWORDS.values():
+        keywords.extend(keyword for keyword in field_keywords if keyword not in keywords)
+    # Longer keywords first so "founded by" wins over "founded" at the same position
+    keywords.sort(key=len, reverse=True)
+
+    # A match consumes its keyword, hiding keywords inside it ("name" in "company
+    # name"). Only plain words can be compared this way.
+    literals = [keyword for keyword in keywords if re.fullmatch(r"[\w ]+", keyword)]
+    contained = {}
+    for keyword in literals:
+        for other in literals:
+            if other == keyword:
+                continue
+            for inner in re.finditer(re.escape(other.lower()), keyword.lower()):
+                contained.setdefault(keyword, []).append((other, inner.start()))
+
+    # Plain alternatives (no groups) let the regex engine skip ahead to possible
+    # first characters instead of trying every alternative at every position
+    alternation = "|".join(keywords)
+    lower_pattern = re.compile(rf"(?:{alternation.lower()})(?=[:\s]+[^\n\r.])")
+    ignorecase_pattern = re.compile(rf"(?:{alternation})(?=[:\s]+[^\n\r.])", re.IGNORECASE)
+    return tuple(keywords), lower_pattern, ignorecase_pattern, contained
+
+
+TEXT_KEYWORDS, TEXT_KEYWORD_PATTERN, TEXT_KEYWORD_PATTERN_IGNORECASE, TEXT_KEYWORD_CONTAINED = (
+    _build_text_keyword_table()
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_text_keyword(matched):
+    """Map a matched spelling such as "founders" to its keyword table entry."""
+    for keyword in TEXT_KEYWORDS:
+        if re.fullmatch(keyword, matched, re.IGNORECASE):
+            return keyword
+    return None
+
+
+def scan_text_keywords(text):
+    """
+    Collect the values following every fallback keyword in a single scan.
+
+    Gives the same values as running re.findall(rf"{keyword}[:\\s]+([^\\n\\r.]+)")
+    with re.IGNORECASE separately for each keyword in TEXT_FIELD_KEYWORDS and
+    OWNER_PATTERNS, without rescanning the text once per keyword.
+
+    Args:
+        text (str): Text to search in
 
+    Returns:
+        dict: Keyword -> list of non-overlapping values, in text order
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        # Offsets line up, so the cheaper case-sensitive pattern can be used
+        matches = TEXT_KEYWORD_PATTERN.finditer(lowered)
+    else:
+        matches = TEXT_KEYWORD_PATTERN_IGNORECASE.finditer(text)
+
+    values = {}
+    value_ends = {}
+
+    for match in matches:
+        keyword = _get_text_keyword(match.group().lower())
+        keyword_start = match.start()
+        hits = [(keyword, keyword_start, match.end())]
+        for inner, offset in TEXT_KEYWORD_CONTAINED.get(keyword, ()):
+            hits.append((inner, keyword_start + offset, keyword_start + offset + len(inner)))
+
+        for keyword, hit_start, hit_end in hits:
+            # Like re.findall, a keyword is not matched again inside its own previous value
+            if hit_start < value_ends.get(keyword, 0):
+                continue
+            value = TEXT_VALUE_PATTERN.match(text, hit_end)
+            if value is None:
+                continue
+            values.setdefault(keyword, []).append(value.group(1))
+            value_ends[keyword] = value.end()
+
+    return values
 
-def parse_text_response(text, website_url):
+
+@timed("text_fallback")
+def parse_text_response(text, website_url, fields=COMPANY_FIELDS):
     """
     Parse company information from plain text response.
     
     Args:
         text (str): Plain text response
         website_url (str): The original website URL
+        fields (tuple): Record fields to return; owners and management are only
+            extracted when requested
         
     Returns:
         dict: Parsed company information
     """
-    # Simple text parsing patterns
-    company_name = extract_field_from_text(text, ["company name", "name"])
-    description = extract_field_from_text(text, ["description", "about", "what"])
-    industry = extract_field_from_text(text, ["industry", "sector"])
-    founded = extract_field_from_text(text, ["founded", "established", "year"])
-    headquarters = extract_field_from_text(text, ["headquarters", "location", "based"])
+    # All fields and owners come from one scan of the text
+    values = scan_text_keywords(text)
+    values_by_field = {
+        field: _first_keyword_value(values, keywords) for field, keywords in TEXT_FIELD_KEYWORDS.items()
+    }
     
     # Extract owners/founders
-    owners = extract_owners_from_text(text)
+    owners = extract_owners_from_text(text, values) if "owners" in fields else []
     
-    # Extract management information
-    management = extract_management_from_text(text)
+    # Text after "Management:" or "Leadership:" is as often a description ("a small
+    # team of engineers", "not publicly disclosed") as a name, so no executive is
+    # made up from it; management only comes from JSON answers
+    management = None
     
-    return create_company_info(
-        company_name=company_name or "Unknown",
+    company_info = create_company_info(
+        company_name=values_by_field["company_name"] or "Unknown",
         website=website_url,
-        description=description or "No description available",
+        description=values_by_field["description"] or "No description available",
         owners=owners,
         management=management,
-        industry=industry,
-        founded_year=founded,
-        headquarters=headquarters
+        industry=values_by_field["industry"],
+        founded_year=values_by_field["founded_year"],
+        headquarters=values_by_field["headquarters"]
     )
+    return select_company_fields(company_info, fields) if fields != COMPANY_FIELDS else company_info
+
+
+def _first_keyword_value(values, keywords):
+    """Return the first value found for the highest-priority keyword present."""
+    for keyword in keywords:
+        if keyword in values:
+            return values[keyword][0].strip()
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_field_pattern(keyword):
+    """Compile and cache the lookup pattern for a single keyword."""
+    return re.compile(rf"{keyword}[:\s]+([^\n\r.]+)", re.IGNORECASE)
 
 
 def extract_field_from_text(text, keywords):
@@ -309,37 +1092,30 @@ def extract_field_from_text(text, keywords):
     """
     for keyword in keywords:
         # Look for patterns like "Company Name: Example Corp"
-        pattern = rf"{keyword}[:\s]+([^\n\r.]+)"
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _compile_field_pattern(keyword).search(text)
         if match:
             return match.group(1).strip()
 
     return None
 
 
-def extract_owners_from_text(text):
+def extract_owners_from_text(text, values=None):
     """
     Extract owner information from text.
 
     Args:
         text (str): Text to search in
+        values (dict, optional): Result of scan_text_keywords for text, to avoid rescanning
 
     Returns:
         list: List of owner dictionaries
     """
-    owners = []
+    if values is None:
+        values = scan_text_keywords(text)
 
-    # Look for common patterns
-    owner_patterns = [
-        r"founder[s]?[:\s]+([^\n\r.]+)",
-        r"owner[s]?[:\s]+([^\n\r.]+)",
-        r"CEO[:\s]+([^\n\r.]+)",
-        r"founded by[:\s]+([^\n\r.]+)",
-    ]
-
-    for pattern in owner_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
+    owners = []
+    for pattern in OWNER_PATTERNS:
+        for match in values.get(pattern, ()):
             # Clean up the match and create owner
             name = match.strip()
             if name and len(name) < 100:  # Sanity check
@@ -349,38 +1125,87 @@ def extract_owners_from_text(text):
     return owners
 
 
-def extract_management_from_text(text):
+def structure_owners_data(json_data):
     """
-    Extract management information from text.
+    Structure parsed owners-search JSON into owners and management.
 
     Args:
-        text (str): Text to search in
+        json_data (dict): Parsed JSON data
 
     Returns:
-        dict or None: Management information dictionary or None
-    """
-    # Look for management patterns
-    management_patterns = [
-        r"management[:\s]+([^\n\r.]+)",
-        r"leadership[:\s]+([^\n\r.]+)",
-        r"executive[:\s]+([^\n\r.]+)",
-        r"board of directors[:\s]+([^\n\r.]+)",
-    ]
-    
-    for pattern in management_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            # Clean up the match
-            name = match.strip()
-            if name and len(name) < 100:  # Sanity check
-                return create_management_info(
-                    name=name,
-                    title="Management"
-                )
-    
-    return None
+        tuple: (list of owner dictionaries, management dictionary or None)
+    """
+    owners = []
+    management = None
 
+    # Extract owners
+    if "owners" in json_data:
+        raw_owners = json_data["owners"]
+
+        if raw_owners and isinstance(raw_owners, list):
+            for owner_data in raw_owners:
+                if isinstance(owner_data, dict):
+                    name = owner_data.get("name") or "Unknown"
+                    # Only add owners with valid names
+                    if name and name != "Unknown":
+                        owner = create_owner(
+                            name=name,
+                            title=owner_data.get("title"),
+                            ownership_percentage=owner_data.get("ownership_percentage"),
+                        )
+                        owners.append(owner)
+                elif isinstance(owner_data, str):
+                    # Handle case where owner is just a string
+                    owner = create_owner(name=owner_data)
+                    owners.append(owner)
 
+    # Extract management
+    if "management" in json_data:
+        raw_management = json_data["management"]
+        if raw_management and isinstance(raw_management, dict):
+            ceo_info = None
+            cfo_info = None
+            coo_info = None
+
+            # Extract CEO
+            if "ceo" in raw_management and raw_management["ceo"]:
+                ceo_data = raw_management["ceo"]
+                if isinstance(ceo_data, dict):
+                    ceo_info = create_executive_info(
+                        name=ceo_data.get("name"),
+                        title=ceo_data.get("title")
+                    )
+                elif isinstance(ceo_data, str):
+                    ceo_info = create_executive_info(name=ceo_data)
+
+            # Extract CFO
+            if "cfo" in raw_management and raw_management["cfo"]:
+                cfo_data = raw_management["cfo"]
+                if isinstance(cfo_data, dict):
+                    cfo_info = create_executive_info(
+                        name=cfo_data.get("name"),
+                        title=cfo_data.get("title")
+                    )
+                elif isinstance(cfo_data, str):
+                    cfo_info = create_executive_info(name=cfo_data)
+
+            # Extract COO
+            if "coo" in raw_management and raw_management["coo"]:
+                coo_data = raw_management["coo"]
+                if isinstance(coo_data, dict):
+                    coo_info = create_executive_info(
+                        name=coo_data.get("name"),
+                        title=coo_data.get("title")
+                    )
+                elif isinstance(coo_data, str):
+                    coo_info = create_executive_info(name=coo_data)
+
+            management = create_management_info(ceo=ceo_info, cfo=cfo_info, coo=coo_info)
+
+    return owners, management
+
+
+@timed("parse_owners_response")
 def parse_owners_response(api_content):
     """
     Parse owners and management information from API response content specifically for owners search.
@@ -402,83 +1227,19 @@ def parse_owners_response(api_content):
         management = None
         
         if json_data:
-            # Extract owners
-            if "owners" in json_data:
-                raw_owners = json_data["owners"]
-                
-                if raw_owners and isinstance(raw_owners, list):
-                    for owner_data in raw_owners:
-                        if isinstance(owner_data, dict):
-                            name = owner_data.get("name") or "Unknown"
-                            # Only add owners with valid names
-                            if name and name != "Unknown":
-                                owner = create_owner(
-                                    name=name,
-                                    title=owner_data.get("title"),
-                                    ownership_percentage=owner_data.get("ownership_percentage"),
-                                )
-                                owners.append(owner)
-                        elif isinstance(owner_data, str):
-                            # Handle case where owner is just a string
-                            owner = create_owner(name=owner_data)
-                            owners.append(owner)
-            
-            # Extract management
-            if "management" in json_data:
-                raw_management = json_data["management"]
-                if raw_management and isinstance(raw_management, dict):
-                    ceo_info = None
-                    cfo_info = None
-                    coo_info = None
-                    
-                    # Extract CEO
-                    if "ceo" in raw_management and raw_management["ceo"]:
-                        ceo_data = raw_management["ceo"]
-                        if isinstance(ceo_data, dict):
-                            ceo_info = create_executive_info(
-                                name=ceo_data.get("name"),
-                                title=ceo_data.get("title")
-                            )
-                        elif isinstance(ceo_data, str):
-                            ceo_info = create_executive_info(name=ceo_data)
-                    
-                    # Extract CFO
-                    if "cfo" in raw_management and raw_management["cfo"]:
-                        cfo_data = raw_management["cfo"]
-                        if isinstance(cfo_data, dict):
-                            cfo_info = create_executive_info(
-                                name=cfo_data.get("name"),
-                                title=cfo_data.get("title")
-                            )
-                        elif isinstance(cfo_data, str):
-                            cfo_info = create_executive_info(name=cfo_data)
-                    
-                    # Extract COO
-                    if "coo" in raw_management and raw_management["coo"]:
-                        coo_data = raw_management["coo"]
-                        if isinstance(coo_data, dict):
-                            coo_info = create_executive_info(
-                                name=coo_data.get("name"),
-                                title=coo_data.get("title")
-                            )
-                        elif isinstance(coo_data, str):
-                            coo_info = create_executive_info(name=coo_data)
-                    
-                    management = create_management_info(ceo=ceo_info, cfo=cfo_info, coo=coo_info)
+            owners, management = structure_owners_data(json_data)
         else:
-            # Fallback to text parsing if no JSON found
+            # Fallback to text parsing if no JSON found; management is not taken from free text
             owners = extract_owners_from_text(api_content)
-            management = extract_management_from_text(api_content)
         
         return owners, management
             
     except Exception as e:
         # If parsing fails, try text extraction as fallback
-        owners = extract_owners_from_text(api_content)
-        management = extract_management_from_text(api_content)
-        return owners, management
+        return extract_owners_from_text(api_content), None
 
 
+@timed("clean_response")
 def clean_response_content(content):
     """
     Clean and prepare response content for parsing.
@@ -0,0 +1,179 @@
+"""
+Console output helpers for batch runs of the Company Owners Finder application.
+
+A progress line that is rewritten in place replaces the per-URL reports, and
+log records are single compact JSON lines, so large batches spend their time
+on lookups instead of terminal output.
+"""
+
+import sys
+import time
+
+from owners_finder.serialization import dumps
+
+# Seconds between redraws of the progress line on a terminal
+PROGRESS_REDRAW_INTERVAL = 0.2
+# Seconds between progress lines when the stream is a file or pipe, where lines cannot be rewritten
+PROGRESS_LOG_INTERVAL = 10.0
+
+
+def format_duration(seconds):
+    """
+    Format a duration for display.
+
+    Args:
+        seconds (float): Duration in seconds
+
+    Returns:
+        str: E.g. "45s", "3m12s" or "2h05m"
+    """
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m{seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+class ProgressLine:
+    """
+    Single status line with counts, rate and estimated time remaining.
+
+    On a terminal the line is rewritten in place at most every
+    PROGRESS_REDRAW_INTERVAL seconds; on other streams a new line is written
+    every PROGRESS_LOG_INTERVAL seconds instead.
+    """
+
+    def __init__(self, total=None, stream=None, clock=time.monotonic):
+        """
+        Args:
+            total (int, optional): Number of URLs in the input, for percentage and ETA
+            stream (file, optional): Where to write; defaults to standard error
+            clock (callable): Time source in seconds
+        """
+        self.total = total
+        self.stream = stream or sys.stderr
+        self.clock = clock
+        self.interactive = hasattr(self.stream, "isatty") and self.stream.isatty()
+        self.started_at = clock()
+        self._last_drawn = None
+        self._visible = False
+        self._counts = (0, 0, 0)
+
+    def format(self, processed, failed=0, skipped=0):
+        """
+        Format the status line.
+
+        Args:
+            processed (int): URLs processed in this run
+            failed (int): URLs that failed in this run
+            skipped (int): URLs skipped because an earlier run completed them
+
+        Returns:
+            str: E.g. "1200/5000 (24.0%) | 40.0 URLs/sec | ETA 1m35s | 3 failed"
+        """
+        elapsed = max(self.clock() - self.started_at, 1e-9)
+        rate = processed / elapsed
+        done = processed + skipped
+        if self.total:
+            parts = [f"{done}/{self.total} ({done / self.total:.1%})", f"{rate:.1f} URLs/sec"]
+            if rate > 0:
+                parts.append(f"ETA {format_duration(max(self.total - done, 0) / rate)}")
+        else:
+            parts = [f"{done} processed", f"{rate:.1f} URLs/sec"]
+        parts.append(f"{failed} failed")
+        return " | ".join(parts)
+
+    def update(self, processed, failed=0, skipped=0, force=False):
+        """Redraw the line if enough time has passed since the last redraw, or if force is set."""
+        self._counts = (processed, failed, skipped)
+        now = self.clock()
+        interval = PROGRESS_REDRAW_INTERVAL if self.interactive else PROGRESS_LOG_INTERVAL
+        if not force and self._last_drawn is not None and now - self._last_drawn < interval:
+            return
+        self._last_drawn = now
+        line = self.format(processed, failed, skipped)
+        if self.interactive:
+            self.stream.write(f"\r\033[K{line}")
+            self._visible = True
+        else:
+            self.stream.write(f"{line}\n")
+        self.stream.flush()
+
+    def clear(self):
+        """Erase the line, e.g. before other output is written to the terminal."""
+        if self._visible:
+            self.stream.write("\r\033[K")
+            self.stream.flush()
+            self._visible = False
+            # Redraw on the next update
+            self._last_drawn = None
+
+    def close(self):
+        """Draw the final counts and end the line."""
+        self.update(*self._counts, force=True)
+        if self.interactive:
+            self.stream.write("\n")
+            self.stream.flush()
+        self._visible = False
+
+
+def format_log_record(index, url, company_info=None, output=None, error=None):
+    """
+    Format the outcome of one URL as a compact JSON log line.
+
+    The line names the company and counts its owners; the full record is in
+    the result file or JSON Lines output it points to.
+
+    Args:
+        index (int or None): Position of the URL in the input
+        url (str): The URL
+        company_info (dict, optional): The lookup result
+        output (str or Path, optional): Where the result was written
+        error (Exception or str, optional): Why the URL failed
+
+    Returns:
+        str: One line of JSON
+    """
+    record = {"event": "result", "index": index, "url": url, "status": "failed" if error is not None else "success"}
+    if company_info is not None:
+        if "company_name" in company_info:
+            record["company_name"] = company_info["company_name"]
+        if "owners" in company_info:
+            record["owners"] = len(company_info["owners"] or ())
+    if output is not None:
+        record["output"] = str(output)
+    if error is not None:
+        record["error"] = str(error)
+    return dumps(record).decode("utf-8")
+
+
+def format_log_summary(successful, failed, skipped, elapsed_seconds, usage=None):
+    """
+    Format the outcome of a batch run as a compact JSON log line.
+
+    Args:
+        successful (int): URLs processed successfully
+        failed (int): URLs that failed
+        skipped (int): URLs skipped because an earlier run completed them
+        elapsed_seconds (float): Wall time of the run
+        usage (dict, optional): API usage summary, see UsageTotals.summary
+
+    Returns:
+        str: One line of JSON
+    """
+    processed = successful + failed
+    record = {
+        "event": "summary",
+        "successful": successful,
+        "failed": failed,
+        "skipped": skipped,
+        "total": processed + skipped,
+        "seconds": round(elapsed_seconds, 3),
+        "urls_per_sec": round(processed / elapsed_seconds, 3) if elapsed_seconds > 0 else None,
+    }
+    if usage is not None:
+        record["usage"] = usage
+    return dumps(record).decode("utf-8")
@@ -0,0 +1,221 @@
+"""
+Client-side rate limiting for the Company Owners Finder application.
+"""
+
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from owners_finder.config import get_requests_per_minute, get_tokens_per_minute
+
+# Multiplicative slowdown applied on every 429 and the per-success recovery step
+BACKOFF_FACTOR = 0.8
+RECOVERY_STEP = 0.02
+MIN_RATE_FACTOR = 0.1
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(value):
+    """
+    Parse a rate limit header value into seconds.
+
+    Accepts plain seconds ("2", "1.5"), duration strings ("1m30s", "250ms")
+    and HTTP dates as used by Retry-After.
+
+    Args:
+        value (str): Header value
+
+    Returns:
+        float or None: Seconds from now, or None if the value is not understood
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parts = _DURATION_PATTERN.findall(value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def estimate_request_tokens(payload):
+    """
+    Estimate the tokens a request will consume, for tokens-per-minute pacing.
+
+    Uses roughly four characters per prompt token plus the completion budget.
+
+    Args:
+        payload (dict): The request payload
+
+    Returns:
+        int: Estimated total tokens
+    """
+    prompt_chars = sum(len(message.get("content") or "") for message in payload.get("messages", []))
+    return prompt_chars // 4 + int(payload.get("max_tokens") or 0)
+
+
+class TokenBucket:
+    """
+    Continuously refilling token bucket.
+
+    Reservations may drive the balance negative; the caller is told how long
+    to wait until its share has refilled, which keeps callers in FIFO order
+    without holding the lock while sleeping.
+    """
+
+    def __init__(self, rate_per_minute, capacity=None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self, amount, now, rate_factor=1.0):
+        """Take amount tokens and return the seconds to wait before using them."""
+        rate = self.rate * rate_factor
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * rate)
+        self.updated_at = now
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / rate
+
+    def refund(self, amount):
+        """Return unused tokens (or charge extra when amount is negative)."""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter shared by all API callers.
+
+    Server feedback adjusts the pace: a 429 pauses every caller for the
+    Retry-After period and slows the effective rate, which then recovers
+    gradually on successful responses.
+    """
+
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None):
+        self.limits = (requests_per_minute, tokens_per_minute)
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = (
+            TokenBucket(tokens_per_minute, capacity=max(1.0, tokens_per_minute / 60.0)) if tokens_per_minute else None
+        )
+        self.rate_factor = 1.0
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=0):
+        """
+        Reserve capacity for one request.
+
+        Args:
+            tokens (int): Estimated tokens the request will consume
+
+        Returns:
+            float: Seconds the caller must wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self.blocked_until - now)
+            if self.request_bucket:
+                delay = max(delay, self.request_bucket.reserve(1, now, self.rate_factor))
+            if self.token_bucket and tokens:
+                delay = max(delay, self.token_bucket.reserve(tokens, now, self.rate_factor))
+            return delay
+
+    def acquire(self, tokens=0):
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    def record_usage(self, estimated_tokens, actual_tokens):
+        """Correct the tokens-per-minute budget once the real usage is known."""
+        if self.token_bucket and actual_tokens is not None:
+            with self._lock:
+                self.token_bucket.refund(estimated_tokens - actual_tokens)
+
+    def on_rate_limited(self, headers):
+        """
+        Handle a 429 response.
+
+        Args:
+            headers (Mapping): Response headers
+
+        Returns:
+            float: Seconds all callers are paused for
+        """
+        retry_after = parse_duration(_header(headers, "retry-after"))
+        if retry_after is None:
+            retry_after = parse_duration(_header(headers, "x-ratelimit-reset-requests"))
+        if retry_after is None:
+            retry_after = 1.0
+
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+            self.rate_factor = max(MIN_RATE_FACTOR, self.rate_factor * BACKOFF_FACTOR)
+        return retry_after
+
+    def on_response(self, headers):
+        """
+        Handle a successful response, pausing early if the quota is exhausted.
+
+        Args:
+            headers (Mapping): Response headers
+        """
+        remaining = _header(headers, "x-ratelimit-remaining-requests")
+        reset = parse_duration(_header(headers, "x-ratelimit-reset-requests"))
+
+        with self._lock:
+            self.rate_factor = min(1.0, self.rate_factor + RECOVERY_STEP)
+            if remaining is not None and reset is not None:
+                try:
+                    exhausted = int(remaining) <= 0
+                except (TypeError, ValueError):
+                    exhausted = False
+                if exhausted:
+                    self.blocked_until = max(self.blocked_until, time.monotonic() + reset)
+
+
+def _header(headers, name):
+    """Read a header value as a string, tolerating missing or non-mapping headers."""
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    return value if isinstance(value, str) else None
+
+
+def get_rate_limiter():
+    """
+    Get the process-wide rate limiter built from the configured limits.
+
+    Returns:
+        RateLimiter: The shared limiter
+    """
+    global _limiter
+    requests_per_minute = get_requests_per_minute()
+    tokens_per_minute = get_tokens_per_minute()
+
+    with _limiter_lock:
+        if _limiter is None or _limiter.limits != (requests_per_minute, tokens_per_minute):
+            _limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        return _limiter
@@ -0,0 +1,144 @@
+"""
+Retry policy for transient API failures in the Company Owners Finder application.
+"""
+
+import contextvars
+import random
+import time
+from dataclasses import dataclass
+
+from owners_finder.config import (
+    get_rate_limit_retries,
+    get_retry_backoff_base,
+    get_retry_backoff_cap,
+    get_retry_deadline,
+    get_retry_max_attempts,
+    get_retry_statuses,
+)
+
+# Attempt log of the most recent API call in the current thread or task
+_last_attempts = contextvars.ContextVar("last_attempts", default=())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Settings controlling how failed API calls are retried."""
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    deadline: float = None
+    retryable_statuses: frozenset = frozenset({408, 425, 429, 500, 502, 503, 504})
+    rate_limit_retries: int = 5
+
+    def backoff(self, failures):
+        """
+        Compute a full-jitter backoff delay.
+
+        Args:
+            failures (int): Number of failed attempts so far (1 for the first retry)
+
+        Returns:
+            float: Seconds to wait, uniformly drawn from [0, min(cap, base * 2^(failures - 1))]
+        """
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (failures - 1)))
+
+
+def get_retry_policy():
+    """
+    Build the retry policy from the current configuration.
+
+    Returns:
+        RetryPolicy: The configured policy
+    """
+    return RetryPolicy(
+        max_attempts=get_retry_max_attempts(),
+        backoff_base=get_retry_backoff_base(),
+        backoff_cap=get_retry_backoff_cap(),
+        deadline=get_retry_deadline(),
+        retryable_statuses=get_retry_statuses(),
+        rate_limit_retries=get_rate_limit_retries(),
+    )
+
+
+def get_last_attempts():
+    """
+    Get the per-attempt timings of the most recent API call in this thread or task.
+
+    Returns:
+        tuple: One dict per attempt with attempt, status, error, elapsed and delay keys
+    """
+    return _last_attempts.get()
+
+
+class RetryState:
+    """
+    Tracks the attempts of a single API call and decides whether to retry.
+
+    Rate limited (429) responses draw from their own retry budget, since they
+    are flow control rather than failures; every other retryable status or
+    transport error counts towards max_attempts. The total deadline covers both.
+    """
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.started_at = time.monotonic()
+        self.attempts = []
+        self.failures = 0
+        self.rate_limited = 0
+        _last_attempts.set(())
+
+    def start_attempt(self):
+        """Mark the start of an attempt and return its start time."""
+        return time.monotonic()
+
+    def record(self, attempt_started, status=None, error=None):
+        """Record the outcome and duration of an attempt."""
+        self.attempts.append(
+            {
+                "attempt": len(self.attempts) + 1,
+                "status": status if isinstance(status, int) else None,
+                "error": str(error) if error is not None else None,
+                "elapsed": time.monotonic() - attempt_started,
+                "delay": 0.0,
+            }
+        )
+        _last_attempts.set(tuple(self.attempts))
+
+    def is_retryable_status(self, status):
+        """Check whether a response status should be retried."""
+        return isinstance(status, int) and status in self.policy.retryable_statuses
+
+    def next_delay(self, status=None, retry_after=None):
+        """
+        Decide whether to retry after the last recorded attempt.
+
+        Args:
+            status (int, optional): HTTP status of the failed attempt, None for transport errors
+            retry_after (float, optional): Server-requested wait for rate limited responses
+
+        Returns:
+            float or None: Seconds to wait before retrying, or None to give up
+        """
+        if status == 429:
+            self.rate_limited += 1
+            if self.rate_limited > self.policy.rate_limit_retries:
+                return None
+            # The rate limiter already holds every caller until Retry-After has passed
+            delay = 0.0
+            wait = retry_after or 0.0
+        else:
+            self.failures += 1
+            if self.failures >= self.policy.max_attempts:
+                return None
+            delay = self.policy.backoff(self.failures)
+            wait = delay
+
+        if self.policy.deadline is not None:
+            if time.monotonic() - self.started_at + wait > self.policy.deadline:
+                return None
+
+        if self.attempts:
+            self.attempts[-1]["delay"] = wait
+            _last_attempts.set(tuple(self.attempts))
+        return delay
@@ -0,0 +1,89 @@
+"""
+JSON serialization for the Company Owners Finder application.
+
+Uses orjson or msgspec when installed, which encode and decode several times
+faster than the standard library json module, and falls back to json
+otherwise. All backends produce UTF-8 bytes with non-ASCII text unescaped.
+"""
+
+import json
+
+from owners_finder.config import get_json_backend
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def get_backend():
+    """
+    Get the JSON backend in use.
+
+    Returns:
+        str: "orjson", "msgspec" or "json"
+
+    Raises:
+        ValueError: If the configured backend is not installed
+    """
+    backend = get_json_backend()
+    if backend == "auto":
+        if orjson is not None:
+            return "orjson"
+        if msgspec is not None:
+            return "msgspec"
+        return "json"
+    if (backend == "orjson" and orjson is None) or (backend == "msgspec" and msgspec is None):
+        raise ValueError(f"JSON backend {backend} is not installed")
+    return backend
+
+
+def dumps(data, pretty=False):
+    """
+    Encode a value as JSON.
+
+    Args:
+        data: Value made of dicts with string keys, lists, strings, numbers, booleans and None
+        pretty (bool): Indent by two spaces instead of the compact form
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    backend = get_backend()
+    if backend == "orjson":
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if backend == "msgspec":
+        encoded = msgspec.json.encode(data)
+        return msgspec.json.format(encoded, indent=2) if pretty else encoded
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """
+    Decode JSON.
+
+    Args:
+        data (bytes or str): JSON text
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    backend = get_backend()
+    if backend == "orjson":
+        return orjson.loads(data)
+    if backend == "msgspec":
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
@@ -0,0 +1,138 @@
+"""
+Request coalescing for the Company Owners Finder application.
+
+Concurrent callers asking for the same key share one in-flight call instead
+of each issuing their own, which keeps bursts for a popular company from
+multiplying against the API rate limit.
+"""
+
+import asyncio
+import copy
+import threading
+import weakref
+
+
+class _Call:
+    """State of one in-flight call shared by its leader and followers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key across threads.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait for it and receive a deep copy of its result, or its exception.
+    Once the call finishes the key is forgotten, so later callers start a new
+    call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.stats = {"calls": 0, "shared": 0}
+
+    def do(self, key, function, *args, **kwargs):
+        """
+        Run function(*args, **kwargs), or join an identical call already in flight.
+
+        Args:
+            key: Hashable identity of the call
+            function (callable): The function to run
+
+        Returns:
+            The function's result; followers get a private deep copy
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats["calls"] += 1
+            else:
+                call.followers += 1
+                self.stats["shared"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                followers = call.followers
+            if followers and call.error is None:
+                # Followers copy a snapshot, so the leader may mutate its own result
+                call.result = copy.deepcopy(result)
+            call.done.set()
+
+        return result
+
+
+class _AsyncCall:
+    """State of one in-flight coroutine shared by its leader and followers."""
+
+    def __init__(self):
+        self.task = None
+        self.followers = 0
+        self.result = None
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce concurrent coroutine calls with the same key on each event loop.
+
+    Callers await the shared task through asyncio.shield, so cancelling one
+    caller does not cancel the call for the others.
+    """
+
+    def __init__(self):
+        self._calls = weakref.WeakKeyDictionary()
+        self.stats = {"calls": 0, "shared": 0}
+
+    async def do(self, key, function, *args, **kwargs):
+        """
+        Await function(*args, **kwargs), or join an identical call already in flight.
+
+        Args:
+            key: Hashable identity of the call
+            function (callable): Coroutine function to run
+
+        Returns:
+            The coroutine's result; followers get a private deep copy
+        """
+        calls = self._calls.setdefault(asyncio.get_running_loop(), {})
+        call = calls.get(key)
+        if call is not None:
+            call.followers += 1
+            self.stats["shared"] += 1
+            await asyncio.shield(call.task)
+            return copy.deepcopy(call.result)
+
+        call = calls[key] = _AsyncCall()
+        self.stats["calls"] += 1
+        call.task = asyncio.ensure_future(self._run(calls, key, call, function, args, kwargs))
+        return await asyncio.shield(call.task)
+
+    async def _run(self, calls, key, call, function, args, kwargs):
+        """Run the shared coroutine and snapshot its result for followers."""
+        try:
+            result = await function(*args, **kwargs)
+        finally:
+            # Forget the key before the task completes, so nobody joins a finished call
+            calls.pop(key, None)
+        if call.followers:
+            call.result = copy.deepcopy(result)
+        return result
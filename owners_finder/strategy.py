@@ -0,0 +1,301 @@
+"""
+Learned prompt strategy for the Company Owners Finder application.
+
+The standard flow asks the company prompt first and makes a second,
+owners-specific call when the answer has no owners. For companies where the
+first answer rarely has owners, that second round trip is almost always
+needed, so asking the combined prompt straight away is cheaper. This module
+keeps per-bucket statistics of how each strategy performs and picks one
+for every lookup.
+"""
+
+import json
+import os
+import random
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from owners_finder.canonical import canonicalize_url
+from owners_finder.config import (
+    get_strategy_explore_rate,
+    get_strategy_min_samples,
+    get_strategy_min_success_rate,
+    get_strategy_stats_path,
+)
+
+STRATEGY_STANDARD = "standard"
+STRATEGY_COMBINED = "combined"
+
+# Number of recorded lookups between saves of the statistics file
+SAVE_INTERVAL = 25
+
+_strategy = None
+_strategy_lock = threading.Lock()
+
+
+def get_lookup_buckets(website_url, industry=None):
+    """
+    Get the statistics buckets a lookup belongs to, most specific first.
+
+    Args:
+        website_url (str): The company website URL
+        industry (str, optional): Industry reported for the company
+
+    Returns:
+        list: Bucket names such as "domain:example.co.uk", "industry:fintech" and "tld:uk"
+    """
+    domain = urlsplit(canonicalize_url(website_url)).netloc
+    buckets = []
+    if domain:
+        buckets.append(f"domain:{domain}")
+    if industry:
+        buckets.append(f"industry:{industry.strip().lower()}")
+    if domain and "." in domain:
+        buckets.append(f"tld:{domain.rsplit('.', 1)[-1]}")
+    return buckets
+
+
+def _empty_bucket():
+    """Create the counters kept for one bucket."""
+    return {
+        STRATEGY_STANDARD: {"lookups": 0, "first_call_owners": 0, "owners": 0, "round_trips": 0},
+        STRATEGY_COMBINED: {"lookups": 0, "owners": 0, "round_trips": 0},
+    }
+
+
+class StrategyStats:
+    """
+    Per-bucket success statistics of the standard and combined prompt strategies.
+
+    Statistics are kept in memory, shared between threads, and written to a
+    JSON file every SAVE_INTERVAL lookups and on close.
+    """
+
+    def __init__(self, path, min_samples=20, min_success_rate=0.3, explore_rate=0.1):
+        """
+        Load (or start) the statistics file.
+
+        Args:
+            path (str or Path): JSON statistics file
+            min_samples (int): Lookups a bucket needs before it influences decisions
+            min_success_rate (float): First-call owners rate below which a bucket switches
+                to the combined prompt, until the combined prompt has its own samples
+            explore_rate (float): Share of lookups in switched buckets that still use
+                the standard prompt, so its statistics keep up to date
+        """
+        self.path = Path(path)
+        self.min_samples = min_samples
+        self.min_success_rate = min_success_rate
+        self.explore_rate = explore_rate
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        # Industry seen for each domain, so repeat lookups can use industry buckets
+        self.domain_industries = {}
+        self.buckets = {}
+        self.load()
+
+    def load(self):
+        """Read statistics from the file, ignoring a missing or unreadable file."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        if isinstance(data, dict):
+            self.buckets = {name: {**_empty_bucket(), **counts} for name, counts in data.get("buckets", {}).items()}
+            self.domain_industries = dict(data.get("domain_industries", {}))
+
+    def save(self):
+        """Write statistics to the file atomically."""
+        with self._lock:
+            data = {"buckets": self.buckets, "domain_industries": self.domain_industries}
+            encoded = json.dumps(data, indent=2, sort_keys=True)
+            self._unsaved = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            f.write(encoded)
+        os.replace(temporary_path, self.path)
+
+    def _get_buckets(self, website_url):
+        """Get the buckets of a URL, including the industry bucket when the domain's industry is known."""
+        buckets = get_lookup_buckets(website_url)
+        industry = self.domain_industries.get(buckets[0]) if buckets else None
+        return get_lookup_buckets(website_url, industry) if industry else buckets
+
+    def choose(self, website_url):
+        """
+        Pick the prompt strategy for a lookup.
+
+        The most specific bucket with at least min_samples standard lookups
+        decides. Once the combined prompt also has min_samples lookups there,
+        the strategy with fewer round trips per record with owners wins.
+        Otherwise the combined prompt is used when the first call finds owners
+        less often than min_success_rate.
+
+        Args:
+            website_url (str): The company website URL
+
+        Returns:
+            str: STRATEGY_STANDARD or STRATEGY_COMBINED
+        """
+        with self._lock:
+            for bucket in self._get_buckets(website_url):
+                counts = self.buckets.get(bucket)
+                if counts is None or counts[STRATEGY_STANDARD]["lookups"] < self.min_samples:
+                    continue
+                strategy = self._decide(counts)
+                break
+            else:
+                return STRATEGY_STANDARD
+
+        if strategy == STRATEGY_COMBINED and random.random() < self.explore_rate:
+            return STRATEGY_STANDARD
+        return strategy
+
+    def _decide(self, counts):
+        """Decide between the strategies for one bucket's counters."""
+        standard = counts[STRATEGY_STANDARD]
+        combined = counts[STRATEGY_COMBINED]
+        if combined["lookups"] >= self.min_samples:
+            if _get_round_trips_per_success(combined) < _get_round_trips_per_success(standard):
+                return STRATEGY_COMBINED
+            return STRATEGY_STANDARD
+        if standard["first_call_owners"] / standard["lookups"] < self.min_success_rate:
+            return STRATEGY_COMBINED
+        return STRATEGY_STANDARD
+
+    def record(self, website_url, strategy, first_call_owners, found_owners, round_trips, industry=None):
+        """
+        Record the outcome of a lookup.
+
+        Args:
+            website_url (str): The company website URL
+            strategy (str): STRATEGY_STANDARD or STRATEGY_COMBINED
+            first_call_owners (bool): The first response already had owners
+            found_owners (bool): The final record has owners
+            round_trips (int): Number of API calls made
+            industry (str, optional): Industry reported for the company
+        """
+        buckets = get_lookup_buckets(website_url, industry)
+        with self._lock:
+            if industry and buckets:
+                self.domain_industries[buckets[0]] = industry.strip().lower()
+            for bucket in buckets:
+                counts = self.buckets.setdefault(bucket, _empty_bucket())[strategy]
+                counts["lookups"] += 1
+                counts["owners"] += int(found_owners)
+                counts["round_trips"] += round_trips
+                if strategy == STRATEGY_STANDARD:
+                    counts["first_call_owners"] += int(first_call_owners)
+            self._unsaved += 1
+            should_save = self._unsaved >= SAVE_INTERVAL
+
+        if should_save:
+            self.save()
+
+    def report(self, min_lookups=1, limit=20):
+        """
+        Summarize the busiest buckets.
+
+        Args:
+            min_lookups (int): Skip buckets with fewer lookups
+            limit (int): Maximum number of buckets to list
+
+        Returns:
+            list: One dict per bucket with lookup counts, first-call owners rate,
+                round trips per record with owners for each strategy and the current decision
+        """
+        with self._lock:
+            rows = []
+            for bucket, counts in self.buckets.items():
+                standard = counts[STRATEGY_STANDARD]
+                combined = counts[STRATEGY_COMBINED]
+                lookups = standard["lookups"] + combined["lookups"]
+                if lookups < min_lookups or bucket.startswith("domain:"):
+                    continue
+                rows.append(
+                    {
+                        "bucket": bucket,
+                        "lookups": lookups,
+                        "first_call_owners_rate": (
+                            standard["first_call_owners"] / standard["lookups"] if standard["lookups"] else None
+                        ),
+                        "standard_round_trips_per_success": _get_round_trips_per_success(standard),
+                        "combined_round_trips_per_success": _get_round_trips_per_success(combined),
+                        "strategy": (
+                            self._decide(counts) if standard["lookups"] >= self.min_samples else STRATEGY_STANDARD
+                        ),
+                    }
+                )
+
+        rows.sort(key=lambda row: row["lookups"], reverse=True)
+        return rows[:limit]
+
+    def close(self):
+        """Save the statistics."""
+        self.save()
+
+
+def _get_round_trips_per_success(counts):
+    """Get API calls spent per record with owners, or None before any success."""
+    if not counts["owners"]:
+        return None if not counts["lookups"] else float("inf")
+    return counts["round_trips"] / counts["owners"]
+
+
+def format_strategy_report(rows):
+    """
+    Format report rows from StrategyStats.report as a text table.
+
+    Args:
+        rows (list): Report rows
+
+    Returns:
+        str: The table
+    """
+
+    def number(value):
+        if value is None:
+            return "-"
+        if value == float("inf"):
+            return "inf"
+        return f"{value:.2f}"
+
+    lines = [f"{'Bucket':<30} {'Lookups':>8} {'1st call':>9} {'Std RT/ok':>10} {'Comb RT/ok':>11}  Strategy"]
+    for row in rows:
+        rate = row["first_call_owners_rate"]
+        lines.append(
+            f"{row['bucket']:<30} {row['lookups']:>8} {(f'{rate:.0%}' if rate is not None else '-'):>9} "
+            f"{number(row['standard_round_trips_per_success']):>10} "
+            f"{number(row['combined_round_trips_per_success']):>11}  {row['strategy']}"
+        )
+    return "\n".join(lines)
+
+
+def get_strategy_stats():
+    """
+    Get the shared strategy statistics for the configured path.
+
+    Returns:
+        StrategyStats or None: The statistics, or None if the adaptive strategy is disabled
+    """
+    global _strategy
+    path = get_strategy_stats_path()
+    if not path:
+        return None
+
+    with _strategy_lock:
+        if _strategy is None or _strategy.path != Path(path):
+            if _strategy is not None:
+                _strategy.close()
+            _strategy = StrategyStats(
+                path,
+                min_samples=get_strategy_min_samples(),
+                min_success_rate=get_strategy_min_success_rate(),
+                explore_rate=get_strategy_explore_rate(),
+            )
+        return _strategy
@@ -0,0 +1,276 @@
+"""
+Token usage and cost accounting for the Company Owners Finder application.
+
+Every API call, whether answered live or from the response cache, is
+recorded into process-wide totals and into the usage collector of the lookup
+it belongs to, if any. Lookups that actually ran are counted too, for
+per-company figures. Totals are kept per model, so costs can be estimated
+from per-token and per-request prices.
+"""
+
+import contextvars
+import functools
+import inspect
+import threading
+from contextlib import contextmanager
+
+from owners_finder.config import get_include_usage_enabled, get_usage_prices
+
+# Usage collector of the lookup running in the current thread or task
+_current_usage = contextvars.ContextVar("owners_finder_usage", default=None)
+
+
+def _empty_model_usage():
+    """Create the counters kept for one model."""
+    return {
+        "requests": 0,
+        "cached_requests": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "truncated": 0,
+        "max_completion_tokens": 0,
+    }
+
+
+def get_response_usage(api_response):
+    """
+    Read token counts from an API response.
+
+    Args:
+        api_response (dict): The raw API response
+
+    Returns:
+        tuple: (prompt_tokens, completion_tokens, truncated) where truncated is True
+            when the answer stopped at max_tokens; counts are 0 without a usage block
+    """
+    if not isinstance(api_response, dict):
+        return 0, 0, False
+    usage = api_response.get("usage")
+    usage = usage if isinstance(usage, dict) else {}
+    prompt_tokens = usage.get("prompt_tokens")
+    completion_tokens = usage.get("completion_tokens")
+    choices = api_response.get("choices")
+    finish_reason = choices[0].get("finish_reason") if choices and isinstance(choices[0], dict) else None
+    return (
+        prompt_tokens if isinstance(prompt_tokens, int) else 0,
+        completion_tokens if isinstance(completion_tokens, int) else 0,
+        finish_reason == "length",
+    )
+
+
+class UsageTotals:
+    """Request and token counts per model, shared between threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.models = {}
+        self.lookups = 0
+
+    def record(self, model, api_response, cached=False):
+        """
+        Record one API call.
+
+        Args:
+            model (str): Model the request was sent to
+            api_response (dict): The raw API response
+            cached (bool): The response came from the response cache; it is counted
+                as a request, but its tokens were paid for by an earlier call
+        """
+        prompt_tokens, completion_tokens, truncated = get_response_usage(api_response)
+        with self._lock:
+            counts = self.models.get(model)
+            if counts is None:
+                counts = self.models[model] = _empty_model_usage()
+            counts["requests"] += 1
+            if cached:
+                counts["cached_requests"] += 1
+                return
+            counts["prompt_tokens"] += prompt_tokens
+            counts["completion_tokens"] += completion_tokens
+            counts["truncated"] += int(truncated)
+            counts["max_completion_tokens"] = max(counts["max_completion_tokens"], completion_tokens)
+
+    def record_lookup(self):
+        """Count one lookup that ran, as opposed to one answered from a shared or remembered result."""
+        with self._lock:
+            self.lookups += 1
+
+    def reset(self):
+        """Forget all recorded calls."""
+        with self._lock:
+            self.models = {}
+            self.lookups = 0
+
+    def summary(self, prices=None):
+        """
+        Summarize the recorded calls.
+
+        Cached responses count as requests but not towards tokens or cost.
+
+        Args:
+            prices (dict, optional): Prices per model, see get_usage_prices; defaults to the configured prices
+
+        Returns:
+            dict: Lookups run, request counts, token counts, models used and estimated
+                cost in USD (None if a model used has no price)
+        """
+        prices = get_usage_prices() if prices is None else prices
+        with self._lock:
+            models = {model: dict(counts) for model, counts in self.models.items()}
+            lookups = self.lookups
+
+        prompt_tokens = sum(counts["prompt_tokens"] for counts in models.values())
+        completion_tokens = sum(counts["completion_tokens"] for counts in models.values())
+        summary = {
+            "lookups": lookups,
+            "requests": sum(counts["requests"] for counts in models.values()),
+            "cached_requests": sum(counts["cached_requests"] for counts in models.values()),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "truncated": sum(counts["truncated"] for counts in models.values()),
+            "max_completion_tokens": max((counts["max_completion_tokens"] for counts in models.values()), default=0),
+            "models": sorted(models),
+            "estimated_cost_usd": 0.0,
+        }
+
+        for model, counts in models.items():
+            price = prices.get(model)
+            if price is None:
+                summary["estimated_cost_usd"] = None
+                break
+            summary["estimated_cost_usd"] += estimate_cost(counts, price)
+        if summary["estimated_cost_usd"] is not None:
+            summary["estimated_cost_usd"] = round(summary["estimated_cost_usd"], 6)
+        return summary
+
+
+def estimate_cost(counts, price):
+    """
+    Estimate the cost of one model's live requests.
+
+    Args:
+        counts (dict): Counters of one model, see UsageTotals
+        price (dict): "input" and "output" USD per million tokens, "request" USD per request
+
+    Returns:
+        float: Estimated USD
+    """
+    return (
+        counts["prompt_tokens"] * price.get("input", 0) / 1_000_000
+        + counts["completion_tokens"] * price.get("output", 0) / 1_000_000
+        + (counts["requests"] - counts["cached_requests"]) * price.get("request", 0)
+    )
+
+
+usage_totals = UsageTotals()
+
+
+def record_api_usage(model, api_response, cached=False):
+    """
+    Record one API call in the process-wide totals and the current lookup's collector.
+
+    Args:
+        model (str): Model the request was sent to
+        api_response (dict): The raw API response
+        cached (bool): The response came from the response cache
+    """
+    usage_totals.record(model, api_response, cached)
+    collector = _current_usage.get()
+    if collector is not None:
+        collector.record(model, api_response, cached)
+
+
+def record_lookup():
+    """Count one lookup that ran in the process-wide totals and the current collector."""
+    usage_totals.record_lookup()
+    collector = _current_usage.get()
+    if collector is not None:
+        collector.record_lookup()
+
+
+@contextmanager
+def collect_usage():
+    """
+    Collect the usage of the API calls made inside the block.
+
+    Calls made by asyncio tasks created inside the block are included. Work
+    submitted to other threads is included when it runs in a copy of the
+    current context (contextvars.copy_context).
+
+    Yields:
+        UsageTotals: The block's usage
+    """
+    collector = UsageTotals()
+    token = _current_usage.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_usage.reset(token)
+
+
+def attach_usage(function):
+    """
+    Decorator collecting the usage of a lookup function's API calls.
+
+    When INCLUDE_USAGE is enabled, the summary is stored under "usage" in the
+    returned company info. Works for functions and coroutine functions. Apply
+    it outside any sharing of results, so a caller handed another call's
+    result reports no usage instead of a copy of the other call's.
+    """
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            with collect_usage() as usage:
+                company_info = await function(*args, **kwargs)
+            if get_include_usage_enabled():
+                company_info["usage"] = usage.summary()
+            return company_info
+
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with collect_usage() as usage:
+            company_info = function(*args, **kwargs)
+        if get_include_usage_enabled():
+            company_info["usage"] = usage.summary()
+        return company_info
+
+    return wrapper
+
+
+def format_usage_report(summary, elapsed_seconds=None, lookups=None):
+    """
+    Format a usage summary as text lines.
+
+    Args:
+        summary (dict): Result of UsageTotals.summary
+        elapsed_seconds (float, optional): Wall time, for tokens per second
+        lookups (int, optional): Number of lookups that ran, for per-company figures
+
+    Returns:
+        str: The report
+    """
+    live_requests = summary["requests"] - summary["cached_requests"]
+    lines = [
+        f"API requests: {summary['requests']} ({live_requests} live, {summary['cached_requests']} cached)",
+        f"Tokens: {summary['total_tokens']} ({summary['prompt_tokens']} prompt, {summary['completion_tokens']} completion)",
+        f"Largest completion: {summary['max_completion_tokens']} tokens, "
+        f"{summary['truncated']} response(s) cut off at max_tokens",
+    ]
+    if elapsed_seconds:
+        lines.append(f"Throughput: {summary['total_tokens'] / elapsed_seconds:.1f} tokens/sec")
+    if lookups:
+        lines.append(
+            f"Per company: {summary['requests'] / lookups:.2f} requests, {summary['total_tokens'] / lookups:.0f} tokens"
+        )
+
+    cost = summary["estimated_cost_usd"]
+    if cost is None:
+        lines.append(f"Estimated cost: unknown (no price for {', '.join(summary['models'])}; set USAGE_PRICES)")
+    else:
+        per_company = f", ${cost / lookups:.5f} per company" if lookups else ""
+        lines.append(f"Estimated cost: ${cost:.4f}{per_company}")
+    return "\n".join(lines)
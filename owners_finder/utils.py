@@ -1,28 +1,61 @@
-import json
+import gzip
+import os
+import threading
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlsplit
 
+from owners_finder.config import get_json_pretty
+from owners_finder.inputs import get_input_name
+from owners_finder.metrics import timed
+from owners_finder.serialization import dumps
 
-def save_to_json(data, folder=Path("results"), filename=None):
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+
+@timed("save_to_json")
+def get_result_name(data):
+    """
+    Get a filename-safe name for a company result.
+
+    Args:
+        data (dict): Company information
+
+    Returns:
+        str: The lower-cased company name, or the website domain for lookups
+            that did not ask for the name, or "unknown_company"
+    """
+    company_name = data.get("company_name")
+    if not company_name and data.get("website"):
+        company_name = urlsplit(data["website"]).netloc.replace(".", "_")
+    company_name = company_name or "unknown_company"
+    clean_name = "".join(c for c in str(company_name) if c.isalnum() or c in (" ", "-", "_")).rstrip()
+    clean_name = clean_name.replace(" ", "_").lower()
+    # If name becomes empty after cleaning
+    return clean_name or "unknown_company"
+
+
+def save_to_json(data, folder=Path("results"), filename=None, pretty=None):
     """
     Save company data to a JSON file in a date-based folder structure.
 
     Args:
         data (dict): Company information to save
         folder (Path): Base results folder
-        filename (str, optional): Output filename. If not provided, uses company name.
+        filename (str, optional): Output filename. If not provided, uses the company name,
+            or the website domain for lookups that did not ask for the name.
+        pretty (bool, optional): Indent the JSON; defaults to the JSON_PRETTY setting
 
     Returns:
         str: The filename that was used
     """
     if not filename:
-        company_name = data.get("company_name") or "unknown_company"
-        # Clean company name for filename
-        clean_name = "".join(c for c in str(company_name) if c.isalnum() or c in (" ", "-", "_")).rstrip()
-        clean_name = clean_name.replace(" ", "_").lower()
-        if not clean_name:  # If name becomes empty after cleaning
-            clean_name = "unknown_company"
-        filename = f"{clean_name}_info.json"
+        filename = f"{get_result_name(data)}_info.json"
     else:
         # Ensure filename has .json extension
         if not filename.endswith('.json'):
@@ -37,7 +70,190 @@ def save_to_json(data, folder=Path("results"), filename=None):
 
     file_path = date_folder / filename
     
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if pretty is None:
+        pretty = get_json_pretty()
+    with open(file_path, "wb") as f:
+        f.write(dumps(data, pretty=pretty))
 
     return file_path
+
+
+def get_compression_for_path(path):
+    """
+    Infer the compression of an output file from its extension.
+
+    Args:
+        path (str or Path): Output file path
+
+    Returns:
+        str: "gzip", "zstd" or "none"
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gz":
+        return "gzip"
+    if suffix in (".zst", ".zstd"):
+        return "zstd"
+    return "none"
+
+
+class JsonlSink:
+    """
+    Streams compact JSON records to a single JSON Lines file.
+
+    Records are written sequentially and flushed every flush_every records,
+    optionally followed by an fsync so a crash loses at most one batch of
+    records. Writes are serialized, so a sink can be shared between threads.
+    Work that must wait until a record is on disk, such as marking it done in
+    a checkpoint journal, can be deferred with after_flush.
+    """
+
+    def __init__(self, path, compression=None, flush_every=100, fsync=False, append=False):
+        """
+        Open the output file.
+
+        Args:
+            path (str or Path): Output file path; parent folders are created
+            compression (str, optional): "none", "gzip" or "zstd"; inferred from the
+                extension when not given
+            flush_every (int): Number of records between flushes
+            fsync (bool): Also fsync the file on every flush
+            append (bool): Append to an existing file instead of replacing it
+        """
+        self.path = Path(path)
+        self.compression = compression or get_compression_for_path(path)
+        if self.compression not in COMPRESSIONS:
+            raise ValueError(f"Invalid compression: {self.compression}. Expected one of: {', '.join(COMPRESSIONS)}")
+        if self.compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+
+        self.flush_every = max(1, flush_every)
+        self.fsync = fsync
+        self.count = 0
+        self._flushed_count = 0
+        self._flush_callbacks = []
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._raw = open(self.path, "ab" if append else "wb")
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="ab")
+        elif self.compression == "zstd":
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+
+    @timed("write_jsonl")
+    def write(self, record):
+        """
+        Append one record as a compact JSON line.
+
+        Args:
+            record (dict): Record to write
+        """
+        line = dumps(record) + b"\n"
+        with self._lock:
+            self._stream.write(line)
+            self.count += 1
+            if self.count % self.flush_every == 0:
+                self._flush()
+
+    def after_flush(self, callback):
+        """
+        Run a callback once every record written so far has been flushed.
+
+        Runs right away if nothing is buffered, otherwise at the next flush or
+        when the sink is closed. Callbacks run in the order they were added.
+
+        Args:
+            callback (callable): Called without arguments
+        """
+        with self._lock:
+            if self._flushed_count == self.count:
+                callback()
+            else:
+                self._flush_callbacks.append(callback)
+
+    def flush(self):
+        """Flush buffered records to disk."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self.compression == "zstd":
+            self._stream.flush(zstandard.FLUSH_BLOCK)
+        elif self._stream is not self._raw:
+            self._stream.flush()
+        self._raw.flush()
+        if self.fsync:
+            os.fsync(self._raw.fileno())
+        self._run_flush_callbacks()
+
+    def _run_flush_callbacks(self):
+        self._flushed_count = self.count
+        callbacks, self._flush_callbacks = self._flush_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def close(self):
+        """Flush remaining records and close the file."""
+        with self._lock:
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.flush()
+            if self.fsync:
+                os.fsync(self._raw.fileno())
+            self._raw.close()
+            self._run_flush_callbacks()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def get_resume_output_path(path):
+    """
+    Get a path for the records of a resumed batch run.
+
+    An interrupted run can leave a compressed stream cut off mid-block, and
+    anything appended after it would be unreadable. Resumed runs therefore
+    write a new part next to the existing output.
+
+    Args:
+        path (str or Path): Output path of the original run
+
+    Returns:
+        Path: path itself if it does not exist yet, otherwise the first free
+            "<name>.partN<extension>", e.g. "urls.part2.jsonl.gz"
+    """
+    path = Path(path)
+    if not path.exists():
+        return path
+
+    suffixes = path.suffixes
+    extension = "".join(suffixes[-2:]) if suffixes and suffixes[-1] in (".gz", ".zst") else path.suffix
+    stem = path.name[: len(path.name) - len(extension)] if extension else path.name
+    part = 2
+    while True:
+        candidate = path.with_name(f"{stem}.part{part}{extension}")
+        if not candidate.exists():
+            return candidate
+        part += 1
+
+
+def get_default_jsonl_path(file_path, folder=Path("results"), compression="none"):
+    """
+    Get the JSON Lines output path for a batch input file.
+
+    Args:
+        file_path (str): The batch input file
+        folder (Path): Base results folder
+        compression (str): Output compression, used for the file extension
+
+    Returns:
+        Path: results/YYYY-MM-DD/<input name>.jsonl[.gz|.zst]
+    """
+    extension = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}.get(compression, ".jsonl")
+    today = datetime.now().strftime("%Y-%m-%d")
+    return folder / today / f"{get_input_name(file_path)}{extension}"
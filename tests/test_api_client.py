@@ -2,12 +2,35 @@
 Tests for the api_client module.
 """
 
+import json
+from functools import partial
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 import requests
 
-from owners_finder.api_client import call_perplexity_api, create_company_prompt, extract_content_from_response
+from owners_finder.api_client import (
+    COMPACT_SYSTEM_MESSAGE,
+    COMPANY_FIELDS,
+    DEFAULT_MAX_TOKENS,
+    SYSTEM_MESSAGE,
+    build_payload,
+    build_response_format,
+    call_perplexity_api,
+    call_perplexity_api_async,
+    close_async_client,
+    close_session,
+    create_compact_company_prompt,
+    create_compact_owners_prompt,
+    create_company_prompt,
+    create_owners_prompt,
+    extract_content_from_response,
+    get_async_client,
+    get_max_tokens,
+    get_prompt_fields,
+    get_session,
+)
 
 
 def test_create_company_prompt():
@@ -22,20 +45,93 @@ def test_create_company_prompt():
     assert "JSON" in prompt
 
 
-@patch("owners_finder.api_client.requests.post")
+def test_build_payload_response_format():
+    """Test that a structured output format is only sent when requested."""
+    response_format = build_response_format({"type": "object"})
+
+    assert "response_format" not in build_payload("prompt")
+    assert build_payload("prompt", response_format=response_format)["response_format"] == {
+        "type": "json_schema",
+        "json_schema": {"schema": {"type": "object"}},
+    }
+
+
+def test_build_payload_compact_options():
+    """Test that max_tokens and the system message can be set per request."""
+    payload = build_payload("prompt")
+    assert payload["max_tokens"] == DEFAULT_MAX_TOKENS
+    assert payload["messages"][0]["content"] == SYSTEM_MESSAGE
+
+    payload = build_payload("prompt", max_tokens=200, system_message=COMPACT_SYSTEM_MESSAGE)
+    assert payload["max_tokens"] == 200
+    assert payload["messages"][0]["content"] == COMPACT_SYSTEM_MESSAGE
+
+
+def test_get_prompt_fields():
+    """Test that field selections are returned in record order and unknown fields are rejected."""
+    assert get_prompt_fields() == COMPANY_FIELDS
+    assert get_prompt_fields(["owners", "company_name"]) == ("company_name", "owners")
+
+    with pytest.raises(ValueError, match="Unknown fields: revenue"):
+        get_prompt_fields(["company_name", "revenue"])
+    with pytest.raises(ValueError, match="No fields selected"):
+        get_prompt_fields([])
+
+
+def test_get_max_tokens():
+    """Test that max_tokens grows with the requested fields and stays below the default."""
+    assert get_max_tokens(["company_name"]) < get_max_tokens(["company_name", "owners"])
+    assert get_max_tokens(COMPANY_FIELDS) < DEFAULT_MAX_TOKENS
+
+
+def test_create_compact_prompts():
+    """Test that compact prompts list only the requested fields and are shorter than the verbose prompt."""
+    url = "https://example.com"
+    prompt = create_compact_company_prompt(url, fields=("company_name", "owners"))
+
+    assert url in prompt
+    assert "company_name" in prompt
+    assert "owners" in prompt
+    assert "industry" not in prompt
+    assert len(create_compact_company_prompt(url)) < len(create_company_prompt(url)) / 3
+    assert "shareholders" in create_compact_company_prompt(url, thorough_owners=True)
+
+    owners_prompt = create_compact_owners_prompt("Example GmbH")
+    assert "Example GmbH" in owners_prompt
+    assert "management" in owners_prompt
+
+
+def test_create_prompts_for_selected_fields():
+    """Test that verbose prompts only ask for the selected fields."""
+    prompt = create_company_prompt("https://example.com", fields=("company_name", "owners"))
+
+    assert "- company_name\n- owners" in prompt
+    assert "industry" not in prompt
+    assert "management" not in prompt
+    assert len(prompt) < len(create_company_prompt("https://example.com"))
+
+    owners_prompt = create_owners_prompt("Example GmbH", fields=("owners",))
+    assert "ownership_percentage" in owners_prompt
+    assert "management" not in owners_prompt
+    assert owners_prompt.lstrip().startswith("Find the owners of Example GmbH.")
+    assert "management" not in create_compact_owners_prompt("Example GmbH", ("owners",))
+
+
+@patch("owners_finder.api_client.get_session")
 @patch("owners_finder.api_client.get_api_headers")
 @patch("owners_finder.api_client.get_api_base_url")
 @patch("owners_finder.api_client.get_request_timeout")
-def test_call_perplexity_api_success(mock_timeout, mock_base_url, mock_headers, mock_post):
+def test_call_perplexity_api_success(mock_timeout, mock_base_url, mock_headers, mock_session):
     """Test successful API call."""
     # Mock configuration
     mock_timeout.return_value = 30
     mock_base_url.return_value = "https://api.perplexity.ai"
     mock_headers.return_value = {"Authorization": "Bearer test-key"}
+    mock_post = mock_session.return_value.post
 
     # Mock response
     mock_response = Mock()
-    mock_response.json.return_value = {"choices": [{"message": {"content": "test response"}}]}
+    mock_response.content = json.dumps({"choices": [{"message": {"content": "test response"}}]}).encode("utf-8")
     mock_response.raise_for_status.return_value = None
     mock_post.return_value = mock_response
 
@@ -46,16 +142,17 @@ def test_call_perplexity_api_success(mock_timeout, mock_base_url, mock_headers,
     mock_post.assert_called_once()
 
 
-@patch("owners_finder.api_client.requests.post")
+@patch("owners_finder.api_client.get_session")
 @patch("owners_finder.api_client.get_api_headers")
 @patch("owners_finder.api_client.get_api_base_url")
 @patch("owners_finder.api_client.get_request_timeout")
-def test_call_perplexity_api_request_error(mock_timeout, mock_base_url, mock_headers, mock_post):
+def test_call_perplexity_api_request_error(mock_timeout, mock_base_url, mock_headers, mock_session):
     """Test API call with request error."""
     # Mock configuration
     mock_timeout.return_value = 30
     mock_base_url.return_value = "https://api.perplexity.ai"
     mock_headers.return_value = {"Authorization": "Bearer test-key"}
+    mock_post = mock_session.return_value.post
 
     mock_post.side_effect = requests.RequestException("Connection error")
 
@@ -63,20 +160,21 @@ def test_call_perplexity_api_request_error(mock_timeout, mock_base_url, mock_hea
         call_perplexity_api("test prompt")
 
 
-@patch("owners_finder.api_client.requests.post")
+@patch("owners_finder.api_client.get_session")
 @patch("owners_finder.api_client.get_api_headers")
 @patch("owners_finder.api_client.get_api_base_url")
 @patch("owners_finder.api_client.get_request_timeout")
-def test_call_perplexity_api_json_error(mock_timeout, mock_base_url, mock_headers, mock_post):
+def test_call_perplexity_api_json_error(mock_timeout, mock_base_url, mock_headers, mock_session):
     """Test API call with JSON decode error."""
     # Mock configuration
     mock_timeout.return_value = 30
     mock_base_url.return_value = "https://api.perplexity.ai"
     mock_headers.return_value = {"Authorization": "Bearer test-key"}
+    mock_post = mock_session.return_value.post
 
     # Mock response with invalid JSON
     mock_response = Mock()
-    mock_response.json.side_effect = ValueError("Invalid JSON")
+    mock_response.content = b"not json"
     mock_response.raise_for_status.return_value = None
     mock_post.return_value = mock_response
 
@@ -84,6 +182,99 @@ def test_call_perplexity_api_json_error(mock_timeout, mock_base_url, mock_header
         call_perplexity_api("test prompt")
 
 
+def test_get_session_is_shared():
+    """Test that the requests session is created once and reused."""
+    close_session()
+    try:
+        with patch("owners_finder.api_client.get_http_pool_size", return_value=4):
+            session = get_session()
+
+            assert get_session() is session
+            adapter = session.get_adapter("https://api.perplexity.ai")
+            assert adapter._pool_maxsize == 4
+    finally:
+        close_session()
+
+
+def test_close_session_resets_pool():
+    """Test that closing the session makes the next call create a new one."""
+    session = get_session()
+    close_session()
+
+    assert get_session() is not session
+    close_session()
+
+
+@pytest.mark.asyncio
+async def test_get_async_client_is_shared_per_loop():
+    """Test that the async client is reused within an event loop."""
+    client = get_async_client()
+
+    assert get_async_client() is client
+
+    await close_async_client()
+    assert client.is_closed
+    assert get_async_client() is not client
+    await close_async_client()
+
+
+def mock_async_client(handler):
+    """Patch httpx.AsyncClient so requests are served by the given handler."""
+    return patch(
+        "owners_finder.api_client.httpx.AsyncClient",
+        partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    )
+
+
+@pytest.mark.asyncio
+@patch("owners_finder.api_client.get_api_headers")
+@patch("owners_finder.api_client.get_api_base_url")
+async def test_call_perplexity_api_async_success(mock_base_url, mock_headers):
+    """Test successful async API call."""
+    mock_base_url.return_value = "https://api.perplexity.ai"
+    mock_headers.return_value = {"Authorization": "Bearer test-key"}
+
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "test response"}}]})
+
+    with mock_async_client(handler):
+        result = await call_perplexity_api_async("test prompt")
+
+    assert result == {"choices": [{"message": {"content": "test response"}}]}
+    assert len(requests_seen) == 1
+    assert str(requests_seen[0].url) == "https://api.perplexity.ai/chat/completions"
+    assert b"test prompt" in requests_seen[0].content
+
+
+@pytest.mark.asyncio
+@patch("owners_finder.api_client.get_api_headers")
+@patch("owners_finder.api_client.get_api_base_url")
+async def test_call_perplexity_api_async_http_error(mock_base_url, mock_headers):
+    """Test async API call with an HTTP error status."""
+    mock_base_url.return_value = "https://api.perplexity.ai"
+    mock_headers.return_value = {"Authorization": "Bearer test-key"}
+
+    with mock_async_client(lambda request: httpx.Response(404)):
+        with pytest.raises(requests.RequestException, match="API call failed"):
+            await call_perplexity_api_async("test prompt")
+
+
+@pytest.mark.asyncio
+@patch("owners_finder.api_client.get_api_headers")
+@patch("owners_finder.api_client.get_api_base_url")
+async def test_call_perplexity_api_async_json_error(mock_base_url, mock_headers):
+    """Test async API call with invalid JSON in the response."""
+    mock_base_url.return_value = "https://api.perplexity.ai"
+    mock_headers.return_value = {"Authorization": "Bearer test-key"}
+
+    with mock_async_client(lambda request: httpx.Response(200, content=b"not json")):
+        with pytest.raises(ValueError, match="Invalid JSON response"):
+            await call_perplexity_api_async("test prompt")
+
+
 def test_extract_content_from_response_success():
     """Test extracting content from a valid response."""
     response = {"choices": [{"message": {"content": "This is the response content"}}]}
@@ -0,0 +1,127 @@
+"""
+Tests for the batch module.
+"""
+
+import threading
+import time
+
+from owners_finder.batch import iter_lookups
+from owners_finder.canonical import canonicalize_url
+
+
+def test_iter_lookups_sequential():
+    """Test sequential lookups keep input order and indexes."""
+    results = list(iter_lookups(enumerate(["a", "b", "c"], 1), str.upper))
+
+    assert results == [(1, "a", "A", None), (2, "b", "B", None), (3, "c", "C", None)]
+
+
+def test_iter_lookups_concurrent_preserves_order():
+    """Test concurrent lookups are yielded in input order."""
+
+    def slow_lookup(url):
+        # Earlier URLs finish last
+        time.sleep(0.01 * (5 - int(url)))
+        return f"result-{url}"
+
+    results = list(iter_lookups(enumerate(["1", "2", "3", "4"], 1), slow_lookup, workers=4))
+
+    assert [r[0] for r in results] == [1, 2, 3, 4]
+    assert [r[2] for r in results] == ["result-1", "result-2", "result-3", "result-4"]
+
+
+def test_iter_lookups_runs_concurrently():
+    """Test that lookups overlap when workers > 1."""
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def lookup(url):
+        with lock:
+            active.append(url)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(url)
+        return url
+
+    list(iter_lookups(enumerate([str(i) for i in range(8)], 1), lookup, workers=4))
+
+    assert max(peak) > 1
+    assert max(peak) <= 4
+
+
+def test_iter_lookups_captures_errors():
+    """Test that a failing lookup is reported without stopping the batch."""
+
+    def lookup(url):
+        if url == "bad":
+            raise ValueError("Invalid URL")
+        return url
+
+    for workers in (1, 3):
+        results = list(iter_lookups(enumerate(["good", "bad", "good"], 1), lookup, workers=workers))
+
+        assert results[0] == (1, "good", "good", None)
+        assert results[1][2] is None
+        assert isinstance(results[1][3], ValueError)
+        assert results[2] == (3, "good", "good", None)
+
+
+def test_iter_lookups_keeps_given_indexes():
+    """Test that non-contiguous indexes are passed through unchanged."""
+    results = list(iter_lookups([(2, "b"), (5, "e")], str.upper, workers=2))
+
+    assert results == [(2, "b", "B", None), (5, "e", "E", None)]
+
+
+def test_iter_lookups_deduplicates_by_key():
+    """Test that rows sharing a key reuse a single lookup."""
+    calls = []
+
+    def lookup(url):
+        calls.append(url)
+        return {"company_name": url}
+
+    urls = ["https://www.x.com", "http://x.com/about", "https://y.com", "https://x.com/"]
+
+    for workers in (1, 3):
+        calls.clear()
+        stats = {}
+        results = list(iter_lookups(enumerate(urls, 1), lookup, workers=workers, key=canonicalize_url, stats=stats))
+
+        assert sorted(calls) == ["https://x.com", "https://y.com"]
+        assert [r[0] for r in results] == [1, 2, 3, 4]
+        assert [r[1] for r in results] == ["https://www.x.com", "http://x.com/about", "https://y.com", "https://x.com/"]
+        assert results[0][2] == results[1][2] == {"company_name": "https://x.com"}
+        assert stats == {"lookups": 2, "reused": 2}
+
+
+def test_iter_lookups_deduplicated_errors_fan_out():
+    """Test that a failed shared lookup is reported for every row."""
+
+    def lookup(url):
+        raise ValueError("API Error")
+
+    results = list(iter_lookups([(1, "https://x.com"), (2, "https://www.x.com")], lookup, key=canonicalize_url))
+
+    assert all(isinstance(r[3], ValueError) for r in results)
+
+
+def test_iter_lookups_forgets_old_keys(monkeypatch):
+    """Test that only the most recently used keys are kept for reuse."""
+    monkeypatch.setattr("owners_finder.batch.MAX_REMEMBERED_KEYS", 2)
+    calls = []
+
+    def lookup(url):
+        calls.append(url)
+        return {"company_name": url}
+
+    urls = ["https://a.com", "https://b.com", "https://a.com", "https://c.com", "https://b.com", "https://c.com"]
+    stats = {}
+    results = list(iter_lookups(enumerate(urls, 1), lookup, key=canonicalize_url, stats=stats))
+
+    # b.com was dropped when c.com arrived, a.com had been used more recently
+    assert calls == ["https://a.com", "https://b.com", "https://c.com", "https://b.com"]
+    assert [r[2]["company_name"] for r in results] == [canonicalize_url(url) for url in urls]
+    assert stats == {"lookups": 4, "reused": 2}
@@ -0,0 +1,136 @@
+"""
+Tests for the cache module.
+"""
+
+import json
+import os
+from unittest.mock import Mock, patch
+
+from owners_finder.api_client import build_payload, call_perplexity_api
+from owners_finder.cache import ResponseCache, get_response_cache, make_cache_key
+
+
+def test_make_cache_key_stable():
+    """Test that identical payloads produce the same key."""
+    assert make_cache_key(build_payload("prompt")) == make_cache_key(build_payload("prompt"))
+
+
+def test_make_cache_key_varies_with_request():
+    """Test that prompt and model changes produce different keys."""
+    base = make_cache_key(build_payload("prompt"))
+
+    assert make_cache_key(build_payload("other prompt")) != base
+    assert make_cache_key(build_payload("prompt", model="sonar")) != base
+
+    payload = build_payload("prompt")
+    payload["max_tokens"] = 500
+    assert make_cache_key(payload) != base
+
+
+def test_response_cache_roundtrip(tmp_path):
+    """Test storing and reading a response."""
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    response = {"choices": [{"message": {"content": "cached"}}]}
+
+    assert cache.get("key") is None
+    cache.set("key", response)
+
+    assert cache.get("key") == response
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_response_cache_persists(tmp_path):
+    """Test that entries survive reopening the database."""
+    path = tmp_path / "cache.sqlite"
+    cache = ResponseCache(path)
+    cache.set("key", {"value": 1})
+    cache.close()
+
+    reopened = ResponseCache(path)
+    assert reopened.get("key") == {"value": 1}
+    reopened.close()
+
+
+def test_response_cache_ttl(tmp_path):
+    """Test that expired entries are not returned."""
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl=60)
+
+    with patch("owners_finder.cache.time.time", return_value=1000):
+        cache.set("key", {"value": 1})
+    with patch("owners_finder.cache.time.time", return_value=1030):
+        assert cache.get("key") == {"value": 1}
+    with patch("owners_finder.cache.time.time", return_value=1100):
+        assert cache.get("key") is None
+
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    """Test that eviction trims to max_entries, oldest access first."""
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_entries=2)
+
+    with patch("owners_finder.cache.time.time", return_value=1):
+        cache.set("a", {"value": "a"})
+    with patch("owners_finder.cache.time.time", return_value=2):
+        cache.set("b", {"value": "b"})
+    with patch("owners_finder.cache.time.time", return_value=3):
+        cache.set("c", {"value": "c"})
+    with patch("owners_finder.cache.time.time", return_value=4):
+        cache.get("a")
+
+    cache.evict()
+
+    assert len(cache) == 2
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    cache.close()
+
+
+def test_get_response_cache_disabled():
+    """Test that no cache is returned without a configured path."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_response_cache() is None
+
+
+def test_get_response_cache_off_mode(tmp_path):
+    """Test that the off mode disables caching even with a path."""
+    env = {"RESPONSE_CACHE_PATH": str(tmp_path / "cache.sqlite"), "RESPONSE_CACHE_MODE": "off"}
+    with patch.dict(os.environ, env, clear=True):
+        assert get_response_cache() is None
+
+
+@patch("owners_finder.api_client.get_session")
+@patch("owners_finder.api_client.get_api_headers")
+def test_call_perplexity_api_uses_cache(mock_headers, mock_session, tmp_path):
+    """Test that repeated calls are served from the cache."""
+    mock_headers.return_value = {"Authorization": "Bearer test-key"}
+    mock_response = Mock()
+    mock_response.content = json.dumps({"choices": [{"message": {"content": "live"}}]}).encode("utf-8")
+    mock_session.return_value.post.return_value = mock_response
+
+    with patch.dict(os.environ, {"RESPONSE_CACHE_PATH": str(tmp_path / "cache.sqlite")}):
+        first = call_perplexity_api("cached prompt")
+        second = call_perplexity_api("cached prompt")
+
+    assert first == second
+    mock_session.return_value.post.assert_called_once()
+
+
+@patch("owners_finder.api_client.get_session")
+@patch("owners_finder.api_client.get_api_headers")
+def test_call_perplexity_api_refresh_mode(mock_headers, mock_session, tmp_path):
+    """Test that refresh mode always calls the API and updates the cache."""
+    mock_headers.return_value = {"Authorization": "Bearer test-key"}
+    mock_response = Mock()
+    mock_response.content = json.dumps({"choices": [{"message": {"content": "live"}}]}).encode("utf-8")
+    mock_session.return_value.post.return_value = mock_response
+
+    env = {"RESPONSE_CACHE_PATH": str(tmp_path / "cache.sqlite"), "RESPONSE_CACHE_MODE": "refresh"}
+    with patch.dict(os.environ, env):
+        call_perplexity_api("refresh prompt")
+        call_perplexity_api("refresh prompt")
+
+        assert mock_session.return_value.post.call_count == 2
+        assert len(get_response_cache()) == 1
@@ -0,0 +1,57 @@
+"""
+Tests for the canonical module.
+"""
+
+from owners_finder.canonical import canonicalize_url, get_registrable_domain
+
+
+def test_canonicalize_url_variants():
+    """Test that common variants of a company URL collapse to one form."""
+    variants = [
+        "http://x.com",
+        "https://x.com",
+        "https://www.x.com/",
+        "https://X.com/about?ref=1#team",
+        "https://blog.x.com",
+        "https://x.com:443/",
+    ]
+
+    assert {canonicalize_url(url) for url in variants} == {"https://x.com"}
+
+
+def test_canonicalize_url_multi_part_suffix():
+    """Test that second-level registries keep the company label."""
+    assert canonicalize_url("https://shop.example.co.uk/products") == "https://example.co.uk"
+    assert canonicalize_url("https://www.example.com.au") == "https://example.com.au"
+
+
+def test_canonicalize_url_keeps_distinct_companies():
+    """Test that different registrable domains stay distinct."""
+    assert canonicalize_url("https://a.com") != canonicalize_url("https://a.co")
+    assert canonicalize_url("https://a.co.uk") != canonicalize_url("https://b.co.uk")
+
+
+def test_canonicalize_url_shared_hosting():
+    """Test that sites on shared hosting domains keep their own subdomain."""
+    assert canonicalize_url("https://foo.github.io") == "https://foo.github.io"
+    assert canonicalize_url("https://foo.github.io") != canonicalize_url("https://bar.github.io")
+    assert canonicalize_url("https://www.acme.myshopify.com/products") == "https://acme.myshopify.com"
+    assert canonicalize_url("https://blog.acme.herokuapp.com") == "https://acme.herokuapp.com"
+    assert canonicalize_url("https://acme.wordpress.com") != canonicalize_url("https://other.wordpress.com")
+    assert canonicalize_url("http://acme.blogspot.com/2024/01/post") == "https://acme.blogspot.com"
+
+
+def test_canonicalize_url_non_http_unchanged():
+    """Test that invalid inputs pass through so validation can reject them."""
+    assert canonicalize_url("not-a-url") == "not-a-url"
+    assert canonicalize_url("ftp://x.com") == "ftp://x.com"
+    assert canonicalize_url(None) is None
+
+
+def test_get_registrable_domain():
+    """Test registrable domain extraction."""
+    assert get_registrable_domain("www.Example.com.") == "example.com"
+    assert get_registrable_domain("a.b.example.org") == "example.org"
+    assert get_registrable_domain("localhost:8000") == "localhost"
+    assert get_registrable_domain("192.168.1.10:8080") == "192.168.1.10"
+    assert get_registrable_domain("shop.acme.myshopify.com") == "acme.myshopify.com"
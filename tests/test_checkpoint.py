@@ -0,0 +1,83 @@
+"""
+Tests for the checkpoint module.
+"""
+
+from owners_finder.checkpoint import (
+    STATUS_FAILED,
+    STATUS_SUCCESS,
+    CheckpointJournal,
+    get_completed_indexes,
+    get_default_checkpoint_path,
+    load_checkpoint,
+)
+
+
+def test_get_default_checkpoint_path():
+    """Test the journal path derived from the input file."""
+    assert get_default_checkpoint_path("urls.txt") == "urls.txt.checkpoint.jsonl"
+
+
+def test_journal_roundtrip(tmp_path):
+    """Test that recorded entries are loaded back."""
+    path = tmp_path / "journal.jsonl"
+
+    with CheckpointJournal(path) as journal:
+        journal.record(1, "https://a.com", STATUS_SUCCESS, output="results/00001_a_info.json")
+        journal.record(2, "https://b.com", STATUS_FAILED, error="API Error")
+
+    records = load_checkpoint(path)
+
+    assert records[1]["status"] == STATUS_SUCCESS
+    assert records[1]["output"] == "results/00001_a_info.json"
+    assert records[2]["status"] == STATUS_FAILED
+    assert records[2]["error"] == "API Error"
+    assert "timestamp" in records[1]
+
+
+def test_journal_latest_record_wins(tmp_path):
+    """Test that a later record for the same index replaces the earlier one."""
+    path = tmp_path / "journal.jsonl"
+
+    with CheckpointJournal(path) as journal:
+        journal.record(1, "https://a.com", STATUS_FAILED, error="timeout")
+    with CheckpointJournal(path, resume=True) as journal:
+        journal.record(1, "https://a.com", STATUS_SUCCESS)
+
+    assert load_checkpoint(path)[1]["status"] == STATUS_SUCCESS
+
+
+def test_journal_new_run_truncates(tmp_path):
+    """Test that a journal opened without resume starts empty."""
+    path = tmp_path / "journal.jsonl"
+
+    with CheckpointJournal(path) as journal:
+        journal.record(1, "https://a.com", STATUS_SUCCESS)
+    with CheckpointJournal(path):
+        pass
+
+    assert load_checkpoint(path) == {}
+
+
+def test_load_checkpoint_ignores_truncated_line(tmp_path):
+    """Test that a partially written last line is skipped."""
+    path = tmp_path / "journal.jsonl"
+    path.write_text('{"index": 1, "url": "https://a.com", "status": "success"}\n{"index": 2, "ur')
+
+    assert list(load_checkpoint(path)) == [1]
+
+
+def test_load_checkpoint_missing_file(tmp_path):
+    """Test loading a journal that does not exist."""
+    assert load_checkpoint(tmp_path / "missing.jsonl") == {}
+
+
+def test_get_completed_indexes():
+    """Test that only successful entries with unchanged URLs count as completed."""
+    records = {
+        1: {"index": 1, "url": "https://a.com", "status": STATUS_SUCCESS},
+        2: {"index": 2, "url": "https://b.com", "status": STATUS_FAILED},
+        3: {"index": 3, "url": "https://c.com", "status": STATUS_SUCCESS},
+    }
+
+    assert get_completed_indexes(records) == {1, 3}
+    assert get_completed_indexes(records, {1: "https://a.com", 2: "https://b.com", 3: "https://x.com"}) == {1}
@@ -0,0 +1,242 @@
+"""
+Tests for the batch command line in main.py.
+
+tests/test_main.py targets an older layout (owners_finder.main); these tests
+drive process_urls_from_file directly with a stubbed lookup.
+"""
+
+import gzip
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import main
+from owners_finder.checkpoint import STATUS_FAILED, STATUS_SUCCESS, load_checkpoint
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Batch run in a separate process that is killed without cleanup after some lookups
+CRASH_SCRIPT = f"""
+import os
+import sys
+
+sys.path.insert(0, {str(ROOT)!r})
+import main
+
+crash_after = int(sys.argv[sys.argv.index("--crash-after") + 1]) if "--crash-after" in sys.argv else None
+calls = 0
+
+
+def lookup(url):
+    global calls
+    calls += 1
+    if crash_after is not None and calls > crash_after:
+        os._exit(1)
+    return {{"company_name": "Company", "website": url, "owners": []}}
+
+
+main.find_company_owners = lookup
+main.process_urls_from_file(
+    sys.argv[1], output_format="jsonl", output_path="out.jsonl.gz", resume="--resume" in sys.argv
+)
+"""
+
+
+class FakeLookup:
+    """Stand-in for find_company_owners that records the URLs it was called with."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def __call__(self, url):
+        self.calls.append(url)
+        if url in self.failing:
+            raise RuntimeError(f"API down for {url}")
+        name = url.split("//", 1)[1].split(".", 1)[0].title()
+        return {"company_name": f"{name} GmbH", "website": url, "owners": [{"name": f"{name} Owner"}]}
+
+
+@pytest.fixture
+def batch(tmp_path, monkeypatch):
+    """Run batches in a temporary folder with a fake lookup; returns a helper writing the URL file."""
+    monkeypatch.chdir(tmp_path)
+
+    def write_urls(*urls):
+        path = tmp_path / "urls.txt"
+        path.write_text("\n".join(urls) + "\n", encoding="utf-8")
+        return str(path)
+
+    return write_urls
+
+
+def use_lookup(monkeypatch, lookup):
+    """Replace the lookup used by process_urls_from_file."""
+    monkeypatch.setattr(main, "find_company_owners", lookup)
+    return lookup
+
+
+def test_process_urls_journals_every_row(batch, monkeypatch):
+    """Test that successes, lookup errors and save failures each get a journal record."""
+    lookup = use_lookup(monkeypatch, FakeLookup(failing={"https://broken.com"}))
+    urls_file = batch("https://alpha.com", "https://broken.com", "https://gamma.com")
+    real_save = main.save_to_json
+
+    def save_to_json(company_info, filename=None):
+        if company_info["company_name"] == "Gamma GmbH":
+            raise OSError("disk full")
+        return real_save(company_info, filename=filename)
+
+    monkeypatch.setattr(main, "save_to_json", save_to_json)
+
+    assert main.process_urls_from_file(urls_file) is True
+
+    records = load_checkpoint(f"{urls_file}.checkpoint.jsonl")
+    assert lookup.calls == ["https://alpha.com", "https://broken.com", "https://gamma.com"]
+    assert records[1]["status"] == STATUS_SUCCESS
+    assert records[1]["output"].endswith("00001_alpha_gmbh_info.json")
+    assert records[2]["status"] == STATUS_FAILED
+    assert records[2]["error"] == "API down for https://broken.com"
+    assert records[3]["status"] == STATUS_FAILED
+    assert records[3]["error"] == "Failed to save or display results"
+
+
+def test_process_urls_resume_skips_completed_rows(batch, monkeypatch, capsys):
+    """Test that a resumed run retries only failed rows and reports the skipped ones."""
+    urls_file = batch("https://alpha.com", "https://broken.com", "https://gamma.com")
+    use_lookup(monkeypatch, FakeLookup(failing={"https://broken.com"}))
+    assert main.process_urls_from_file(urls_file) is True
+    capsys.readouterr()
+
+    lookup = use_lookup(monkeypatch, FakeLookup())
+    assert main.process_urls_from_file(urls_file, resume=True) is True
+
+    output = capsys.readouterr().out
+    assert lookup.calls == ["https://broken.com"]
+    assert "2 URLs completed previously" in output
+    assert "Skipped (already completed): 2" in output
+    assert "Successful: 1" in output
+    assert load_checkpoint(f"{urls_file}.checkpoint.jsonl")[2]["status"] == STATUS_SUCCESS
+
+
+def test_process_urls_resume_reruns_changed_rows(batch, monkeypatch):
+    """Test that a row whose URL changed since the journal was written is looked up again."""
+    urls_file = batch("https://alpha.com", "https://beta.com")
+    use_lookup(monkeypatch, FakeLookup())
+    main.process_urls_from_file(urls_file)
+
+    batch("https://alpha.com", "https://delta.com")
+    lookup = use_lookup(monkeypatch, FakeLookup())
+    main.process_urls_from_file(urls_file, resume=True)
+
+    assert lookup.calls == ["https://delta.com"]
+    assert load_checkpoint(f"{urls_file}.checkpoint.jsonl")[2]["url"] == "https://delta.com"
+
+
+def test_process_urls_return_value(batch, monkeypatch):
+    """Test the outcome reported to the exit code for failed, skipped and empty runs."""
+    urls_file = batch("https://broken.com")
+    use_lookup(monkeypatch, FakeLookup(failing={"https://broken.com"}))
+    assert main.process_urls_from_file(urls_file) is False
+
+    urls_file = batch("https://alpha.com")
+    use_lookup(monkeypatch, FakeLookup())
+    assert main.process_urls_from_file(urls_file) is True
+    # Everything was completed before, nothing failed
+    assert main.process_urls_from_file(urls_file, resume=True) is True
+
+    assert main.process_urls_from_file(batch("")) is False
+
+
+def test_process_urls_crash_loses_no_journaled_rows(batch, tmp_path):
+    """Test that a hard kill before a flush marks no row done, and resume writes a readable new part."""
+    urls_file = batch(*(f"https://company{index}.com" for index in range(1, 61)))
+
+    def run(*args):
+        return subprocess.run(
+            [sys.executable, "-c", CRASH_SCRIPT, urls_file, *args], cwd=tmp_path, capture_output=True, text=True
+        )
+
+    # The default flush interval of 100 records is never reached before the kill
+    assert run("--crash-after", "50").returncode == 1
+    records = load_checkpoint(f"{urls_file}.checkpoint.jsonl")
+    assert not any(record["status"] == STATUS_SUCCESS for record in records.values())
+
+    assert run("--resume").returncode == 0
+
+    with gzip.open(tmp_path / "out.part2.jsonl.gz", "rt", encoding="utf-8") as f:
+        assert len([json.loads(line) for line in f]) == 60
+    records = load_checkpoint(f"{urls_file}.checkpoint.jsonl")
+    assert [record["status"] for record in records.values()] == [STATUS_SUCCESS] * 60
+
+
+def test_process_urls_names_files_by_domain_without_company_name(batch, monkeypatch):
+    """Test that rows looked up without the company name are named after their domain."""
+    use_lookup(monkeypatch, lambda url: {"website": url, "owners": [{"name": "Ann Lee"}]})
+    urls_file = batch("https://www.alpha.com", "https://beta.co.uk")
+
+    assert main.process_urls_from_file(urls_file) is True
+
+    outputs = [record["output"] for record in load_checkpoint(f"{urls_file}.checkpoint.jsonl").values()]
+    assert [Path(output).name for output in outputs] == ["00001_www_alpha_com_info.json", "00002_beta_co_uk_info.json"]
+
+
+def test_process_urls_quiet_prints_only_failures_and_summary(batch, monkeypatch, capsys):
+    """Test that quiet mode leaves out per-row reports but keeps failures and the summary."""
+    use_lookup(monkeypatch, FakeLookup(failing={"https://broken.com"}))
+    urls_file = batch("https://alpha.com", "https://broken.com")
+
+    main.process_urls_from_file(urls_file, quiet=True)
+
+    out = capsys.readouterr().out
+    assert "Processing: https://alpha.com" not in out
+    assert "Alpha GmbH" not in out
+    assert "[2] Failed to process https://broken.com: API down for https://broken.com" in out
+    assert "BATCH PROCESSING COMPLETE" in out
+    assert "Successful: 1" in out
+
+
+def test_process_urls_progress_goes_to_stderr(batch, monkeypatch, capsys):
+    """Test that the progress line is written to stderr and per-row reports are left out."""
+    use_lookup(monkeypatch, FakeLookup())
+    urls_file = batch("https://alpha.com", "https://beta.com")
+
+    main.process_urls_from_file(urls_file, progress=True)
+
+    captured = capsys.readouterr()
+    assert "2/2 (100.0%)" in captured.err and "URLs/sec" in captured.err
+    assert "URLs/sec" not in captured.out
+    assert "Processing: https://alpha.com" not in captured.out
+    assert "Successful: 2" in captured.out
+
+
+def test_process_urls_json_log(batch, monkeypatch, capsys):
+    """Test that JSON log mode prints one JSON line per row and a summary line, and nothing else."""
+    use_lookup(monkeypatch, FakeLookup(failing={"https://broken.com"}))
+    urls_file = batch("https://alpha.com", "https://broken.com")
+
+    assert main.process_urls_from_file(urls_file, log_format="json") is True
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["event"] for line in lines] == ["result", "result", "summary"]
+    assert lines[0]["status"] == "success" and lines[0]["company_name"] == "Alpha GmbH"
+    assert lines[0]["output"].endswith("00001_alpha_gmbh_info.json")
+    assert lines[1]["status"] == "failed" and lines[1]["error"] == "API down for https://broken.com"
+    assert lines[2]["successful"] == 1 and lines[2]["failed"] == 1 and lines[2]["total"] == 2
+
+
+def test_process_urls_json_log_quiet(batch, monkeypatch, capsys):
+    """Test that quiet JSON log mode prints failed rows and the summary only."""
+    use_lookup(monkeypatch, FakeLookup(failing={"https://broken.com"}))
+    urls_file = batch("https://alpha.com", "https://broken.com")
+
+    main.process_urls_from_file(urls_file, log_format="json", quiet=True)
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(line["event"], line.get("url")) for line in lines] == [
+        ("result", "https://broken.com"),
+        ("summary", None),
+    ]
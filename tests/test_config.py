@@ -7,7 +7,55 @@ from unittest.mock import patch
 
 import pytest
 
-from owners_finder.config import get_api_base_url, get_api_headers, get_perplexity_api_key, get_request_timeout
+from owners_finder.config import (
+    get_api_base_url,
+    get_api_headers,
+    get_batch_workers,
+    get_cache_max_entries,
+    get_cache_mode,
+    get_cache_path,
+    get_cache_ttl,
+    get_http2_enabled,
+    get_http_keepalive_expiry,
+    get_http_pool_size,
+    get_include_usage_enabled,
+    get_json_backend,
+    get_json_pretty,
+    get_lookup_fields,
+    get_lookup_memo_max_entries,
+    get_lookup_memo_ttl,
+    get_metrics_enabled,
+    get_metrics_json_path,
+    get_metrics_prometheus_path,
+    get_perplexity_api_key,
+    get_prompt_style,
+    get_rate_limit_retries,
+    get_request_timeout,
+    get_requests_per_minute,
+    get_retry_backoff_base,
+    get_retry_backoff_cap,
+    get_retry_deadline,
+    get_retry_max_attempts,
+    get_retry_statuses,
+    get_speculative_owners_enabled,
+    get_strategy_explore_rate,
+    get_strategy_min_samples,
+    get_strategy_min_success_rate,
+    get_strategy_stats_path,
+    get_usage_prices,
+    get_structured_output_enabled,
+    get_tokens_per_minute,
+    set_cache_options_from_command_line,
+    set_include_usage_from_command_line,
+    set_json_pretty_from_command_line,
+    set_lookup_fields_from_command_line,
+    set_metrics_paths_from_command_line,
+    set_prompt_style_from_command_line,
+    set_rate_limits_from_command_line,
+    set_speculative_owners_from_command_line,
+    set_strategy_stats_path_from_command_line,
+    set_structured_output_from_command_line,
+)
 
 
 def test_get_perplexity_api_key_success():
@@ -64,3 +112,216 @@ def test_get_api_headers_missing_key():
     with patch.dict(os.environ, {}, clear=True):
         with pytest.raises(ValueError):
             get_api_headers()
+
+
+def test_get_batch_workers_default():
+    """Test getting batch workers with default value."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_batch_workers() == 1
+
+
+def test_get_batch_workers_custom():
+    """Test getting batch workers with custom value."""
+    with patch.dict(os.environ, {"BATCH_WORKERS": "8"}):
+        assert get_batch_workers() == 8
+
+
+def test_get_http_pool_settings_default():
+    """Test getting connection pool settings with default values."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_http_pool_size() == 10
+        assert get_http_keepalive_expiry() == 60
+        assert get_http2_enabled() is True
+
+
+def test_get_http_pool_settings_custom():
+    """Test getting connection pool settings with custom values."""
+    with patch.dict(os.environ, {"HTTP_POOL_SIZE": "32", "HTTP_KEEPALIVE_EXPIRY": "5", "HTTP2_ENABLED": "false"}):
+        assert get_http_pool_size() == 32
+        assert get_http_keepalive_expiry() == 5
+        assert get_http2_enabled() is False
+
+
+def test_get_cache_settings_default():
+    """Test response cache settings with default values."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_cache_mode() == "use"
+        assert get_cache_path() is None
+        assert get_cache_ttl() == 7 * 24 * 3600
+        assert get_cache_max_entries() == 100000
+
+
+def test_set_cache_options_from_command_line():
+    """Test that command line cache options override the environment."""
+    with patch.dict(os.environ, {"RESPONSE_CACHE_PATH": "env.sqlite"}):
+        try:
+            set_cache_options_from_command_line(path="cli.sqlite", mode="refresh")
+            assert get_cache_path() == "cli.sqlite"
+            assert get_cache_mode() == "refresh"
+
+            set_cache_options_from_command_line(path="cli.sqlite", mode="off")
+            assert get_cache_path() is None
+        finally:
+            set_cache_options_from_command_line()
+
+
+def test_set_cache_options_invalid_mode():
+    """Test that an unknown cache mode is rejected."""
+    with pytest.raises(ValueError, match="Invalid cache mode"):
+        set_cache_options_from_command_line(mode="sometimes")
+
+
+def test_get_rate_limits_default():
+    """Test rate limit settings with default values."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_requests_per_minute() is None
+        assert get_tokens_per_minute() is None
+        assert get_rate_limit_retries() == 5
+
+
+def test_set_rate_limits_from_command_line():
+    """Test that command line rate limits override the environment."""
+    with patch.dict(os.environ, {"RATE_LIMIT_REQUESTS_PER_MINUTE": "10"}):
+        assert get_requests_per_minute() == 10
+        try:
+            set_rate_limits_from_command_line(requests_per_minute=50, tokens_per_minute=20000)
+            assert get_requests_per_minute() == 50
+            assert get_tokens_per_minute() == 20000
+        finally:
+            set_rate_limits_from_command_line()
+
+
+def test_get_retry_settings_default():
+    """Test retry settings with default values."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_retry_max_attempts() == 3
+        assert get_retry_backoff_base() == 0.5
+        assert get_retry_backoff_cap() == 30
+        assert get_retry_deadline() == 120
+        assert get_retry_statuses() == frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def test_get_structured_output_enabled():
+    """Test the structured output switch from the environment and command line."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_structured_output_enabled() is False
+    with patch.dict(os.environ, {"STRUCTURED_OUTPUT": "true"}):
+        assert get_structured_output_enabled() is True
+        try:
+            set_structured_output_from_command_line(False)
+            assert get_structured_output_enabled() is False
+        finally:
+            set_structured_output_from_command_line(None)
+
+
+def test_get_strategy_settings():
+    """Test adaptive prompt strategy settings from the environment and command line."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_strategy_stats_path() is None
+        assert get_strategy_min_samples() == 20
+        assert get_strategy_min_success_rate() == 0.3
+        assert get_strategy_explore_rate() == 0.1
+        try:
+            set_strategy_stats_path_from_command_line("stats.json")
+            assert get_strategy_stats_path() == "stats.json"
+        finally:
+            set_strategy_stats_path_from_command_line(None)
+
+
+def test_get_speculative_owners_enabled():
+    """Test the speculative owners switch from the environment and command line."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_speculative_owners_enabled() is False
+        try:
+            set_speculative_owners_from_command_line(True)
+            assert get_speculative_owners_enabled() is True
+        finally:
+            set_speculative_owners_from_command_line(None)
+
+
+def test_get_lookup_memo_settings():
+    """Test in-process lookup memo settings from the environment."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_lookup_memo_max_entries() is None
+        assert get_lookup_memo_ttl() == 3600
+    with patch.dict(os.environ, {"LOOKUP_MEMO_MAX_ENTRIES": "500", "LOOKUP_MEMO_TTL": "0"}):
+        assert get_lookup_memo_max_entries() == 500
+        assert get_lookup_memo_ttl() is None
+
+
+def test_get_json_settings():
+    """Test JSON backend and layout settings from the environment and command line."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_json_backend() == "auto"
+        assert get_json_pretty() is True
+        try:
+            set_json_pretty_from_command_line(False)
+            assert get_json_pretty() is False
+        finally:
+            set_json_pretty_from_command_line(None)
+    with patch.dict(os.environ, {"JSON_BACKEND": "yaml"}):
+        with pytest.raises(ValueError, match="Invalid JSON backend"):
+            get_json_backend()
+
+
+def test_get_metrics_settings():
+    """Test metrics settings from the environment and command line."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_metrics_enabled() is False
+        assert get_metrics_json_path() is None
+        try:
+            set_metrics_paths_from_command_line(json_path="metrics.json", prometheus_path="metrics.prom")
+            assert get_metrics_json_path() == "metrics.json"
+            assert get_metrics_prometheus_path() == "metrics.prom"
+        finally:
+            set_metrics_paths_from_command_line()
+    with patch.dict(os.environ, {"METRICS_ENABLED": "true", "METRICS_PROMETHEUS_PATH": "m.prom"}):
+        assert get_metrics_enabled() is True
+        assert get_metrics_prometheus_path() == "m.prom"
+
+
+def test_get_usage_settings():
+    """Test usage attachment and price settings from the environment and command line."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_include_usage_enabled() is False
+        assert get_usage_prices()["sonar-pro"]["output"] == 15.0
+        try:
+            set_include_usage_from_command_line(True)
+            assert get_include_usage_enabled() is True
+        finally:
+            set_include_usage_from_command_line(None)
+    with patch.dict(os.environ, {"USAGE_PRICES": '{"sonar-pro": {"input": 2, "output": 8}, "custom": {"input": 1}}'}):
+        prices = get_usage_prices()
+        assert prices["sonar-pro"] == {"input": 2, "output": 8}
+        assert prices["custom"] == {"input": 1}
+        assert "sonar" in prices
+    with patch.dict(os.environ, {"USAGE_PRICES": "not json"}):
+        with pytest.raises(ValueError, match="Invalid USAGE_PRICES"):
+            get_usage_prices()
+
+
+def test_get_prompt_style():
+    """Test the prompt style from the environment and command line."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_prompt_style() == "verbose"
+        try:
+            set_prompt_style_from_command_line("compact")
+            assert get_prompt_style() == "compact"
+        finally:
+            set_prompt_style_from_command_line(None)
+    with patch.dict(os.environ, {"PROMPT_STYLE": "terse"}):
+        with pytest.raises(ValueError, match="Invalid prompt style"):
+            get_prompt_style()
+
+
+def test_get_lookup_fields():
+    """Test the lookup fields from the environment and command line."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_lookup_fields() is None
+        try:
+            set_lookup_fields_from_command_line(("owners",))
+            assert get_lookup_fields() == ("owners",)
+        finally:
+            set_lookup_fields_from_command_line(None)
+    with patch.dict(os.environ, {"LOOKUP_FIELDS": "owners, management"}):
+        assert get_lookup_fields() == ("owners", "management")
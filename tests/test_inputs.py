@@ -0,0 +1,96 @@
+"""
+Tests for the inputs module.
+"""
+
+import gzip
+import io
+from unittest.mock import patch
+
+import pytest
+
+from owners_finder.inputs import get_input_name, is_supported_input, iter_urls
+
+
+def test_is_supported_input():
+    """Test which inputs are accepted."""
+    assert is_supported_input("-")
+    assert is_supported_input("urls.txt")
+    assert is_supported_input("urls.TXT.gz")
+    assert is_supported_input("companies.csv")
+    assert is_supported_input("companies.csv.gz")
+    assert not is_supported_input("urls.json")
+
+
+def test_get_input_name():
+    """Test input names used for derived output paths."""
+    assert get_input_name("-") == "stdin"
+    assert get_input_name("lists/urls.txt") == "urls"
+    assert get_input_name("lists/companies.csv.gz") == "companies"
+
+
+def test_iter_urls_text(tmp_path):
+    """Test reading one URL per line, skipping blank lines."""
+    path = tmp_path / "urls.txt"
+    path.write_text("https://a.com\n\n  https://b.com  \n")
+
+    assert list(iter_urls(str(path))) == ["https://a.com", "https://b.com"]
+
+
+def test_iter_urls_is_lazy(tmp_path):
+    """Test that URLs are yielded before the whole file is read."""
+    path = tmp_path / "urls.txt"
+    path.write_text("https://a.com\nhttps://b.com\n")
+
+    urls = iter_urls(str(path))
+    assert next(urls) == "https://a.com"
+    urls.close()
+
+
+def test_iter_urls_gzip(tmp_path):
+    """Test reading a gzipped text file."""
+    path = tmp_path / "urls.txt.gz"
+    with gzip.open(path, "wt") as f:
+        f.write("https://a.com\nhttps://b.com\n")
+
+    assert list(iter_urls(str(path))) == ["https://a.com", "https://b.com"]
+
+
+def test_iter_urls_stdin():
+    """Test reading URLs from standard input."""
+    with patch("owners_finder.inputs.sys.stdin", io.StringIO("https://a.com\nhttps://b.com\n")):
+        assert list(iter_urls("-")) == ["https://a.com", "https://b.com"]
+
+
+def test_iter_urls_csv_header_detection(tmp_path):
+    """Test that a known URL header selects the column and is skipped."""
+    path = tmp_path / "companies.csv"
+    path.write_text("name,Website\nA Corp,https://a.com\nB Corp,https://b.com\nC Corp,\n")
+
+    assert list(iter_urls(str(path))) == ["https://a.com", "https://b.com"]
+
+
+def test_iter_urls_csv_without_header(tmp_path):
+    """Test that the first row is kept when it already holds a URL."""
+    path = tmp_path / "companies.csv"
+    path.write_text("https://a.com,1\nhttps://b.com,2\n")
+
+    assert list(iter_urls(str(path))) == ["https://a.com", "https://b.com"]
+
+
+def test_iter_urls_csv_column_selection(tmp_path):
+    """Test selecting the URL column by name and by index."""
+    path = tmp_path / "companies.csv"
+    path.write_text("id,home,alt\n1,https://a.com,https://x.com\n")
+
+    assert list(iter_urls(str(path), column="alt")) == ["https://x.com"]
+    assert list(iter_urls(str(path), column=1)) == ["https://a.com"]
+    assert list(iter_urls(str(path), column="1")) == ["https://a.com"]
+
+
+def test_iter_urls_csv_missing_column(tmp_path):
+    """Test that an unknown column name is reported."""
+    path = tmp_path / "companies.csv"
+    path.write_text("id,url\n1,https://a.com\n")
+
+    with pytest.raises(ValueError, match="Column 'site' not found"):
+        list(iter_urls(str(path), column="site"))
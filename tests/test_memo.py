@@ -0,0 +1,105 @@
+"""
+Tests for the memo module.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+from owners_finder.memo import LookupMemo, get_lookup_memo, invalidate_lookup_memo
+from owners_finder.parser import find_company_owners
+
+
+def test_lookup_memo_returns_copies():
+    """Test that mutating a stored or returned value does not change the entry."""
+    memo = LookupMemo(10)
+    value = {"owners": [{"name": "Alice"}]}
+    memo.set("https://a.com", value)
+
+    value["owners"].append({"name": "Mallory"})
+    first = memo.get("https://a.com")
+    first["owners"][0]["name"] = "Eve"
+
+    assert memo.get("https://a.com") == {"owners": [{"name": "Alice"}]}
+    assert memo.stats["hits"] == 2
+
+
+def test_lookup_memo_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted beyond max_entries."""
+    memo = LookupMemo(2)
+    memo.set("a", 1)
+    memo.set("b", 2)
+    memo.get("a")
+    memo.set("c", 3)
+
+    assert memo.get("b") is None
+    assert memo.get("a") == 1
+    assert memo.get("c") == 3
+    assert memo.stats["evictions"] == 1
+    assert len(memo) == 2
+
+
+def test_lookup_memo_expires_entries():
+    """Test that entries older than the TTL are treated as missing."""
+    memo = LookupMemo(10, ttl=60)
+    with patch("owners_finder.memo.time.monotonic", return_value=1000):
+        memo.set("a", 1)
+    with patch("owners_finder.memo.time.monotonic", return_value=1059):
+        assert memo.get("a") == 1
+    with patch("owners_finder.memo.time.monotonic", return_value=1060):
+        assert memo.get("a") is None
+
+    assert memo.stats == {"hits": 1, "misses": 1, "evictions": 0, "expirations": 1, "invalidations": 0}
+    assert len(memo) == 0
+
+
+def test_lookup_memo_invalidate():
+    """Test dropping one company's entries by any form of its URL, and dropping all entries."""
+    memo = LookupMemo(10)
+    memo.set(("https://a.com", False, False), 1)
+    memo.set(("https://a.com", True, False), 2)
+    memo.set(("https://b.com", False, False), 3)
+
+    assert memo.invalidate("http://www.A.com/") == 2
+    assert memo.get(("https://b.com", False, False)) == 3
+    assert memo.invalidate() == 1
+    assert len(memo) == 0
+
+
+def test_get_lookup_memo_disabled():
+    """Test that the memo is off unless LOOKUP_MEMO_MAX_ENTRIES is set."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_lookup_memo() is None
+        assert invalidate_lookup_memo() == 0
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_uses_memo(mock_api):
+    """Test that repeat lookups are answered from memory until invalidated."""
+    mock_api.return_value = {
+        "choices": [
+            {
+                "message": {
+                    "content": json.dumps(
+                        {"company_name": "Memo Inc", "owners": [{"name": "Alice", "type": "individual"}]}
+                    )
+                }
+            }
+        ]
+    }
+    memo = LookupMemo(10)
+
+    with patch("owners_finder.parser.get_lookup_memo", return_value=memo):
+        first = find_company_owners("https://memo.com")
+        first["owners"].clear()
+        second = find_company_owners("http://www.memo.com/")
+
+        assert mock_api.call_count == 1
+        assert second["owners"][0]["name"] == "Alice"
+        assert second["website"] == "http://www.memo.com/"
+
+        memo.invalidate("https://memo.com")
+        find_company_owners("https://memo.com")
+
+    assert mock_api.call_count == 2
+    assert memo.stats["hits"] == 1
@@ -0,0 +1,147 @@
+"""
+Tests for the metrics module.
+"""
+
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from owners_finder import metrics
+from owners_finder.metrics import (
+    Histogram,
+    JsonFileSink,
+    PrometheusFileSink,
+    configure_metrics,
+    format_metrics_summary,
+    format_prometheus,
+    increment,
+    timed,
+    timer,
+)
+
+
+@pytest.fixture
+def registry():
+    """Enable a fresh shared registry for one test."""
+    original = metrics.registry
+    metrics.registry = metrics.MetricsRegistry(enabled=True)
+    try:
+        yield metrics.registry
+    finally:
+        metrics.registry = original
+
+
+def test_histogram_quantiles():
+    """Test quantile estimates stay within the observed buckets."""
+    histogram = Histogram()
+    for _ in range(90):
+        histogram.observe(0.003)
+    for _ in range(10):
+        histogram.observe(0.5)
+
+    assert 0.00256 <= histogram.quantile(0.5) <= 0.00512
+    assert 0.3 <= histogram.quantile(0.99) <= 0.5
+    assert histogram.quantile(1.0) == 0.5
+    assert Histogram().quantile(0.5) is None
+
+
+def test_timed_records_calls_and_errors(registry):
+    """Test that decorated functions are timed and exceptions counted as errors."""
+
+    @timed("stage")
+    def work(fail=False):
+        if fail:
+            raise ValueError("boom")
+        return "done"
+
+    assert work() == "done"
+    with pytest.raises(ValueError):
+        work(fail=True)
+
+    stage = registry.summary()["stages"]["stage"]
+    assert stage["count"] == 2
+    assert stage["errors"] == 1
+
+
+def test_timed_coroutine(registry):
+    """Test that coroutine functions are timed when awaited."""
+
+    @timed("async_stage")
+    async def work():
+        await asyncio.sleep(0)
+        return 42
+
+    assert asyncio.run(work()) == 42
+    assert registry.summary()["stages"]["async_stage"]["count"] == 1
+
+
+def test_disabled_instrumentation_records_nothing(registry):
+    """Test that nothing is recorded while instrumentation is off."""
+    registry.enabled = False
+
+    @timed("stage")
+    def work():
+        return 1
+
+    work()
+    with timer("block"):
+        pass
+    increment("events")
+
+    assert registry.summary() == {"stages": {}, "counters": {}}
+
+
+def test_prometheus_and_json_sinks(registry, tmp_path):
+    """Test the Prometheus text and JSON summary outputs."""
+    with timer("api_call"):
+        pass
+    increment("api_retries", 2)
+    registry.add_sink(PrometheusFileSink(tmp_path / "metrics.prom"))
+    registry.add_sink(JsonFileSink(tmp_path / "out" / "metrics.json"))
+
+    registry.export()
+
+    text = (tmp_path / "metrics.prom").read_text()
+    assert '# TYPE owners_finder_stage_seconds histogram' in text
+    assert 'owners_finder_stage_seconds_bucket{stage="api_call",le="+Inf"} 1' in text
+    assert 'owners_finder_stage_seconds_count{stage="api_call"} 1' in text
+    assert 'owners_finder_stage_errors_total{stage="api_call"} 0' in text
+    assert "owners_finder_api_retries_total 2" in text
+    assert text == format_prometheus(registry)
+
+    summary = json.loads((tmp_path / "out" / "metrics.json").read_text())
+    assert summary["stages"]["api_call"]["count"] == 1
+    assert summary["counters"] == {"api_retries": 2}
+    assert "api_call" in format_metrics_summary(summary)
+
+
+def test_configure_metrics_from_environment(registry, tmp_path):
+    """Test that a configured metrics file turns instrumentation on and adds its sink."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert configure_metrics().enabled is False
+
+    with patch.dict(os.environ, {"METRICS_PROMETHEUS_PATH": str(tmp_path / "metrics.prom")}, clear=True):
+        configured = configure_metrics()
+
+    assert configured.enabled is True
+    assert [type(sink) for sink in configured.sinks] == [PrometheusFileSink]
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_stages(mock_api, registry):
+    """Test that a lookup records its parsing stages."""
+    from owners_finder.parser import find_company_owners
+
+    mock_api.return_value = {
+        "choices": [{"message": {"content": json.dumps({"company_name": "Timed Inc", "owners": [{"name": "Alice"}]})}}]
+    }
+
+    find_company_owners("https://timed.com")
+
+    stages = registry.summary()["stages"]
+    assert stages["lookup"]["count"] == 1
+    assert stages["parse_company_info"]["count"] == 1
+    assert stages["clean_response"]["count"] == 1
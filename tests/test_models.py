@@ -2,9 +2,25 @@
 Tests for the models module.
 """
 
+import dataclasses
+
 import pytest
 
-from owners_finder.models import create_company_info, create_owner, example_company_info, validate_url
+from owners_finder.models import (
+    Company,
+    Executive,
+    Management,
+    Owner,
+    create_company_info,
+    create_management_info,
+    create_owner,
+    example_company_info,
+    get_company_info_schema,
+    get_owners_schema,
+    select_company_fields,
+    validate_record,
+    validate_url,
+)
 
 
 def test_create_owner():
@@ -91,3 +107,96 @@ def test_example_company_info():
     assert isinstance(example["owners"], list)
     assert len(example["owners"]) > 0
     assert "name" in example["owners"][0]
+
+
+def test_get_company_info_schema():
+    """Test that the company schema follows the create_company_info fields."""
+    schema = get_company_info_schema()
+
+    assert "website" not in schema["properties"]
+    assert set(schema["properties"]) == set(create_company_info("x", "y", "z")) - {"website"}
+    assert schema["required"] == ["company_name", "description"]
+    assert schema["properties"]["owners"]["items"]["required"] == ["name"]
+
+
+def test_record_schemas_for_selected_fields():
+    """Test that schemas can be restricted to selected fields."""
+    schema = get_company_info_schema(("company_name", "owners"))
+
+    assert list(schema["properties"]) == ["company_name", "owners"]
+    assert schema["required"] == ["company_name"]
+    assert validate_record({"company_name": "X", "owners": []}, schema)
+    assert not validate_record({"company_name": "X", "industry": "Retail"}, schema)
+    assert list(get_owners_schema(("owners",))["properties"]) == ["owners"]
+
+
+def test_select_company_fields():
+    """Test that only the selected record fields are kept, with the website and extra entries."""
+    company_info = {**example_company_info(), "usage": {"requests": 1}}
+
+    selected = select_company_fields(company_info, ("owners",))
+
+    assert set(selected) == {"website", "owners", "usage"}
+    assert "company_name" in company_info
+
+
+def test_validate_record():
+    """Test validating records against the record schemas."""
+    record = example_company_info()
+    del record["website"]
+
+    assert validate_record(record, get_company_info_schema())
+    assert validate_record({"owners": [], "management": None}, get_owners_schema())
+    assert not validate_record({**record, "founded_year": 2020}, get_company_info_schema())
+    assert not validate_record({**record, "extra": "field"}, get_company_info_schema())
+    assert not validate_record({"description": "No name"}, get_company_info_schema())
+    assert not validate_record({"owners": [{"title": "CEO"}]}, get_owners_schema())
+
+
+def test_company_record_round_trip():
+    """Test converting a company dictionary to a record and back."""
+    data = example_company_info()
+
+    company = Company.from_dict(data)
+
+    assert company.owners == (Owner("John Doe", "CEO & Founder", "60%"),)
+    assert company.management.cfo == Executive("Jane Smith", "Chief Financial Officer")
+    assert company.to_dict() == data
+
+
+def test_company_record_is_frozen_and_slotted():
+    """Test that records cannot be changed and have no per-instance dict."""
+    company = Company("Test Corp", "https://test.com", "A test company")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        company.company_name = "Other"
+    assert not hasattr(company, "__dict__")
+    assert company.to_dict()["owners"] == []
+
+
+def test_management_record_omits_missing_roles():
+    """Test that management keeps only known roles, or becomes None."""
+    assert Management(ceo=Executive("John Doe")).to_dict() == {"ceo": {"name": "John Doe", "title": None}}
+    assert Management().to_dict() is None
+    assert create_management_info() is None
+    assert Management.from_dict({"ceo": None, "coo": {"name": "Bob"}}) == Management(coo=Executive("Bob"))
+
+
+def test_create_functions_keep_inputs_as_given():
+    """Test that the create_* functions accept strings, empty entries and extra keys unchanged."""
+    company = create_company_info("A", "w", "d", owners=["Alice", {}])
+    assert company["owners"] == ["Alice", {}]
+
+    assert create_management_info(ceo="Bob") == {"ceo": "Bob"}
+
+    ceo = {"name": "Bob", "title": "CEO", "since": "2019"}
+    company = create_company_info("A", "w", "d", management=create_management_info(ceo=ceo))
+    assert company["management"] == {"ceo": {"name": "Bob", "title": "CEO", "since": "2019"}}
+
+
+def test_company_record_skips_empty_owners():
+    """Test that empty owner entries are left out when converting to a record."""
+    company = Company.from_dict({"company_name": "A", "owners": [{}, {"name": "Ann"}, None]})
+
+    assert company.owners == (Owner("Ann"),)
+    assert company.to_dict()["owners"] == [{"name": "Ann", "title": None, "ownership_percentage": None}]
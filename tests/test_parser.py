@@ -2,17 +2,35 @@
 Tests for the parser module.
 """
 
+import asyncio
 import json
+import logging
+import re
+import threading
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from owners_finder.api_client import COMPACT_SYSTEM_MESSAGE, COMPANY_FIELDS, OWNERS_FIELDS, get_max_tokens
 from owners_finder.parser import (
+    COMPANY_INFO_SCHEMA,
+    COMPANY_RESPONSE_FORMAT,
+    MAX_DECODE_FAILURES,
+    OWNERS_RESPONSE_FORMAT,
     clean_response_content,
     extract_field_from_text,
     extract_json_from_text,
     extract_owners_from_text,
+    find_company_owners,
+    find_company_owners_async,
+    find_json_object_spans,
+    iter_json_objects,
+    merge_owners_response,
     parse_company_info,
+    parse_owners_response,
+    parse_structured_record,
     parse_text_response,
+    scan_text_keywords,
     structure_company_data,
 )
 
@@ -51,6 +69,74 @@ def test_extract_json_from_text_no_json():
     assert result is None
 
 
+def test_extract_json_from_text_braces_in_strings():
+    """Test that braces and escaped quotes inside strings do not break matching."""
+    text = 'Result: {"company_name": "Brace } Corp", "description": "Uses \\"{quotes}\\" and \\\\"}. Done.'
+
+    result = extract_json_from_text(text)
+    assert result is not None
+    assert result["company_name"] == "Brace } Corp"
+
+
+def test_extract_json_from_text_prefers_record_candidate():
+    """Test that the object with the most expected keys wins."""
+    text = 'Example: {"note": "x"} and the answer {"company_name": "Best Corp", "owners": []} {"other": 1}'
+
+    result = extract_json_from_text(text)
+    assert result == {"company_name": "Best Corp", "owners": []}
+
+
+def test_extract_json_from_text_nested_objects():
+    """Test that nested objects are returned as one top-level object."""
+    text = 'Here: {"company_name": "Nest", "management": {"ceo": {"name": "A", "title": "CEO"}}} end'
+
+    result = extract_json_from_text(text)
+    assert result["management"]["ceo"]["name"] == "A"
+
+
+def test_extract_json_from_text_unmatched_brace_in_prose():
+    """Test that a stray opening brace before the JSON does not hide it."""
+    text = 'Note { this is not closed. {"company_name": "Stray Corp"}'
+
+    result = extract_json_from_text(text)
+    assert result == {"company_name": "Stray Corp"}
+
+
+def test_extract_json_from_text_malformed():
+    """Test that malformed JSON returns None."""
+    assert extract_json_from_text('{"company_name": "Broken",}') is None
+
+
+def test_extract_json_from_text_truncated_reply():
+    """Test that a reply cut off mid-record does not yield a nested fragment as the record."""
+    assert extract_json_from_text('{"company_name": "A", "owners": [{"name": "x"}]') is None
+    assert extract_json_from_text('Here you go: {"company_name": "A", "owners": [{"name": "x"}, {"na') is None
+
+
+def test_extract_json_from_text_inside_prose_braces():
+    """Test that an object wrapped in non-JSON braces is still found."""
+    text = 'Summary {see "notes below: {"company_name": "Inner Corp"} } end'
+
+    result = extract_json_from_text(text)
+    assert result == {"company_name": "Inner Corp"}
+
+
+def test_find_json_object_spans():
+    """Test locating top-level object spans."""
+    text = 'a {"x": {"y": 1}} b {"z": "}"} c {'
+
+    spans = find_json_object_spans(text)
+    assert [text[start:end] for start, end in spans] == ['{"x": {"y": 1}}', '{"z": "}"}']
+
+
+def test_iter_json_objects_falls_back_after_failures():
+    """Test that objects are still found once the decode failure budget is spent."""
+    broken = '{ "a": 1, ' * (MAX_DECODE_FAILURES + 5)
+    text = broken + '{"company_name": "Late Corp"} ' + '{"x": 2}'
+
+    assert list(iter_json_objects(text)) == [{"company_name": "Late Corp"}, {"x": 2}]
+
+
 def test_structure_company_data():
     """Test structuring company data from JSON."""
     json_data = {
@@ -158,6 +244,56 @@ def test_parse_text_response():
     assert len(result["owners"]) > 0
 
 
+def test_scan_text_keywords_matches_per_keyword_search():
+    """Test that the single scan finds the same values as one regex per keyword."""
+    text = (
+        "Company Name: Scan Corp. The company was founded by Ann Lee. Founded: 2019\n"
+        "Founders: Ann Lee and founder Bob Ray. CEO: Ann Lee. Owners: Lee Family"
+    )
+
+    values = scan_text_keywords(text)
+
+    for keyword in ["company name", "name", "founded", "founded by", r"founder[s]?", "CEO", r"owner[s]?"]:
+        expected = re.findall(rf"{keyword}[:\s]+([^\n\r.]+)", text, re.IGNORECASE)
+        assert values.get(keyword, []) == expected
+
+
+def test_scan_text_keywords_non_ascii_text():
+    """Test scanning text whose lower-case form changes length."""
+    text = "İstanbul office. Industry: Textiles. Headquarters: İzmir"
+
+    values = scan_text_keywords(text)
+    assert values["industry"] == ["Textiles"]
+    assert values["headquarters"] == ["İzmir"]
+
+
+def test_parse_text_response_keyword_priority():
+    """Test that earlier keywords win over earlier matches of later keywords."""
+    text = "Based in Lyon. Year: 1990. Headquarters: Paris. Founded by Marie Curie"
+
+    result = parse_text_response(text, "https://priority.com")
+
+    assert result["headquarters"] == "Paris"
+    assert result["founded_year"] == "by Marie Curie"
+    assert [owner["name"] for owner in result["owners"]] == ["Marie Curie"]
+
+
+def test_text_answers_do_not_invent_executives():
+    """Test that management text in plain answers is not turned into a CEO."""
+    result = parse_text_response("Company Name: Acme. Management: John Smith", "https://acme.com")
+    assert result["company_name"] == "Acme"
+    assert result["management"] is None
+
+    result = parse_text_response("Acme is run by. Leadership: a small team of engineers", "https://acme.com")
+    assert result["management"] is None
+
+    assert parse_owners_response("Management: not publicly disclosed") == ([], None)
+
+    company_info = {"company_name": "Acme", "owners": [], "management": None}
+    merge_owners_response(company_info, make_api_response("Management: not publicly disclosed"), False, OWNERS_FIELDS)
+    assert company_info["management"] is None
+
+
 def test_parse_company_info_with_json():
     """Test parsing company info with JSON response."""
     content = """
@@ -220,3 +356,271 @@ def test_clean_response_content():
     assert cleaned == "This is a messy response with lots of whitespace."
     assert "\n" not in cleaned
     assert "  " not in cleaned  # No double spaces
+
+
+def make_api_response(content):
+    """Build a minimal chat completions response."""
+    return {"choices": [{"message": {"content": content}}]}
+
+
+@pytest.mark.asyncio
+@patch("owners_finder.parser.call_perplexity_api_async", new_callable=AsyncMock)
+async def test_find_company_owners_async_single_call(mock_api):
+    """Test async lookup when the first response already has owners."""
+    mock_api.return_value = make_api_response(
+        json.dumps({"company_name": "Async Corp", "description": "Async", "owners": [{"name": "Ann Lee"}]})
+    )
+
+    result = await find_company_owners_async("https://async.com")
+
+    assert result["company_name"] == "Async Corp"
+    assert result["owners"][0]["name"] == "Ann Lee"
+    mock_api.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("owners_finder.parser.call_perplexity_api_async", new_callable=AsyncMock)
+async def test_find_company_owners_async_owners_fallback(mock_api):
+    """Test async lookup runs the owners prompt when no owners were found."""
+    mock_api.side_effect = [
+        make_api_response(
+            json.dumps(
+                {
+                    "company_name": "Async Corp",
+                    "description": "Async",
+                    "owners": [],
+                    "management": {"ceo": {"name": "Ann Lee", "title": "CEO"}},
+                }
+            )
+        ),
+        make_api_response(
+            json.dumps(
+                {
+                    "owners": [{"name": "Bob Ray", "title": "Founder"}],
+                    "management": {"cfo": {"name": "Cal Fox", "title": "CFO"}},
+                }
+            )
+        ),
+    ]
+
+    result = await find_company_owners_async("https://async.com")
+
+    assert mock_api.await_count == 2
+    assert "Async Corp" in mock_api.await_args_list[1].args[0]
+    assert result["owners"][0]["name"] == "Bob Ray"
+    assert result["management"]["ceo"]["name"] == "Ann Lee"
+    assert result["management"]["cfo"]["name"] == "Cal Fox"
+
+
+@pytest.mark.asyncio
+async def test_find_company_owners_async_invalid_url():
+    """Test async lookup with an invalid URL."""
+    with pytest.raises(ValueError, match="Invalid URL"):
+        await find_company_owners_async("not-a-url")
+
+
+def test_parse_structured_record():
+    """Test reading a schema-conforming record from a structured response."""
+    record = {"company_name": "Schema Corp", "description": "Valid"}
+
+    assert parse_structured_record(make_api_response(json.dumps(record)), COMPANY_INFO_SCHEMA) == record
+    assert parse_structured_record(make_api_response("Schema Corp is a company."), COMPANY_INFO_SCHEMA) is None
+    assert parse_structured_record(make_api_response('{"company_name": 1}'), COMPANY_INFO_SCHEMA) is None
+
+
+@patch("owners_finder.parser.clean_response_content")
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_structured(mock_api, mock_clean):
+    """Test that structured responses skip the text parsing pipeline."""
+    mock_api.return_value = make_api_response(
+        json.dumps(
+            {
+                "company_name": "Schema Corp",
+                "description": "Structured",
+                "owners": [{"name": "Ann Lee", "title": "Founder", "ownership_percentage": None}],
+                "management": None,
+                "industry": None,
+                "founded_year": "2019",
+                "headquarters": None,
+            }
+        )
+    )
+
+    result = find_company_owners("https://schema.com", structured=True)
+
+    assert result["company_name"] == "Schema Corp"
+    assert result["website"] == "https://schema.com"
+    assert result["owners"][0]["name"] == "Ann Lee"
+    assert mock_api.call_args.kwargs["response_format"] == COMPANY_RESPONSE_FORMAT
+    mock_clean.assert_not_called()
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_structured_falls_back(mock_api):
+    """Test that responses not matching the schema go through the existing parser."""
+    mock_api.side_effect = [
+        make_api_response('Here you go: ```json {"company_name": "Loose Corp", "description": "Loose"} ```'),
+        make_api_response(json.dumps({"owners": [{"name": "Bob Ray", "title": "Owner"}], "management": None})),
+    ]
+
+    result = find_company_owners("https://loose.com", structured=True)
+
+    assert result["company_name"] == "Loose Corp"
+    assert result["owners"][0]["name"] == "Bob Ray"
+    assert mock_api.call_args_list[1].kwargs["response_format"] == OWNERS_RESPONSE_FORMAT
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_logs_owners_search(mock_api, caplog, capsys):
+    """Test that the second owners search is logged rather than printed."""
+    mock_api.side_effect = [
+        make_api_response(json.dumps({"company_name": "Quiet Corp", "description": "Known", "owners": []})),
+        make_api_response(json.dumps({"owners": [{"name": "Ann Lee", "title": "Founder"}]})),
+    ]
+
+    with caplog.at_level(logging.INFO, logger="owners_finder"):
+        result = find_company_owners("https://quiet-corp.com")
+
+    assert result["owners"][0]["name"] == "Ann Lee"
+    assert "Searching specifically for Quiet Corp owners" in caplog.text
+    assert "Found 1 owner(s) in detailed search." in caplog.text
+    assert capsys.readouterr().out == ""
+
+
+def make_speculative_api(company_record, owners_record, owners_started=None):
+    """Build a fake call_perplexity_api answering company and owners prompts differently."""
+
+    def fake_api(prompt, response_format=None):
+        if prompt.lstrip().startswith("Find the owners"):
+            if owners_started is not None:
+                owners_started.set()
+            return make_api_response(json.dumps(owners_record))
+        # Only return the company answer once the owners call is in flight
+        if owners_started is not None:
+            assert owners_started.wait(5)
+        return make_api_response(json.dumps(company_record))
+
+    return fake_api
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_speculative_merges_owners(mock_api):
+    """Test that the speculative owners call runs alongside the company call and is merged."""
+    mock_api.side_effect = make_speculative_api(
+        {"company_name": "Unknown", "description": "Unclear", "owners": []},
+        {"owners": [{"name": "Ann Lee", "title": "Founder"}], "management": {"ceo": {"name": "Ann Lee"}}},
+        owners_started=threading.Event(),
+    )
+
+    result = find_company_owners("https://www.spec.example.com/about", speculative=True)
+
+    assert mock_api.call_count == 2
+    assert any("the company behind example.com" in call.args[0] for call in mock_api.call_args_list)
+    assert result["owners"][0]["name"] == "Ann Lee"
+    assert result["management"]["ceo"]["name"] == "Ann Lee"
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_speculative_keeps_first_owners(mock_api):
+    """Test that owners from the first answer are kept and the speculative answer is ignored."""
+    mock_api.side_effect = make_speculative_api(
+        {"company_name": "Spec Corp", "description": "Known", "owners": [{"name": "Bob Ray"}]},
+        {"owners": [{"name": "Someone Else"}]},
+    )
+
+    result = find_company_owners("https://spec.com", speculative=True)
+
+    assert [owner["name"] for owner in result["owners"]] == ["Bob Ray"]
+
+
+@pytest.mark.asyncio
+async def test_find_company_owners_async_speculative_cancels_owners_call():
+    """Test that the speculative owners task is cancelled when the first answer has owners."""
+    owners_started = asyncio.Event()
+    owners_cancelled = asyncio.Event()
+
+    async def fake_api(prompt, response_format=None):
+        if prompt.lstrip().startswith("Find the owners"):
+            owners_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                owners_cancelled.set()
+                raise
+        await owners_started.wait()
+        return make_api_response(
+            json.dumps({"company_name": "Spec Corp", "description": "Known", "owners": [{"name": "Bob Ray"}]})
+        )
+
+    with patch("owners_finder.parser.call_perplexity_api_async", side_effect=fake_api):
+        result = await find_company_owners_async("https://spec.com", speculative=True)
+        await asyncio.wait_for(owners_cancelled.wait(), 1)
+
+    assert result["owners"][0]["name"] == "Bob Ray"
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_compact_prompts(mock_api, monkeypatch):
+    """Test that the compact prompt style sends short prompts with max_tokens sized to the fields."""
+    monkeypatch.setenv("PROMPT_STYLE", "compact")
+    mock_api.side_effect = [
+        make_api_response(json.dumps({"company_name": "Compact Corp", "description": "Short", "owners": []})),
+        make_api_response(json.dumps({"owners": [{"name": "Ann Lee", "title": "Founder"}]})),
+    ]
+
+    result = find_company_owners("https://compact.com")
+
+    company_call, owners_call = mock_api.call_args_list
+    assert company_call.args[0].startswith("Company website: https://compact.com")
+    assert company_call.kwargs["max_tokens"] == get_max_tokens(COMPANY_FIELDS)
+    assert company_call.kwargs["system_message"] == COMPACT_SYSTEM_MESSAGE
+    assert owners_call.args[0].startswith("Owners and management of Compact Corp")
+    assert owners_call.kwargs["max_tokens"] == get_max_tokens(OWNERS_FIELDS)
+    assert result["owners"][0]["name"] == "Ann Lee"
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_selected_fields(mock_api):
+    """Test that a partial lookup asks only for its fields and returns only them."""
+    mock_api.side_effect = [
+        make_api_response(json.dumps({"company_name": "Partial Corp", "owners": []})),
+        make_api_response(json.dumps({"owners": [{"name": "Ann Lee", "title": "Founder"}]})),
+    ]
+
+    result = find_company_owners("https://partial.com", fields=["owners"])
+
+    company_call, owners_call = mock_api.call_args_list
+    # The name is asked for because the owners search needs it
+    assert "- company_name\n- owners" in company_call.args[0]
+    assert "description" not in company_call.args[0]
+    assert "- management" not in owners_call.args[0]
+    assert result == {
+        "website": "https://partial.com",
+        "owners": [{"name": "Ann Lee", "title": "Founder", "ownership_percentage": None}],
+    }
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_without_owners_field_skips_owners_search(mock_api):
+    """Test that lookups not asking for owners make a single call."""
+    mock_api.return_value = make_api_response(json.dumps({"industry": "Retail"}))
+
+    result = find_company_owners("https://retail.com", fields=("industry",))
+
+    assert mock_api.call_count == 1
+    assert result == {"website": "https://retail.com", "industry": "Retail"}
+
+
+def test_find_company_owners_rejects_unknown_fields():
+    """Test that unknown fields are rejected before any API call."""
+    with pytest.raises(ValueError, match="Unknown fields"):
+        find_company_owners("https://example.com", fields=("revenue",))
+
+
+def test_structure_company_data_selected_fields():
+    """Test that structuring keeps only the selected fields."""
+    json_data = {"company_name": "Test", "owners": [{"name": "Ann Lee"}], "management": {"ceo": {"name": "Bob"}}}
+
+    result = structure_company_data(json_data, "https://test.com", ("management",))
+
+    assert result == {"website": "https://test.com", "management": {"ceo": {"name": "Bob", "title": None}}}
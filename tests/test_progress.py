@@ -0,0 +1,142 @@
+"""
+Tests for the progress module.
+"""
+
+import io
+import json
+
+from owners_finder.progress import ProgressLine, format_duration, format_log_record, format_log_summary
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TerminalStream(io.StringIO):
+    """In-memory stream that reports being a terminal."""
+
+    def isatty(self):
+        return True
+
+
+def test_format_duration():
+    """Test formatting durations in seconds, minutes and hours."""
+    assert format_duration(45.2) == "45s"
+    assert format_duration(192) == "3m12s"
+    assert format_duration(7500) == "2h05m"
+
+
+def test_progress_line_format_with_total():
+    """Test the status line with a known total, including rate and ETA."""
+    clock = FakeClock()
+    progress = ProgressLine(total=100, stream=io.StringIO(), clock=clock)
+    clock.now += 10
+
+    assert progress.format(20, failed=2, skipped=5) == "25/100 (25.0%) | 2.0 URLs/sec | ETA 38s | 2 failed"
+
+
+def test_progress_line_format_without_total():
+    """Test the status line when the input size is unknown."""
+    clock = FakeClock()
+    progress = ProgressLine(stream=io.StringIO(), clock=clock)
+    clock.now += 4
+
+    assert progress.format(10) == "10 processed | 2.5 URLs/sec | 0 failed"
+
+
+def test_progress_line_rewrites_on_terminal():
+    """Test that a terminal gets one line rewritten in place, throttled between redraws."""
+    clock = FakeClock()
+    stream = TerminalStream()
+    progress = ProgressLine(total=10, stream=stream, clock=clock)
+
+    clock.now += 1
+    progress.update(1)
+    progress.update(2)  # Too soon after the last redraw
+    clock.now += 1
+    progress.update(3)
+    progress.close()
+
+    output = stream.getvalue()
+    assert output.count("\r\033[K") == 3
+    assert "1/10" in output and "2/10" not in output and "3/10" in output
+    assert output.endswith("\n") and output.count("\n") == 1
+
+
+def test_progress_line_clear():
+    """Test that clearing erases the line and the next update redraws it."""
+    clock = FakeClock()
+    stream = TerminalStream()
+    progress = ProgressLine(total=10, stream=stream, clock=clock)
+    progress.update(1)
+    progress.clear()
+    progress.update(2)
+
+    assert stream.getvalue().count("\r\033[K") == 3
+    assert "2/10" in stream.getvalue()
+
+
+def test_progress_line_writes_lines_to_files():
+    """Test that a non-terminal stream gets a new line at the log interval only."""
+    clock = FakeClock()
+    stream = io.StringIO()
+    progress = ProgressLine(total=10, stream=stream, clock=clock)
+
+    progress.update(1)
+    clock.now += 1
+    progress.update(2)
+    clock.now += 10
+    progress.update(3)
+    progress.close()
+
+    lines = stream.getvalue().splitlines()
+    assert [line.split(" ")[0] for line in lines] == ["1/10", "3/10", "3/10"]
+    assert "\r" not in stream.getvalue()
+
+
+def test_format_log_record():
+    """Test the JSON log line of a successful and a failed URL."""
+    company_info = {"company_name": "Acme GmbH", "owners": [{"name": "A"}, {"name": "B"}], "industry": "Tools"}
+    record = json.loads(format_log_record(3, "https://acme.example", company_info, output="out.jsonl"))
+    assert record == {
+        "event": "result",
+        "index": 3,
+        "url": "https://acme.example",
+        "status": "success",
+        "company_name": "Acme GmbH",
+        "owners": 2,
+        "output": "out.jsonl",
+    }
+
+    line = format_log_record(4, "https://broken.example", error=ValueError("boom"))
+    assert "\n" not in line
+    assert json.loads(line) == {
+        "event": "result",
+        "index": 4,
+        "url": "https://broken.example",
+        "status": "failed",
+        "error": "boom",
+    }
+
+
+def test_format_log_summary():
+    """Test the JSON log line summarizing a batch run."""
+    record = json.loads(format_log_summary(8, 2, 5, 4.0, usage={"requests": 12}))
+
+    assert record == {
+        "event": "summary",
+        "successful": 8,
+        "failed": 2,
+        "skipped": 5,
+        "total": 15,
+        "seconds": 4.0,
+        "urls_per_sec": 2.5,
+        "usage": {"requests": 12},
+    }
+    assert json.loads(format_log_summary(0, 0, 0, 0))["urls_per_sec"] is None
@@ -0,0 +1,127 @@
+"""
+Tests for the rate_limit module.
+"""
+
+import json
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from owners_finder.api_client import call_perplexity_api
+from owners_finder.rate_limit import RateLimiter, estimate_request_tokens, get_rate_limiter, parse_duration
+
+
+def test_parse_duration_seconds():
+    """Test parsing plain second values."""
+    assert parse_duration("2") == 2
+    assert parse_duration("1.5") == 1.5
+
+
+def test_parse_duration_units():
+    """Test parsing duration strings with units."""
+    assert parse_duration("1m30s") == 90
+    assert parse_duration("250ms") == 0.25
+    assert parse_duration("1h") == 3600
+
+
+def test_parse_duration_http_date():
+    """Test parsing an HTTP date in the past clamps to zero."""
+    assert parse_duration("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_parse_duration_invalid():
+    """Test that unknown or missing values return None."""
+    assert parse_duration(None) is None
+    assert parse_duration("") is None
+    assert parse_duration("soon") is None
+
+
+def test_estimate_request_tokens():
+    """Test token estimation from a payload."""
+    payload = {"messages": [{"content": "a" * 40}, {"content": "b" * 40}], "max_tokens": 100}
+
+    assert estimate_request_tokens(payload) == 120
+
+
+@patch("owners_finder.rate_limit.time.monotonic")
+def test_rate_limiter_paces_requests(mock_monotonic):
+    """Test that requests beyond the burst are spaced at the configured rate."""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(requests_per_minute=60)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(1.0)
+    assert limiter.reserve() == pytest.approx(2.0)
+
+    mock_monotonic.return_value = 110.0
+    assert limiter.reserve() == 0
+
+
+@patch("owners_finder.rate_limit.time.monotonic")
+def test_rate_limiter_tokens_per_minute(mock_monotonic):
+    """Test that token reservations are paced by the token budget."""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(tokens_per_minute=6000)
+
+    assert limiter.reserve(100) == 0
+    assert limiter.reserve(100) == pytest.approx(1.0)
+
+
+@patch("owners_finder.rate_limit.time.monotonic")
+def test_rate_limiter_retry_after_blocks_all_callers(mock_monotonic):
+    """Test that a 429 pauses callers and slows the effective rate."""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter()
+
+    assert limiter.on_rate_limited({"retry-after": "5"}) == 5
+    assert limiter.reserve() == pytest.approx(5.0)
+    assert limiter.rate_factor < 1.0
+
+    limiter.on_response({})
+    assert limiter.rate_factor > 0.8
+
+
+@patch("owners_finder.rate_limit.time.monotonic")
+def test_rate_limiter_exhausted_quota_headers(mock_monotonic):
+    """Test that an exhausted quota pauses until the reset time."""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter()
+
+    limiter.on_response({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "3s"})
+
+    assert limiter.reserve() == pytest.approx(3.0)
+
+
+def test_get_rate_limiter_follows_config():
+    """Test that the shared limiter is rebuilt when limits change."""
+    with patch.dict(os.environ, {"RATE_LIMIT_REQUESTS_PER_MINUTE": "30"}):
+        limiter = get_rate_limiter()
+        assert get_rate_limiter() is limiter
+        assert limiter.limits == (30, None)
+
+    with patch.dict(os.environ, {"RATE_LIMIT_REQUESTS_PER_MINUTE": "60"}):
+        assert get_rate_limiter() is not limiter
+
+
+@patch("owners_finder.api_client.get_rate_limiter")
+@patch("owners_finder.api_client.get_session")
+@patch("owners_finder.api_client.get_api_headers")
+def test_call_perplexity_api_retries_429(mock_headers, mock_session, mock_get_limiter):
+    """Test that a rate limited request is retried instead of failing."""
+    mock_headers.return_value = {"Authorization": "Bearer test-key"}
+    limiter = Mock()
+    limiter.on_rate_limited.return_value = 1.0
+    mock_get_limiter.return_value = limiter
+
+    limited = Mock(status_code=429, headers={"retry-after": "1"})
+    success = Mock(status_code=200, headers={})
+    success.content = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode("utf-8")
+    mock_session.return_value.post.side_effect = [limited, success]
+
+    result = call_perplexity_api("test prompt")
+
+    assert result == {"choices": [{"message": {"content": "ok"}}]}
+    assert mock_session.return_value.post.call_count == 2
+    limiter.on_rate_limited.assert_called_once_with({"retry-after": "1"})
+    assert limiter.acquire.call_count == 2
@@ -0,0 +1,126 @@
+"""
+Tests for the retry module.
+"""
+
+import json
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from owners_finder.api_client import call_perplexity_api
+from owners_finder.retry import RetryPolicy, RetryState, get_last_attempts, get_retry_policy
+
+
+def test_get_retry_policy_from_config():
+    """Test that the policy reflects the configuration."""
+    env = {"RETRY_MAX_ATTEMPTS": "5", "RETRY_BACKOFF_BASE": "1", "RETRY_STATUSES": "500,503", "RETRY_DEADLINE": "0"}
+    with patch.dict(os.environ, env, clear=True):
+        policy = get_retry_policy()
+
+    assert policy.max_attempts == 5
+    assert policy.backoff_base == 1
+    assert policy.retryable_statuses == frozenset({500, 503})
+    assert policy.deadline is None
+
+
+@patch("owners_finder.retry.random.uniform")
+def test_backoff_full_jitter(mock_uniform):
+    """Test that backoff draws from an exponentially growing, capped range."""
+    mock_uniform.side_effect = lambda low, high: high
+    policy = RetryPolicy(backoff_base=0.5, backoff_cap=3)
+
+    assert policy.backoff(1) == 0.5
+    assert policy.backoff(2) == 1
+    assert policy.backoff(3) == 2
+    assert policy.backoff(4) == 3
+
+
+def test_retry_state_max_attempts():
+    """Test that retries stop after max_attempts failures."""
+    state = RetryState(RetryPolicy(max_attempts=3, backoff_base=0))
+
+    assert state.next_delay(status=503) is not None
+    assert state.next_delay(status=503) is not None
+    assert state.next_delay(status=503) is None
+
+
+def test_retry_state_rate_limits_use_separate_budget():
+    """Test that 429s do not consume the failure budget."""
+    state = RetryState(RetryPolicy(max_attempts=1, rate_limit_retries=2))
+
+    assert state.next_delay(status=429, retry_after=0) == 0
+    assert state.next_delay(status=429, retry_after=0) == 0
+    assert state.next_delay(status=429, retry_after=0) is None
+
+
+@patch("owners_finder.retry.time.monotonic")
+def test_retry_state_deadline(mock_monotonic):
+    """Test that no retry is scheduled past the total deadline."""
+    mock_monotonic.return_value = 0
+    state = RetryState(RetryPolicy(max_attempts=5, backoff_base=0, deadline=10))
+
+    mock_monotonic.return_value = 5
+    assert state.next_delay(status=503) is not None
+
+    mock_monotonic.return_value = 11
+    assert state.next_delay(status=503) is None
+
+    mock_monotonic.return_value = 5
+    assert state.next_delay(status=429, retry_after=20) is None
+
+
+def test_retry_state_records_attempts():
+    """Test that attempt timings are recorded and exposed."""
+    state = RetryState(RetryPolicy())
+    started = state.start_attempt()
+    state.record(started, status=503)
+    state.next_delay(status=503)
+    state.record(state.start_attempt(), status=200)
+
+    attempts = get_last_attempts()
+    assert [a["attempt"] for a in attempts] == [1, 2]
+    assert attempts[0]["status"] == 503
+    assert attempts[0]["delay"] >= 0
+    assert attempts[1]["status"] == 200
+    assert all(a["elapsed"] >= 0 for a in attempts)
+
+
+@patch("owners_finder.api_client.time.sleep")
+@patch("owners_finder.api_client.get_session")
+@patch("owners_finder.api_client.get_api_headers")
+def test_call_perplexity_api_retries_transient_errors(mock_headers, mock_session, mock_sleep):
+    """Test that timeouts and 5xx responses are retried until success."""
+    mock_headers.return_value = {"Authorization": "Bearer test-key"}
+    server_error = Mock(status_code=503, headers={})
+    success = Mock(status_code=200, headers={})
+    success.content = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode("utf-8")
+    mock_session.return_value.post.side_effect = [requests.Timeout("timed out"), server_error, success]
+
+    with patch.dict(os.environ, {"RETRY_MAX_ATTEMPTS": "3"}):
+        result = call_perplexity_api("test prompt")
+
+    assert result == {"choices": [{"message": {"content": "ok"}}]}
+    assert mock_session.return_value.post.call_count == 3
+    assert mock_sleep.call_count == 2
+
+    attempts = get_last_attempts()
+    assert attempts[0]["error"] == "timed out"
+    assert attempts[1]["status"] == 503
+    assert attempts[2]["status"] == 200
+
+
+@patch("owners_finder.api_client.time.sleep")
+@patch("owners_finder.api_client.get_session")
+@patch("owners_finder.api_client.get_api_headers")
+def test_call_perplexity_api_gives_up(mock_headers, mock_session, mock_sleep):
+    """Test that the last error is raised once attempts are exhausted."""
+    mock_headers.return_value = {"Authorization": "Bearer test-key"}
+    mock_session.return_value.post.side_effect = requests.ConnectionError("reset")
+
+    with patch.dict(os.environ, {"RETRY_MAX_ATTEMPTS": "2"}):
+        with pytest.raises(requests.RequestException, match="API call failed: reset"):
+            call_perplexity_api("test prompt")
+
+    assert mock_session.return_value.post.call_count == 2
@@ -0,0 +1,64 @@
+"""
+Tests for the serialization module.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from owners_finder import serialization
+from owners_finder.models import example_company_info
+from owners_finder.serialization import dumps, get_backend, loads
+
+BACKENDS = [
+    "json",
+    pytest.param("orjson", marks=pytest.mark.skipif(serialization.orjson is None, reason="orjson not installed")),
+    pytest.param("msgspec", marks=pytest.mark.skipif(serialization.msgspec is None, reason="msgspec not installed")),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Select each installed JSON backend in turn."""
+    with patch.dict(os.environ, {"JSON_BACKEND": request.param}):
+        yield request.param
+
+
+def test_dumps_matches_standard_library(backend):
+    """Test that every backend produces the same bytes as the json module."""
+    data = {**example_company_info(), "headquarters": "Zürich", "founded_year": 1998, "public": False}
+
+    assert get_backend() == backend
+    assert dumps(data) == json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert dumps(data, pretty=True) == json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def test_loads_round_trip(backend):
+    """Test decoding bytes and text."""
+    data = example_company_info()
+
+    assert loads(dumps(data)) == data
+    assert loads(dumps(data).decode("utf-8")) == data
+
+
+def test_loads_invalid_json(backend):
+    """Test that invalid JSON raises ValueError on every backend."""
+    with pytest.raises(ValueError):
+        loads(b"not json")
+
+
+def test_get_backend_auto_falls_back_to_json():
+    """Test that auto uses the standard library when no fast backend is installed."""
+    with patch.dict(os.environ, {"JSON_BACKEND": "auto"}), patch.object(serialization, "orjson", None), patch.object(
+        serialization, "msgspec", None
+    ):
+        assert get_backend() == "json"
+
+
+def test_get_backend_missing_package():
+    """Test that an explicitly configured backend must be installed."""
+    with patch.dict(os.environ, {"JSON_BACKEND": "orjson"}), patch.object(serialization, "orjson", None):
+        with pytest.raises(ValueError, match="not installed"):
+            get_backend()
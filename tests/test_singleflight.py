@@ -0,0 +1,123 @@
+"""
+Tests for the singleflight module.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from owners_finder.parser import find_company_owners
+from owners_finder.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def run_concurrently(function, count):
+    """Call function from count threads at once and return the results."""
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(function) for _ in range(count)]
+        return [future.result() for future in futures]
+
+
+def test_single_flight_shares_one_call():
+    """Test that concurrent callers with the same key share one call and get private copies."""
+    flight = SingleFlight()
+    calls = []
+
+    def slow_lookup():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"owners": [{"name": "Ann Lee"}]}
+
+    results = run_concurrently(lambda: flight.do("key", slow_lookup), 5)
+
+    assert len(calls) == 1
+    assert all(result == {"owners": [{"name": "Ann Lee"}]} for result in results)
+    assert len({id(result) for result in results}) == 5
+    assert flight.stats == {"calls": 1, "shared": 4}
+
+
+def test_single_flight_shares_errors_and_forgets_key():
+    """Test that followers receive the leader's error and later calls start fresh."""
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing_lookup():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    def follower():
+        started.wait()
+        return flight.do("key", lambda: "unused")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader_future = executor.submit(flight.do, "key", failing_lookup)
+        follower_future = executor.submit(follower)
+        for future in (leader_future, follower_future):
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+
+    assert flight.do("key", lambda: "fresh") == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_shares_one_call():
+    """Test coalescing concurrent coroutines with the same key."""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow_lookup(value):
+        calls.append(value)
+        await asyncio.sleep(0.05)
+        return {"value": value}
+
+    results = await asyncio.gather(
+        *(flight.do("key", slow_lookup, 1) for _ in range(4)), flight.do("other", slow_lookup, 2)
+    )
+
+    assert calls == [1, 2]
+    assert results[:4] == [{"value": 1}] * 4
+    assert len({id(result) for result in results[:4]}) == 4
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_follower_cancellation():
+    """Test that cancelling one caller does not cancel the shared call."""
+    flight = AsyncSingleFlight()
+
+    async def slow_lookup():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.ensure_future(flight.do("key", slow_lookup))
+    follower = asyncio.ensure_future(flight.do("key", slow_lookup))
+    await asyncio.sleep(0)
+    follower.cancel()
+
+    assert await leader == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_coalesces_url_variants(mock_api):
+    """Test that concurrent lookups of one company share an API call but keep their own URL."""
+
+    def slow_api(prompt, response_format=None):
+        time.sleep(0.1)
+        record = {"company_name": "Flight Corp", "description": "Shared", "owners": [{"name": "Ann Lee"}]}
+        return {"choices": [{"message": {"content": json.dumps(record)}}]}
+
+    mock_api.side_effect = slow_api
+    urls = ["https://flight.com", "http://www.flight.com/", "https://flight.com/about"]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(find_company_owners, urls))
+
+    assert mock_api.call_count == 1
+    assert [result["website"] for result in results] == urls
+    assert all(result["owners"][0]["name"] == "Ann Lee" for result in results)
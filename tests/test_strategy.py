@@ -0,0 +1,134 @@
+"""
+Tests for the strategy module.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+from owners_finder.parser import find_company_owners
+from owners_finder.strategy import (
+    STRATEGY_COMBINED,
+    STRATEGY_STANDARD,
+    StrategyStats,
+    format_strategy_report,
+    get_lookup_buckets,
+    get_strategy_stats,
+)
+
+
+def record_lookups(stats, url, count, first_call_owners, strategy=STRATEGY_STANDARD, industry=None):
+    """Record count identical lookups."""
+    for _ in range(count):
+        round_trips = 1 if first_call_owners or strategy == STRATEGY_COMBINED else 2
+        stats.record(url, strategy, first_call_owners, True, round_trips, industry=industry)
+
+
+def test_get_lookup_buckets():
+    """Test bucket names derived from a URL and industry."""
+    assert get_lookup_buckets("https://www.shop.example.co.uk/about", "FinTech ") == [
+        "domain:example.co.uk",
+        "industry:fintech",
+        "tld:uk",
+    ]
+    assert get_lookup_buckets("https://example.com") == ["domain:example.com", "tld:com"]
+
+
+def test_strategy_stats_standard_until_enough_samples(tmp_path):
+    """Test that buckets without enough samples keep the standard prompt."""
+    stats = StrategyStats(tmp_path / "strategy.json", min_samples=5, explore_rate=0)
+
+    record_lookups(stats, "https://a.de", 4, first_call_owners=False)
+
+    assert stats.choose("https://b.de") == STRATEGY_STANDARD
+
+
+def test_strategy_stats_switches_doomed_bucket(tmp_path):
+    """Test that a bucket where the first call rarely finds owners switches to the combined prompt."""
+    stats = StrategyStats(tmp_path / "strategy.json", min_samples=5, min_success_rate=0.3, explore_rate=0)
+
+    record_lookups(stats, "https://a.de", 5, first_call_owners=False)
+    record_lookups(stats, "https://a.com", 5, first_call_owners=True)
+
+    assert stats.choose("https://b.de") == STRATEGY_COMBINED
+    assert stats.choose("https://b.com") == STRATEGY_STANDARD
+
+
+def test_strategy_stats_compares_round_trips(tmp_path):
+    """Test that measured combined-prompt results override the first-call rate."""
+    stats = StrategyStats(tmp_path / "strategy.json", min_samples=5, min_success_rate=0.3, explore_rate=0)
+    record_lookups(stats, "https://a.de", 5, first_call_owners=False)
+
+    # The combined prompt finds owners in only 2 of 5 lookups: 2.5 calls per success vs 2.0
+    for index in range(5):
+        stats.record("https://a.de", STRATEGY_COMBINED, False, index < 2, 1)
+
+    assert stats.choose("https://b.de") == STRATEGY_STANDARD
+
+
+def test_strategy_stats_uses_known_industry(tmp_path):
+    """Test that a domain's recorded industry brings in the industry bucket."""
+    stats = StrategyStats(tmp_path / "strategy.json", min_samples=3, explore_rate=0)
+    record_lookups(stats, "https://a.com", 3, first_call_owners=False, industry="Mining")
+    record_lookups(stats, "https://c.com", 10, first_call_owners=True)
+    stats.record("https://b.com", STRATEGY_STANDARD, True, True, 1, industry="mining")
+
+    assert stats.choose("https://b.com") == STRATEGY_COMBINED
+    assert stats.choose("https://d.com") == STRATEGY_STANDARD
+
+
+def test_strategy_stats_persistence(tmp_path):
+    """Test that statistics survive a save and reload."""
+    path = tmp_path / "nested" / "strategy.json"
+    stats = StrategyStats(path, min_samples=2, explore_rate=0)
+    record_lookups(stats, "https://a.de", 2, first_call_owners=False)
+    stats.close()
+
+    reloaded = StrategyStats(path, min_samples=2, explore_rate=0)
+
+    assert json.loads(path.read_text())["buckets"]["tld:de"]["standard"]["lookups"] == 2
+    assert reloaded.choose("https://b.de") == STRATEGY_COMBINED
+
+
+def test_strategy_report(tmp_path):
+    """Test the bucket report."""
+    stats = StrategyStats(tmp_path / "strategy.json", min_samples=2, explore_rate=0)
+    record_lookups(stats, "https://a.de", 4, first_call_owners=False)
+
+    rows = stats.report()
+
+    assert rows == [
+        {
+            "bucket": "tld:de",
+            "lookups": 4,
+            "first_call_owners_rate": 0.0,
+            "standard_round_trips_per_success": 2.0,
+            "combined_round_trips_per_success": None,
+            "strategy": STRATEGY_COMBINED,
+        }
+    ]
+    assert "tld:de" in format_strategy_report(rows)
+
+
+def test_get_strategy_stats_disabled():
+    """Test that the adaptive strategy is off unless a statistics path is configured."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_strategy_stats() is None
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_combined_prompt_skips_fallback(mock_api, tmp_path):
+    """Test that the combined prompt is a single round trip even without owners."""
+    mock_api.return_value = {
+        "choices": [{"message": {"content": json.dumps({"company_name": "Quiet GmbH", "description": "Private"})}}]
+    }
+    stats = StrategyStats(tmp_path / "strategy.json", min_samples=1, explore_rate=0)
+    record_lookups(stats, "https://other.de", 1, first_call_owners=False)
+
+    with patch("owners_finder.parser.get_strategy_stats", return_value=stats):
+        result = find_company_owners("https://quiet.de")
+
+    assert result["owners"] == []
+    mock_api.assert_called_once()
+    assert "major shareholders" in mock_api.call_args.args[0]
+    assert stats.buckets["tld:de"]["combined"] == {"lookups": 1, "owners": 0, "round_trips": 1}
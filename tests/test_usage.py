@@ -0,0 +1,231 @@
+"""
+Tests for the usage module.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from owners_finder.api_client import call_perplexity_api
+from owners_finder.memo import LookupMemo
+from owners_finder.parser import find_company_owners, lookup_flight
+from owners_finder.usage import (
+    UsageTotals,
+    collect_usage,
+    format_usage_report,
+    get_response_usage,
+    record_api_usage,
+    record_lookup,
+    usage_totals,
+)
+
+PRICES = {"sonar-pro": {"input": 3.0, "output": 15.0, "request": 0.006}}
+
+
+def make_response(content="{}", prompt_tokens=100, completion_tokens=50, finish_reason="stop"):
+    """Build an API response with a usage block."""
+    return {
+        "choices": [{"message": {"content": content}, "finish_reason": finish_reason}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def test_get_response_usage():
+    """Test reading token counts and truncation from a response."""
+    assert get_response_usage(make_response(finish_reason="length")) == (100, 50, True)
+    assert get_response_usage({"choices": [{"message": {"content": "x"}}]}) == (0, 0, False)
+    assert get_response_usage(None) == (0, 0, False)
+
+
+def test_usage_totals_summary_and_cost():
+    """Test that cached responses count as requests but not towards tokens or cost."""
+    totals = UsageTotals()
+    totals.record("sonar-pro", make_response(prompt_tokens=1000, completion_tokens=200))
+    totals.record("sonar-pro", make_response(prompt_tokens=1000, completion_tokens=800, finish_reason="length"))
+    totals.record("sonar-pro", make_response(), cached=True)
+
+    summary = totals.summary(PRICES)
+
+    assert summary["requests"] == 3
+    assert summary["cached_requests"] == 1
+    assert summary["prompt_tokens"] == 2000
+    assert summary["completion_tokens"] == 1000
+    assert summary["total_tokens"] == 3000
+    assert summary["truncated"] == 1
+    assert summary["max_completion_tokens"] == 800
+    # 2000 * $3/M + 1000 * $15/M + 2 live requests * $0.006
+    assert summary["estimated_cost_usd"] == 0.033
+    assert "Estimated cost: $0.0330, $0.01650 per company" in format_usage_report(summary, 1.5, lookups=2)
+
+
+def test_usage_totals_unknown_model_price():
+    """Test that the cost is unknown when a model has no price."""
+    totals = UsageTotals()
+    totals.record("mystery-model", make_response())
+
+    summary = totals.summary(PRICES)
+
+    assert summary["estimated_cost_usd"] is None
+    assert "no price for mystery-model" in format_usage_report(summary)
+
+
+def test_usage_counts_lookups():
+    """Test that lookups are counted and per-company figures divide by them."""
+    totals = UsageTotals()
+    totals.record_lookup()
+    totals.record_lookup()
+    totals.record("sonar-pro", make_response())
+    totals.record("sonar-pro", make_response())
+    totals.record("sonar-pro", make_response())
+
+    summary = totals.summary(PRICES)
+
+    assert summary["lookups"] == 2
+    assert "Per company: 1.50 requests, 225 tokens" in format_usage_report(summary, lookups=summary["lookups"])
+
+
+def test_record_lookup_scopes_lookups():
+    """Test that a lookup is counted in the process-wide totals and only the enclosing collector."""
+    usage_totals.reset()
+    record_lookup()
+    with collect_usage() as usage:
+        record_lookup()
+
+    assert usage.summary(PRICES)["lookups"] == 1
+    assert usage_totals.summary(PRICES)["lookups"] == 2
+
+
+def test_collect_usage_scopes_calls():
+    """Test that only calls inside the block reach its collector."""
+    record_api_usage("sonar-pro", make_response())
+    with collect_usage() as usage:
+        record_api_usage("sonar-pro", make_response())
+    record_api_usage("sonar-pro", make_response())
+
+    assert usage.summary(PRICES)["requests"] == 1
+
+
+@patch("owners_finder.api_client.get_session")
+@patch("owners_finder.api_client.get_api_headers")
+def test_call_perplexity_api_records_cached_usage(mock_headers, mock_session, tmp_path):
+    """Test that live and cached API responses are recorded."""
+    mock_headers.return_value = {"Authorization": "Bearer test-key"}
+    mock_response = Mock()
+    mock_response.content = json.dumps(make_response("live")).encode("utf-8")
+    mock_session.return_value.post.return_value = mock_response
+
+    with patch.dict(os.environ, {"RESPONSE_CACHE_PATH": str(tmp_path / "cache.sqlite")}), collect_usage() as usage:
+        call_perplexity_api("usage prompt")
+        call_perplexity_api("usage prompt")
+
+    summary = usage.summary(PRICES)
+    assert summary["requests"] == 2
+    assert summary["cached_requests"] == 1
+    assert summary["prompt_tokens"] == 100
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_includes_usage(mock_api):
+    """Test that each result can carry the usage of its lookup."""
+    responses = [
+        make_response(json.dumps({"company_name": "Usage Inc", "owners": []}), 200, 100),
+        make_response(json.dumps({"owners": [{"name": "Alice"}]}), 150, 50),
+    ]
+
+    def fake_api(prompt, model="sonar-pro", response_format=None):
+        response = responses.pop(0)
+        record_api_usage(model, response)
+        return response
+
+    mock_api.side_effect = fake_api
+
+    with patch.dict(os.environ, {"INCLUDE_USAGE": "true"}):
+        result = find_company_owners("https://usage.com")
+
+    assert result["owners"][0]["name"] == "Alice"
+    assert result["usage"]["requests"] == 2
+    assert result["usage"]["total_tokens"] == 500
+    assert result["usage"]["models"] == ["sonar-pro"]
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_usage_off_by_default(mock_api):
+    """Test that results have no usage entry unless requested."""
+    mock_api.return_value = make_response(json.dumps({"company_name": "Plain Inc", "owners": [{"name": "Bob"}]}))
+
+    with patch.dict(os.environ, {}, clear=True):
+        assert "usage" not in find_company_owners("https://plain.com")
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_counts_only_lookups_that_ran(mock_api):
+    """Test that invalid URLs are not counted as lookups."""
+    mock_api.return_value = make_response(json.dumps({"company_name": "Count Inc", "owners": [{"name": "Bob"}]}))
+    usage_totals.reset()
+
+    find_company_owners("https://count.com")
+    for url in ("not-a-url", "ftp://count.com"):
+        try:
+            find_company_owners(url)
+        except ValueError:
+            pass
+
+    assert usage_totals.summary()["lookups"] == 1
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_memo_hit_reports_no_usage(mock_api):
+    """Test that a result served from the memo does not repeat the original call's usage."""
+
+    def fake_api(prompt, model="sonar-pro", response_format=None):
+        response = make_response(json.dumps({"company_name": "Memo Usage Inc", "owners": [{"name": "Ann"}]}))
+        record_api_usage(model, response)
+        return response
+
+    mock_api.side_effect = fake_api
+    memo = LookupMemo(10)
+
+    with patch.dict(os.environ, {"INCLUDE_USAGE": "true"}), patch(
+        "owners_finder.parser.get_lookup_memo", return_value=memo
+    ):
+        first = find_company_owners("https://memo-usage.com")
+        second = find_company_owners("https://www.memo-usage.com")
+
+    assert mock_api.call_count == 1
+    assert first["usage"]["lookups"] == 1 and first["usage"]["requests"] == 1
+    assert second["usage"]["lookups"] == 0
+    assert second["usage"]["requests"] == 0 and second["usage"]["total_tokens"] == 0
+    assert second["usage"]["estimated_cost_usd"] == 0
+
+
+@patch("owners_finder.parser.call_perplexity_api")
+def test_find_company_owners_shared_lookup_reports_no_usage(mock_api):
+    """Test that callers joining an in-flight lookup do not report its usage."""
+    release = threading.Event()
+
+    def fake_api(prompt, model="sonar-pro", response_format=None):
+        assert release.wait(5)
+        response = make_response(json.dumps({"company_name": "Shared Usage Inc", "owners": [{"name": "Ann"}]}))
+        record_api_usage(model, response)
+        return response
+
+    mock_api.side_effect = fake_api
+    urls = ["https://shared-usage.com", "https://www.shared-usage.com", "https://shared-usage.com/about"]
+    shared_before = lookup_flight.stats["shared"]
+
+    with patch.dict(os.environ, {"INCLUDE_USAGE": "true"}), ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(find_company_owners, url) for url in urls]
+        # Let the followers join before the leader's call returns
+        while lookup_flight.stats["shared"] < shared_before + 2:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert mock_api.call_count == 1
+    assert sorted(result["usage"]["requests"] for result in results) == [0, 0, 1]
@@ -0,0 +1,159 @@
+"""
+Tests for the utils module.
+"""
+
+import gzip
+import json
+
+import pytest
+
+from owners_finder.utils import (
+    JsonlSink,
+    get_compression_for_path,
+    get_default_jsonl_path,
+    get_resume_output_path,
+    save_to_json,
+)
+
+
+def read_lines(path):
+    """Read JSON records from a (possibly gzipped) JSON Lines file."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return [json.loads(line) for line in f.read().decode("utf-8").splitlines()]
+
+
+def test_get_compression_for_path():
+    """Test inferring compression from the file extension."""
+    assert get_compression_for_path("out.jsonl") == "none"
+    assert get_compression_for_path("out.jsonl.gz") == "gzip"
+    assert get_compression_for_path("out.jsonl.zst") == "zstd"
+
+
+def test_get_default_jsonl_path():
+    """Test the default batch output path."""
+    path = get_default_jsonl_path("lists/urls.txt", compression="gzip")
+
+    assert path.parts[0] == "results"
+    assert path.name == "urls.jsonl.gz"
+
+
+def test_jsonl_sink_writes_compact_records(tmp_path):
+    """Test that records are written as one compact line each."""
+    path = tmp_path / "nested" / "out.jsonl"
+
+    with JsonlSink(path) as sink:
+        sink.write({"company_name": "Test Corp", "owners": []})
+        sink.write({"company_name": "Ünïcode GmbH", "owners": [{"name": "A"}]})
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == '{"company_name":"Test Corp","owners":[]}'
+    assert json.loads(lines[1])["company_name"] == "Ünïcode GmbH"
+    assert sink.count == 2
+
+
+def test_jsonl_sink_gzip(tmp_path):
+    """Test gzip output inferred from the extension."""
+    path = tmp_path / "out.jsonl.gz"
+
+    with JsonlSink(path, flush_every=1, fsync=True) as sink:
+        sink.write({"index": 1})
+        sink.write({"index": 2})
+
+    assert read_lines(path) == [{"index": 1}, {"index": 2}]
+
+
+def test_jsonl_sink_append(tmp_path):
+    """Test that append mode keeps earlier records, including across gzip members."""
+    path = tmp_path / "out.jsonl.gz"
+
+    with JsonlSink(path) as sink:
+        sink.write({"index": 1})
+    with JsonlSink(path, append=True) as sink:
+        sink.write({"index": 2})
+
+    assert read_lines(path) == [{"index": 1}, {"index": 2}]
+
+
+def test_jsonl_sink_replaces_without_append(tmp_path):
+    """Test that a new sink replaces an existing file."""
+    path = tmp_path / "out.jsonl"
+
+    with JsonlSink(path) as sink:
+        sink.write({"index": 1})
+    with JsonlSink(path) as sink:
+        sink.write({"index": 2})
+
+    assert read_lines(path) == [{"index": 2}]
+
+
+def test_jsonl_sink_after_flush(tmp_path):
+    """Test that deferred callbacks run only once the records before them are flushed."""
+    done = []
+
+    with JsonlSink(tmp_path / "out.jsonl.gz", flush_every=2) as sink:
+        sink.after_flush(lambda: done.append("before any record"))
+        sink.write({"index": 1})
+        sink.after_flush(lambda: done.append(1))
+        assert done == ["before any record"]
+
+        sink.write({"index": 2})
+        assert done == ["before any record", 1]
+
+        sink.write({"index": 3})
+        sink.after_flush(lambda: done.append(3))
+        assert done == ["before any record", 1]
+
+    assert done == ["before any record", 1, 3]
+
+
+def test_get_resume_output_path(tmp_path):
+    """Test that resumed runs get a new output part instead of the existing file."""
+    path = tmp_path / "urls.jsonl.gz"
+    assert get_resume_output_path(path) == path
+
+    path.write_bytes(b"")
+    assert get_resume_output_path(path) == tmp_path / "urls.part2.jsonl.gz"
+
+    (tmp_path / "urls.part2.jsonl.gz").write_bytes(b"")
+    assert get_resume_output_path(path) == tmp_path / "urls.part3.jsonl.gz"
+
+    plain = tmp_path / "out.v1.jsonl"
+    plain.write_bytes(b"")
+    assert get_resume_output_path(plain) == tmp_path / "out.v1.part2.jsonl"
+
+
+def test_jsonl_sink_zstd(tmp_path):
+    """Test zstd output when the zstandard package is installed."""
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "out.jsonl.zst"
+
+    with JsonlSink(path) as sink:
+        sink.write({"index": 1})
+
+    data = zstandard.ZstdDecompressor().stream_reader(open(path, "rb")).read()
+    assert json.loads(data) == {"index": 1}
+
+
+def test_jsonl_sink_invalid_compression(tmp_path):
+    """Test that unknown compression is rejected."""
+    with pytest.raises(ValueError, match="Invalid compression"):
+        JsonlSink(tmp_path / "out.jsonl", compression="lzma")
+
+
+def test_save_to_json_pretty_and_compact(tmp_path):
+    """Test indented and compact result files."""
+    data = {"company_name": "Zürich AG", "owners": []}
+
+    pretty_path = save_to_json(data, folder=tmp_path, filename="pretty", pretty=True)
+    compact_path = save_to_json(data, folder=tmp_path, filename="compact", pretty=False)
+
+    assert pretty_path.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+    assert compact_path.read_text(encoding="utf-8") == '{"company_name":"Zürich AG","owners":[]}'
+
+
+def test_save_to_json_names_file_after_domain_without_company_name(tmp_path):
+    """Test that results without a company name are named after the website domain."""
+    path = save_to_json({"website": "https://www.example.com/about", "owners": []}, folder=tmp_path)
+
+    assert path.name == "www_example_com_info.json"